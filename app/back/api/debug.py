@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Query
+
+from modules.database.connect import engine
+from modules.database.instrumentation import sql_stats
+from modules.database.pool import pool_status
+from modules.envs import settings
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+
+@router.get("/sql-stats")
+async def get_sql_stats(limit: int = Query(50, ge=1, le=1000)):
+    """
+    Возвращает сводную статистику по отпечаткам SQL
+    (только для выборки запросов DB_STATS_SAMPLE_RATE).
+    """
+    return {
+        "sample_rate": settings.database.stats_sample_rate,
+        "n_plus_one_threshold": settings.database.n_plus_one_threshold,
+        "fingerprints": sql_stats.top(limit),
+    }
+
+
+@router.delete("/sql-stats", status_code=204)
+async def reset_sql_stats():
+    """
+    Сбрасывает сводную статистику по отпечаткам SQL.
+    """
+    sql_stats.reset()
+
+
+@router.get("/pool")
+async def get_pool_status():
+    """
+    Возвращает состояние пула соединений с базой данных этого процесса.
+    """
+    return {
+        "driver": engine.dialect.driver,
+        "workers": settings.backend.workers,
+        "recycle": settings.database.pool_recycle,
+        "pre_ping": settings.database.pool_pre_ping,
+        **pool_status(engine),
+    }
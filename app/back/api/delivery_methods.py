@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from back.responses import cached_json_response
 from back.schemas import DeliveryMethodCreate, DeliveryMethodOut
+from modules.cache.reference import delivery_methods_cache, load_delivery_methods
 from modules.database.connect import get_async_session
 from modules.database.methods.delivery_methods import (
     add_delivery_method,
     delete_delivery_method,
-    get_all_delivery_methods,
     get_delivery_method_by_id,
 )
 
@@ -42,11 +43,14 @@ async def get_delivery_method(
 
 
 @router.get("/", response_model=list[DeliveryMethodOut])
-async def list_delivery_methods(session: AsyncSession = Depends(get_async_session)):
+async def list_delivery_methods(request: Request):
     """
     Возвращает список всех способов доставки.
+    Поддерживает условный запрос по ETag (If-None-Match).
     """
-    return await get_all_delivery_methods(session=session)
+    snapshot = await delivery_methods_cache.get(load_delivery_methods)
+    body, etag = snapshot.encode("all", lambda: snapshot.data)
+    return cached_json_response(request, body, etag)
 
 
 @router.delete("/{delivery_method_id}", status_code=204)
@@ -56,8 +60,11 @@ async def delete_delivery_method_route(
     """
     Удаляет способ доставки по ID.
     """
-    deleted = await delete_delivery_method(
-        delivery_method_id=delivery_method_id, session=session
-    )
+    try:
+        deleted = await delete_delivery_method(
+            delivery_method_id=delivery_method_id, session=session
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not deleted:
         raise HTTPException(status_code=404, detail="Способ доставки не найден.")
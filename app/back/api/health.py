@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/live")
+async def liveness():
+    """
+    Процесс бэкенда запущен и отвечает.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def readiness(request: Request):
+    """
+    Бэкенд готов принимать трафик: соединения с базой открыты,
+    справочники загружены в кэш. До этого отвечает 503.
+    """
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
@@ -1,23 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from back.responses import cached_json_response
 from back.schemas import MenuCategoryCreate, MenuCategoryOut
+from modules.cache.reference import load_menu, menu_cache
 from modules.database.connect import get_async_session
 from modules.database.methods.menu_categories import (
     create_category,
     delete_category,
-    get_all_categories,
 )
 
 router = APIRouter(prefix="/menu-categories", tags=["Menu Categories"])
 
 
 @router.get("/", response_model=list[MenuCategoryOut])
-async def list_categories(session: AsyncSession = Depends(get_async_session)):
+async def list_categories(request: Request):
     """
     Возвращает список всех категорий меню.
+    Поддерживает условный запрос по ETag (If-None-Match).
     """
-    return await get_all_categories(session)
+    snapshot = await menu_cache.get(load_menu)
+    body, etag = snapshot.encode("categories", lambda: snapshot.data["categories"])
+    return cached_json_response(request, body, etag)
 
 
 @router.post("/", status_code=201, response_model=MenuCategoryOut)
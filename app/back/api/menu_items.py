@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from back.responses import cached_json_response
 from back.schemas import MenuItemCreate, MenuItemOut
+from modules.cache import encode_json, make_etag
+from modules.cache.reference import load_menu, menu_cache
 from modules.database.connect import get_async_session
 from modules.database.methods.menu_items import (
     create_menu_item,
     delete_menu_item,
-    get_all_menu_items,
     get_menu_item_by_id,
     update_menu_item,
     update_menu_item_availability,
@@ -14,17 +16,40 @@ from modules.database.methods.menu_items import (
 
 router = APIRouter(prefix="/menu-items", tags=["Menu Items"])
 
+MENU_ITEMS_IDS_MAX = 500
+
 
 @router.get("/", response_model=list[MenuItemOut])
 async def list_menu_items(
+    request: Request,
     category_id: int = None,
     is_available: bool = None,
-    session: AsyncSession = Depends(get_async_session),
+    ids: list[int] = Query(None, max_length=MENU_ITEMS_IDS_MAX),
 ):
     """
     Возвращает список всех позиций меню.
+    Параметр `ids` (`?ids=1&ids=2`) позволяет получить несколько позиций
+    одним запросом.
+    Поддерживает условный запрос по ETag (If-None-Match).
     """
-    return await get_all_menu_items(category_id, is_available, session)
+    snapshot = await menu_cache.get(load_menu)
+    ids_set = set(ids or ())
+
+    def build():
+        return [
+            item
+            for item in snapshot.data["items"]
+            if (not category_id or item["category_id"] == category_id)
+            and (is_available is None or item["is_available"] == is_available)
+            and (not ids_set or item["id"] in ids_set)
+        ]
+
+    if ids:
+        body = encode_json(build())
+        etag = make_etag(body)
+    else:
+        body, etag = snapshot.encode(("items", category_id, is_available), build)
+    return cached_json_response(request, body, etag)
 
 
 @router.get("/{item_id}", response_model=MenuItemOut)
@@ -47,9 +72,17 @@ async def create_menu_item_endpoint(
     """
     Создаёт новую позицию в меню.
     """
-    return await create_menu_item(
-        item.name, item.category_id, item.weight, item.price, item.is_available, session
-    )
+    try:
+        return await create_menu_item(
+            item.name,
+            item.category_id,
+            item.weight,
+            item.price,
+            item.is_available,
+            session,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.put("/{item_id}", response_model=MenuItemOut)
@@ -61,15 +94,18 @@ async def update_menu_item_endpoint(
     """
     Обновляет данные позиции меню.
     """
-    updated_item = await update_menu_item(
-        item_id,
-        name=item_data.name,
-        category_id=item_data.category_id,
-        weight=item_data.weight,
-        price=item_data.price,
-        is_available=item_data.is_available,
-        session=session,
-    )
+    try:
+        updated_item = await update_menu_item(
+            item_id,
+            name=item_data.name,
+            category_id=item_data.category_id,
+            weight=item_data.weight,
+            price=item_data.price,
+            is_available=item_data.is_available,
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not updated_item:
         raise HTTPException(status_code=404, detail="Позиция меню не найдена.")
     return updated_item
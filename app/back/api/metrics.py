@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Response
+
+from modules.cache.reference import reference_caches
+from modules.database.connect import engine
+from modules.database.pool import pool_status
+from modules.metrics import CallbackCounter, Gauge, registry
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _pool_usage() -> dict[tuple[str, ...], float]:
+    status = pool_status(engine)
+    return {
+        (state,): status[state]
+        for state in ("size", "checked_out", "checked_in", "overflow")
+        if state in status
+    }
+
+
+def _cache_ratio() -> dict[tuple[str, ...], float]:
+    return {
+        (cache.name,): cache.hits / (cache.hits + cache.misses)
+        for cache in reference_caches
+        if cache.hits + cache.misses
+    }
+
+
+registry.register(
+    Gauge("db_pool_connections", "Соединения пула БД.", ("state",), _pool_usage)
+)
+registry.register(
+    CallbackCounter(
+        "cache_requests",
+        "Обращения к кэшам справочников.",
+        ("cache", "result"),
+        lambda: {
+            (cache.name, result): getattr(cache, f"{result}s")
+            for cache in reference_caches
+            for result in ("hit", "miss")
+        },
+    )
+)
+registry.register(
+    Gauge(
+        "cache_hit_ratio",
+        "Доля попаданий в кэши справочников.",
+        ("cache",),
+        _cache_ratio,
+    )
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Метрики бэкенда в текстовом формате Prometheus.
+    """
+    return Response(
+        content=registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from back.responses import cached_json_response
 from back.schemas import OrderStatusCreate, OrderStatusOut, OrderStatusUpdate
+from modules.cache.reference import load_order_statuses, order_statuses_cache
 from modules.database.connect import get_async_session
 from modules.database.methods.order_statuses import (
-    add_order_status,
-    delete_order_status,
-    get_all_order_statuses,
+    add_order_status as add_order_status_db,
+    delete_order_status as delete_order_status_db,
     get_order_status_by_id,
-    update_order_status_name,
+    update_order_status_name as update_order_status_name_db,
 )
 
 router = APIRouter(prefix="/order-statuses", tags=["Order Statuses"])
@@ -22,7 +23,7 @@ async def add_order_status(
     Добавляет новый статус заказа в базу данных.
     """
     try:
-        return await add_order_status(name=order_status.name, session=session)
+        return await add_order_status_db(name=order_status.name, session=session)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -41,11 +42,14 @@ async def get_order_status(
 
 
 @router.get("/", response_model=list[OrderStatusOut])
-async def list_order_statuses(session: AsyncSession = Depends(get_async_session)):
+async def list_order_statuses(request: Request):
     """
     Возвращает список всех статусов заказов.
+    Поддерживает условный запрос по ETag (If-None-Match).
     """
-    return await get_all_order_statuses(session=session)
+    snapshot = await order_statuses_cache.get(load_order_statuses)
+    body, etag = snapshot.encode("all", lambda: snapshot.data)
+    return cached_json_response(request, body, etag)
 
 
 @router.put("/{status_id}", response_model=OrderStatusOut)
@@ -58,11 +62,14 @@ async def update_order_status_name(
     Обновляет имя статуса заказа.
     """
     try:
-        return await update_order_status_name(
+        status = await update_order_status_name_db(
             status_id=status_id, new_name=order_status.name, session=session
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    if not status:
+        raise HTTPException(status_code=404, detail="Статус заказа не найден.")
+    return status
 
 
 @router.delete("/{status_id}", status_code=204)
@@ -72,7 +79,9 @@ async def delete_order_status(
     """
     Удаляет статус заказа из базы данных.
     """
-    status = await get_order_status_by_id(status_id=status_id, session=session)
-    if not status:
+    try:
+        deleted = await delete_order_status_db(status_id=status_id, session=session)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not deleted:
         raise HTTPException(status_code=404, detail="Статус заказа не найден.")
-    await delete_order_status(status_id=status_id, session=session)
@@ -1,26 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException
+import csv
+from datetime import datetime
+import io
+from typing import AsyncIterator, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from back.responses import json_page_response, trusted_json_response
 from back.schemas import (
     OrderCreate,
     OrderOut,
+    OrderPage,
+    OrdersStatusUpdated,
+    OrdersUpdateStatus,
     OrderUpdateStatus,
     Response,
     UserForOrder,
 )
-from modules.database.connect import get_async_session
+from modules.cache import encode_json
+from modules.database.connect import async_session, get_async_session
 from modules.database.methods.orders import (
+    ORDERS_PAGE_SIZE,
+    ORDERS_PAGE_SIZE_MAX,
     create_order_with_items,
     delete_order,
     get_all_orders,
     get_order_by_id as get_order_db,
-    get_orders_by_user,
+    get_orders_page_json,
     get_user_id_by_order_id,
+    stream_orders,
     update_order_status,
+    update_orders_status,
 )
+from modules.envs import settings
+from modules.metrics import orders_created
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
+# Ответ выгрузки отправляется кусками примерно такого размера.
+EXPORT_CHUNK_SIZE = 64 * 1024
+EXPORT_CSV_HEADER = (
+    "order_id",
+    "user_id",
+    "delivery_method_name",
+    "status_name",
+    "total_price",
+    "created_at",
+    "menu_item_id",
+    "menu_item_name",
+    "price",
+    "quantity",
+)
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
 
 @router.post("/", status_code=201, response_model=OrderOut)
 async def create_new_order(
@@ -30,7 +66,7 @@ async def create_new_order(
     Создаёт новый заказ.
     """
     try:
-        return await create_order_with_items(
+        created = await create_order_with_items(
             user_id=order.user_id,
             delivery_method_id=order.delivery_method_id,
             items=order.items,
@@ -39,6 +75,111 @@ async def create_new_order(
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    orders_created.inc(created["delivery_method_name"])
+    return created
+
+
+async def _export_chunks(
+    export_format: str, created_from: datetime | None, created_to: datetime | None
+) -> AsyncIterator[bytes]:
+    """
+    Сериализует выгрузку заказов кусками по EXPORT_CHUNK_SIZE.
+    Сессия открывается здесь, а не через зависимость: генератор работает
+    уже после выхода из обработчика, пока отправляется ответ.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    chunk = bytearray()
+    if export_format == "csv":
+        writer.writerow(EXPORT_CSV_HEADER)
+
+    async with async_session() as session:
+        async for order in stream_orders(session, created_from, created_to):
+            if export_format == "ndjson":
+                chunk += encode_json(order) + b"\n"
+            else:
+                # Одна строка на позицию; заказ без позиций - одна строка без них.
+                # created_at допускает NULL: такой заказ не должен обрывать выгрузку.
+                created_at = order["created_at"]
+                order_row = (
+                    order["id"],
+                    order["user_id"],
+                    order["delivery_method_name"],
+                    order["status_name"],
+                    order["total_price"],
+                    created_at.isoformat() if created_at is not None else "",
+                )
+                for item in order["items"] or [{}]:
+                    writer.writerow(
+                        order_row
+                        + (
+                            item.get("menu_item_id"),
+                            item.get("name"),
+                            item.get("price"),
+                            item.get("quantity"),
+                        )
+                    )
+                chunk += buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+            if len(chunk) >= EXPORT_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+
+    # Заголовок CSV остаётся в буфере, если заказов за период нет.
+    chunk += buffer.getvalue().encode()
+    if chunk:
+        yield bytes(chunk)
+
+
+@router.get("/export")
+async def export_orders(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    created_from: datetime | None = Query(None, alias="from"),
+    created_to: datetime | None = Query(None, alias="to"),
+):
+    """
+    Потоково выгружает все заказы за период в NDJSON или CSV.
+    Строки читаются из серверного курсора, поэтому потребление памяти
+    не зависит от размера периода.
+    """
+    return StreamingResponse(
+        _export_chunks(export_format, created_from, created_to),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="orders.{export_format}"'
+        },
+    )
+
+
+@router.put("/status", response_model=OrdersStatusUpdated)
+async def update_orders_status_route(
+    status_update: OrdersUpdateStatus,
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Обновляет статус нескольких заказов одним запросом к базе.
+    Возвращает ID пользователей обновлённых заказов для уведомлений
+    и ID заказов, которые не найдены.
+    """
+    order_ids = list(dict.fromkeys(status_update.order_ids))
+    try:
+        status_name, orders = await update_orders_status(
+            order_ids=order_ids, status_id=status_update.status_id, session=session
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not orders:
+        raise HTTPException(status_code=404, detail="Заказы не найдены.")
+    updated = {order["order_id"] for order in orders}
+    return {
+        "status_id": status_update.status_id,
+        "status_name": status_name,
+        "orders": orders,
+        "not_found": [order_id for order_id in order_ids if order_id not in updated],
+    }
 
 
 @router.get("/{order_id}", response_model=OrderOut)
@@ -52,22 +193,67 @@ async def get_order(order_id: int, session: AsyncSession = Depends(get_async_ses
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("/", response_model=list[OrderOut])
-async def list_orders(session: AsyncSession = Depends(get_async_session)):
+async def _orders_page(session: AsyncSession, **filters):
+    """
+    Ответ со страницей заказов: собранной в Postgres (BACKEND_ORDERS_JSON_AGG)
+    или из словарей методов БД.
+    """
+    if settings.backend.orders_json_agg:
+        items, next_cursor = await get_orders_page_json(session=session, **filters)
+        return json_page_response(items, next_cursor)
+    orders, next_cursor = await get_all_orders(session=session, **filters)
+    return trusted_json_response({"items": orders, "next_cursor": next_cursor})
+
+
+@router.get("/", response_model=OrderPage)
+async def list_orders(
+    limit: int = Query(ORDERS_PAGE_SIZE, ge=1, le=ORDERS_PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    status_id: int | None = None,
+    active: bool = False,
+    oldest_first: bool = False,
+    user_id: int | None = None,
+    delivery_method_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    session: AsyncSession = Depends(get_async_session),
+):
     """
-    Возвращает список всех заказов.
+    Возвращает страницу заказов с фильтрами и курсором следующей страницы.
+    `active=true` оставляет только незавершённые заказы (очередь баристы).
+    Страницы идут от новых заказов к старым, `oldest_first=true` - наоборот.
     """
-    return await get_all_orders(session=session)
+    try:
+        return await _orders_page(
+            session,
+            limit=limit,
+            cursor=cursor,
+            status_id=status_id,
+            active=active,
+            oldest_first=oldest_first,
+            user_id=user_id,
+            delivery_method_id=delivery_method_id,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/user/{user_id}", response_model=list[OrderOut])
+@router.get("/user/{user_id}", response_model=OrderPage)
 async def get_user_orders(
-    user_id: int, session: AsyncSession = Depends(get_async_session)
+    user_id: int,
+    limit: int = Query(ORDERS_PAGE_SIZE, ge=1, le=ORDERS_PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_async_session),
 ):
     """
-    Возвращает список заказов пользователя.
+    Возвращает страницу заказов пользователя.
     """
-    return await get_orders_by_user(user_id=user_id, session=session)
+    try:
+        return await _orders_page(session, limit=limit, cursor=cursor, user_id=user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{order_id}/user", response_model=UserForOrder)
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from back.responses import cached_json_response
 from back.schemas import RoleCreate, RoleOut, RoleUpdate, UserIDs
+from modules.cache.reference import load_roles, roles_cache
 from modules.database.connect import get_async_session
 from modules.database.methods.roles import (
     add_role,
     delete_role,
-    get_all_roles,
     get_role_by_id,
     get_users_by_role_id,
     update_role_name,
@@ -50,20 +51,26 @@ async def update_role(
     """
     Обновляет имя роли.
     """
-    updated_role = await update_role_name(
-        role_id=role_id, new_name=role_update.name, session=session
-    )
+    try:
+        updated_role = await update_role_name(
+            role_id=role_id, new_name=role_update.name, session=session
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not updated_role:
         raise HTTPException(status_code=404, detail="Роль не найдена.")
     return updated_role
 
 
 @router.get("/", response_model=list[RoleOut])
-async def list_roles(session: AsyncSession = Depends(get_async_session)):
+async def list_roles(request: Request):
     """
     Возвращает список всех ролей.
+    Поддерживает условный запрос по ETag (If-None-Match).
     """
-    return await get_all_roles(session=session)
+    snapshot = await roles_cache.get(load_roles)
+    body, etag = snapshot.encode("all", lambda: snapshot.data)
+    return cached_json_response(request, body, etag)
 
 
 @router.get("/users/{role_id}", response_model=UserIDs)
@@ -83,6 +90,9 @@ async def delete_role_by_id(
     """
     Удаляет роль по ID.
     """
-    deleted = await delete_role(role_id=role_id, session=session)
+    try:
+        deleted = await delete_role(role_id=role_id, session=session)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not deleted:
         raise HTTPException(status_code=404, detail="Роль не найдена.")
@@ -60,9 +60,12 @@ async def change_role(
     """
     Изменяет роль пользователя.
     """
-    user = await change_user_role(
-        tg_id=tg_id, new_role_id=role_change.new_role_id, session=session
-    )
+    try:
+        user = await change_user_role(
+            tg_id=tg_id, new_role_id=role_change.new_role_id, session=session
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not user:
         raise HTTPException(status_code=404, detail="Пользователь не найден.")
     return user
@@ -0,0 +1,122 @@
+"""
+Бенчмарк драйверов базы данных: asyncpg и psycopg на горячих запросах.
+
+Для каждого драйвера создаётся отдельный движок с параметрами пула
+из настроек (`DB_POOL_*`), и каждый запрос сценария выполняется
+`--requests` раз с `--concurrency` параллельными задачами через те же
+методы `modules.database.methods`, что использует API. Данные берутся
+из текущей базы, поэтому сначала нужны `pdm apply-seeds` и `pdm gen-load`.
+
+Запуск: pdm bench-drivers --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import random
+from time import perf_counter
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from back.benchmarks.utils import summarize
+from modules.database.connect import create_engine_from_settings
+from modules.database.methods.menu_items import get_all_menu_items, get_menu_snapshot
+from modules.database.methods.orders import get_all_orders, get_order_by_id
+from modules.database.models import MenuCategory, Order
+from modules.envs import settings
+from modules.envs.settings import DB_DRIVERS
+
+# Запрос сценария -> функция (сессия, генератор, ID из базы).
+QUERIES = {
+    "menu_snapshot": lambda session, rng, ids: get_menu_snapshot(session),
+    "menu_items": lambda session, rng, ids: get_all_menu_items(
+        rng.choice(ids["categories"]), True, session
+    ),
+    "order_by_id": lambda session, rng, ids: get_order_by_id(
+        rng.choice(ids["orders"]), session
+    ),
+    "user_history": lambda session, rng, ids: get_all_orders(
+        session, user_id=rng.choice(ids["users"])
+    ),
+    "barista_list": lambda session, rng, ids: get_all_orders(session, active=True),
+}
+
+
+async def load_ids(session_maker) -> dict[str, list[int]]:
+    async with session_maker() as session:
+        categories = await session.execute(select(MenuCategory.id))
+        orders = await session.execute(
+            select(Order.id, Order.user_id).order_by(Order.id.desc()).limit(10_000)
+        )
+        orders = orders.all()
+    return {
+        "categories": categories.scalars().all(),
+        "orders": [order_id for order_id, _ in orders],
+        "users": sorted({user_id for _, user_id in orders}),
+    }
+
+
+async def run_query(
+    session_maker, query, ids: dict, requests: int, concurrency: int, seed: int
+) -> dict:
+    rng = random.Random(seed)
+    timings = []
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            started = perf_counter()
+            async with session_maker() as session:
+                await query(session, rng, ids)
+            timings.append(perf_counter() - started)
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started
+    return {"rps": len(timings) / elapsed, **summarize(timings)}
+
+
+async def bench_driver(driver: str, args: argparse.Namespace) -> dict[str, dict]:
+    engine = create_engine_from_settings(settings.database.make_link(driver))
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        ids = await load_ids(session_maker)
+        if not ids["categories"] or not ids["orders"]:
+            raise SystemExit(
+                "В базе нет меню или заказов: pdm apply-seeds && pdm gen-load"
+            )
+        results = {}
+        for name, query in QUERIES.items():
+            # Прогрев: соединения пула и подготовленные запросы драйвера.
+            await run_query(session_maker, query, ids, 20, 1, args.seed)
+            results[name] = await run_query(
+                session_maker, query, ids, args.requests, args.concurrency, args.seed
+            )
+        return results
+    finally:
+        await engine.dispose()
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = {driver: await bench_driver(driver, args) for driver in args.drivers}
+
+    header = "".join(f" | {driver + ' rps':>15} | {'p95, мс':>8}" for driver in results)
+    print(f"{'запрос':>14}{header}")
+    for name in QUERIES:
+        row = "".join(
+            f" | {stats[name]['rps']:>15.1f} | {stats[name]['p95_ms']:>8.2f}"
+            for stats in results.values()
+        )
+        print(f"{name:>14}{row}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--drivers", nargs="+", choices=list(DB_DRIVERS), default=list(DB_DRIVERS)
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,351 @@
+"""
+Нагрузочный бенчмарк API бэкенда внутри процесса.
+
+Приложение `back.main.app` вызывается через `httpx.ASGITransport`, без сети
+и uvicorn, поверх настоящей базы из настроек (`DB_*`). Для каждого маршрута
+сценария выполняется `--requests` запросов с `--concurrency` параллельными
+клиентами; затем выполняется смешанная нагрузка с весами маршрутов.
+Для маршрутов считаются p50/p95/p99, запросы в секунду и SQL-запросы
+на один HTTP-запрос (по событиям движка).
+
+С `--sizes` замеры повторяются на нескольких объёмах истории заказов:
+перед каждым объёмом таблицы заказов очищаются (TRUNCATE) и заполняются
+генератором нагрузочных данных заново. Это разрушает заказы в базе -
+используйте отдельную базу (см. `pdm gen-load --snapshot/--restore`).
+Без `--sizes` замеры идут на текущих данных. Пользователи и позиции меню
+берутся из базы, поэтому сначала нужны `pdm apply-seeds` и `pdm gen-load`.
+
+Результаты сохраняются в JSON, `--compare` сравнивает два сохранённых прогона.
+
+Запуск:
+    pdm bench-harness --sizes 10_000 100_000 1_000_000
+    pdm bench-harness --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+import json
+from pathlib import Path
+import random
+from time import perf_counter
+
+import httpx
+from sqlalchemy import delete, event, func, select
+
+from back.benchmarks.utils import summarize
+from back.main import app
+from modules.database.connect import async_session, engine
+from modules.database.management.db_clear import TRANSACTIONAL_TABLES, truncate_tables
+from modules.database.models import MenuItem, Order, OrderMenuItem, User
+from modules.database.seeders.load import load_orders
+from modules.dataclasses import DeliveryMethod, OrderStatus
+
+# Заказы сценария создания заказа; удаляются по завершении.
+BENCH_USER_ID = -3
+# Маршруты сценария; запросы строит build_request.
+ROUTES = (
+    "menu_categories",
+    "menu_items",
+    "delivery_methods",
+    "create_order",
+    "user_history",
+    "barista_list",
+)
+# Веса маршрутов в смешанной нагрузке.
+MIX_WEIGHTS = {
+    "menu_categories": 20,
+    "menu_items": 30,
+    "delivery_methods": 10,
+    "create_order": 10,
+    "user_history": 20,
+    "barista_list": 10,
+}
+
+
+class Dataset:
+    """ID из базы, из которых строятся запросы сценария."""
+
+    def __init__(self, user_ids: list[int], items: list[tuple[int, int, bool]]):
+        self.user_ids = user_ids
+        self.category_ids = sorted({category_id for _, category_id, _ in items})
+        self.available_item_ids = [item_id for item_id, _, ok in items if ok]
+
+
+def build_request(route: str, rng: random.Random, dataset: Dataset) -> tuple:
+    """
+    Строит запрос маршрута сценария.
+
+    :param route: Имя маршрута из ROUTES.
+    :param rng: Генератор случайных чисел.
+    :param dataset: ID из базы.
+    :return: Метод, путь и параметры запроса httpx.
+    """
+    match route:
+        case "menu_categories":
+            return "GET", "/menu-categories/", {}
+        case "menu_items":
+            params = {
+                "category_id": rng.choice(dataset.category_ids),
+                "is_available": "true",
+            }
+            return "GET", "/menu-items/", {"params": params}
+        case "delivery_methods":
+            return "GET", "/delivery-methods/", {}
+        case "create_order":
+            count = min(len(dataset.available_item_ids), rng.randint(1, 3))
+            items = [
+                {"menu_item_id": item_id, "quantity": rng.randint(1, 2)}
+                for item_id in rng.sample(dataset.available_item_ids, count)
+            ]
+            body = {
+                "user_id": BENCH_USER_ID,
+                "delivery_method_id": DeliveryMethod.PICKUP_ID,
+                "status_id": OrderStatus.PENDING_ID,
+                "items": items,
+            }
+            return "POST", "/orders/", {"json": body}
+        case "user_history":
+            return "GET", f"/orders/user/{rng.choice(dataset.user_ids)}", {}
+        case "barista_list":
+            return "GET", "/orders/", {"params": {"active": "true"}}
+    raise ValueError(f"Неизвестный маршрут: {route}")
+
+
+class StatementCounter:
+    """Считает SQL-запросы движка за время замера."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", self)
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    routes: list[str],
+    requests: int,
+    concurrency: int,
+    rng: random.Random,
+    dataset: Dataset,
+) -> dict:
+    """
+    Выполняет запросы маршрутов `routes` (выбор по весам MIX_WEIGHTS)
+    параллельными клиентами и собирает статистику.
+
+    :return: Статистика по маршрутам и по всей нагрузке.
+    """
+    weights = [MIX_WEIGHTS[route] for route in routes]
+    plan = [
+        (route, build_request(route, rng, dataset))
+        for route in rng.choices(routes, weights=weights, k=requests)
+    ]
+    timings = {route: [] for route in routes}
+    errors = {route: 0 for route in routes}
+    queue = iter(plan)
+
+    async def worker():
+        for route, (method, url, kwargs) in queue:
+            started = perf_counter()
+            response = await client.request(method, url, **kwargs)
+            timings[route].append(perf_counter() - started)
+            errors[route] += response.status_code >= 400
+
+    with StatementCounter() as statements:
+        started = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = perf_counter() - started
+
+    stats = {
+        route: {
+            "requests": len(timings[route]),
+            "errors": errors[route],
+            "rps": len(timings[route]) / elapsed,
+            **summarize(timings[route]),
+        }
+        for route in routes
+        if timings[route]
+    }
+    total = [timing for route_timings in timings.values() for timing in route_timings]
+    return {
+        "routes": stats,
+        "total": {
+            "requests": len(total),
+            "errors": sum(errors.values()),
+            "rps": len(total) / elapsed,
+            "statements_per_request": statements.count / len(total),
+            **summarize(total),
+        },
+    }
+
+
+async def load_dataset() -> Dataset:
+    async with async_session() as session:
+        users = await session.execute(select(User.id).order_by(User.id).limit(10_000))
+        items = await session.execute(
+            select(MenuItem.id, MenuItem.category_id, MenuItem.is_available)
+        )
+        return Dataset(users.scalars().all(), [tuple(item) for item in items])
+
+
+async def dataset_size() -> dict[str, int]:
+    sizes = {}
+    async with async_session() as session:
+        for name, model in (
+            ("users", User),
+            ("menu_items", MenuItem),
+            ("orders", Order),
+            ("order_lines", OrderMenuItem),
+        ):
+            result = await session.execute(select(func.count()).select_from(model))
+            sizes[name] = result.scalar()
+    return sizes
+
+
+async def resize_orders(size: int, dataset: Dataset, seed: int) -> None:
+    """
+    Пересоздаёт историю заказов заданного объёма.
+    """
+    await truncate_tables(TRANSACTIONAL_TABLES)
+    async with async_session() as session:
+        result = await session.execute(select(MenuItem.id, MenuItem.price))
+        prices = dict(result.all())
+    async with engine.connect() as connection:
+        rng = random.Random(seed)
+        await load_orders(connection, rng, size, dataset.user_ids, prices)
+        await connection.commit()
+        await connection.exec_driver_sql(
+            f"ANALYZE {Order.__tablename__}, {OrderMenuItem.__tablename__}"
+        )
+        await connection.commit()
+
+
+async def bench(args: argparse.Namespace) -> dict:
+    dataset = await load_dataset()
+    if not dataset.user_ids or not dataset.available_item_ids:
+        raise SystemExit(
+            "В базе нет пользователей или позиций меню: "
+            "pdm apply-seeds && pdm gen-load"
+        )
+
+    runs = []
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+        ):
+            for size in args.sizes or [None]:
+                if size is not None:
+                    print(f"Подготовка истории заказов: {size}")
+                    await resize_orders(size, dataset, args.seed)
+                rng = random.Random(args.seed)
+
+                run = {"dataset": await dataset_size(), "routes": {}}
+                for route in ROUTES:
+                    # Прогрев: кэши, пул соединений, подготовленные запросы.
+                    await run_load(client, [route], 10, 1, rng, dataset)
+                    result = await run_load(
+                        client, [route], args.requests, args.concurrency, rng, dataset
+                    )
+                    run["routes"][route] = result["total"]
+                run["mix"] = await run_load(
+                    client,
+                    list(ROUTES),
+                    args.requests * 2,
+                    args.concurrency,
+                    rng,
+                    dataset,
+                )
+                runs.append(run)
+                print_run(run)
+    finally:
+        async with async_session() as session:
+            await session.execute(delete(Order).where(Order.user_id == BENCH_USER_ID))
+            await session.commit()
+        await engine.dispose()
+
+    return {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "seed": args.seed,
+        "runs": runs,
+    }
+
+
+def print_run(run: dict) -> None:
+    print(f"Данные: {run['dataset']}")
+    print(
+        f"{'маршрут':>18} | {'rps':>8} | {'p50, мс':>8} | {'p95, мс':>8} "
+        f"| {'p99, мс':>8} | {'SQL/запр.':>9} | {'ошибок':>6}"
+    )
+    for route, stats in [*run["routes"].items(), ("смешанная", run["mix"]["total"])]:
+        print(
+            f"{route:>18} | {stats['rps']:>8.1f} | {stats['p50_ms']:>8.2f} "
+            f"| {stats['p95_ms']:>8.2f} | {stats['p99_ms']:>8.2f} "
+            f"| {stats['statements_per_request']:>9.2f} | {stats['errors']:>6}"
+        )
+
+
+def compare(before_path: Path, after_path: Path) -> None:
+    before = json.loads(before_path.read_text())
+    after = json.loads(after_path.read_text())
+    for run_before, run_after in zip(before["runs"], after["runs"]):
+        print(
+            f"Заказов: {run_before['dataset']['orders']} -> "
+            f"{run_after['dataset']['orders']}"
+        )
+        print(f"{'маршрут':>18} | {'rps':>17} | {'p95, мс':>17}")
+        for route, stats in run_after["routes"].items():
+            old = run_before["routes"].get(route)
+            if old is None:
+                continue
+            print(
+                f"{route:>18} | {old['rps']:>7.1f} -> {stats['rps']:>6.1f} "
+                f"| {old['p95_ms']:>7.2f} -> {stats['p95_ms']:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="Объёмы истории заказов; без параметра - текущие данные.",
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Файл результатов, по умолчанию bench-results/harness-<время>.json.",
+    )
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+    # Без запросов статистику маршрута не из чего считать.
+    if args.requests < 1 or args.concurrency < 1:
+        parser.error("--requests и --concurrency должны быть не меньше 1")
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        results = asyncio.run(bench(args))
+        output = args.output or Path(
+            "bench-results", f"harness-{datetime.now():%Y%m%d-%H%M%S}.json"
+        )
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+        print(f"Результаты сохранены в {output}")
@@ -0,0 +1,86 @@
+"""
+Бенчмарк времени импорта бэкенда (`python -X importtime`).
+
+Импорт `--module` (по умолчанию `back.main`) выполняется `--repeat` раз
+в отдельных процессах; берётся лучший прогон, чтобы не учитывать
+холодный кэш файловой системы. Выводятся общее время импорта
+и пакеты верхнего уровня с наибольшим накопленным временем.
+
+Скрипт завершается с кодом 1, если время превышает `--budget-ms`
+или импортирован запрещённый для бэкенда пакет (FORBIDDEN_MODULES):
+так его можно использовать как проверку бюджета запуска.
+
+Запуск: pdm bench-import-time --budget-ms 1500
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+# Пакеты, которые не должен импортировать бэкенд.
+FORBIDDEN_MODULES = ("aiogram",)
+# Строка -X importtime: "import time: <self, мкс> | <накопленное, мкс> | <модуль>".
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def measure_imports(module: str) -> tuple[dict[str, int], set[str]]:
+    """
+    Импортирует модуль в отдельном процессе с -X importtime.
+
+    :param module: Имя модуля.
+    :return: Накопленное время импорта пакетов верхнего уровня (мкс)
+        и имена всех импортированных модулей.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Не удалось импортировать {module}:\n{result.stderr}")
+
+    top_level = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        imported.add(match.group(4))
+        # Без отступа - модули, импортированные не из других модулей.
+        if not match.group(3):
+            top_level[match.group(4)] = int(match.group(2))
+    return top_level, imported
+
+
+def main(args: argparse.Namespace) -> int:
+    runs = [measure_imports(args.module) for _ in range(args.repeat)]
+    best, imported = min(runs, key=lambda run: sum(run[0].values()))
+    total_ms = sum(best.values()) / 1000
+
+    print(f"Импорт {args.module}: {total_ms:.0f} мс (лучший из {args.repeat})")
+    print(f"{'пакет':>32} | {'мс':>8}")
+    ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative in ranked[: args.top]:
+        print(f"{name:>32} | {cumulative / 1000:>8.1f}")
+
+    failed = False
+    packages = {name.split(".")[0] for name in imported}
+    for name in FORBIDDEN_MODULES:
+        if name in packages:
+            print(f"Импортирован запрещённый пакет: {name}")
+            failed = True
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"Превышен бюджет импорта: {total_ms:.0f} > {args.budget_ms:.0f} мс")
+        failed = True
+    return int(failed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="back.main")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+
+    sys.exit(main(parser.parse_args()))
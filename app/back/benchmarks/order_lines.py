@@ -0,0 +1,131 @@
+"""
+Бенчмарк чтения страницы заказов при росте истории продаж.
+
+Скрипт наращивает в базе историю заказов по одним и тем же позициям меню
+и после каждого шага замеряет чтение одной страницы заказов двумя способами:
+текущим (`get_all_orders`) и прежним, через
+`selectinload(Order.menu_items).selectinload(MenuItem.order_menu_items)`.
+Время текущего способа не должно зависеть от объёма истории.
+Добавленные заказы удаляются по завершении.
+
+Запуск: pdm bench-order-lines
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import selectinload
+
+from back.benchmarks.utils import measure, summarize
+from modules.database.connect import async_session
+from modules.database.methods.orders import get_all_orders
+from modules.database.models import MenuItem, Order, OrderMenuItem
+from modules.dataclasses import DeliveryMethod, OrderStatus
+
+PAGE_USER_ID = -1
+HISTORY_USER_ID = -2
+BATCH_SIZE = 5_000
+
+
+async def current_page(limit: int):
+    async with async_session() as session:
+        return await get_all_orders(session=session, limit=limit, user_id=PAGE_USER_ID)
+
+
+async def legacy_page(limit: int):
+    async with async_session() as session:
+        result = await session.execute(
+            select(Order)
+            .options(
+                selectinload(Order.delivery_method),
+                selectinload(Order.status),
+                selectinload(Order.menu_items).selectinload(MenuItem.order_menu_items),
+            )
+            .where(Order.user_id == PAGE_USER_ID)
+            .order_by(Order.created_at, Order.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+
+async def add_orders(session, user_id: int, count: int, menu_item_ids: list[int]):
+    for offset in range(0, count, BATCH_SIZE):
+        size = min(BATCH_SIZE, count - offset)
+        result = await session.execute(
+            insert(Order).returning(Order.id),
+            [
+                {
+                    "user_id": user_id,
+                    "delivery_method_id": DeliveryMethod.PICKUP_ID,
+                    "status_id": OrderStatus.COMPLETED_ID,
+                    "total_price": 0,
+                }
+                for _ in range(size)
+            ],
+        )
+        order_ids = result.scalars().all()
+        await session.execute(
+            insert(OrderMenuItem),
+            [
+                {"order_id": order_id, "menu_item_id": menu_item_id, "quantity": 1}
+                for order_id in order_ids
+                for menu_item_id in menu_item_ids
+            ],
+        )
+    await session.commit()
+
+
+async def main(history_sizes: list[int], page_size: int, repeat: int):
+    async with async_session() as session:
+        result = await session.execute(select(MenuItem.id).limit(3))
+        menu_item_ids = result.scalars().all()
+        if not menu_item_ids:
+            print("В базе нет позиций меню, примените сиды: pdm apply-seeds")
+            return
+
+        try:
+            await add_orders(session, PAGE_USER_ID, page_size, menu_item_ids)
+
+            history = 0
+            print(
+                f"{'история':>10} | {'текущий p50, мс':>16} | {'прежний p50, мс':>16}"
+            )
+            for target in history_sizes:
+                await add_orders(
+                    session, HISTORY_USER_ID, target - history, menu_item_ids
+                )
+                history = target
+
+                current = summarize(
+                    await measure(lambda: current_page(page_size), repeat)
+                )
+                legacy = summarize(
+                    await measure(lambda: legacy_page(page_size), repeat)
+                )
+                print(
+                    f"{history:>10} | {current['p50_ms']:>16.2f} "
+                    f"| {legacy['p50_ms']:>16.2f}"
+                )
+        finally:
+            await session.rollback()
+            await session.execute(
+                delete(Order).where(Order.user_id.in_([PAGE_USER_ID, HISTORY_USER_ID]))
+            )
+            await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--history",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Объёмы истории заказов, на которых выполняются замеры.",
+    )
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.history, args.page_size, args.repeat))
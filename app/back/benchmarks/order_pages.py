@@ -0,0 +1,83 @@
+"""
+Бенчмарк чтения страниц заказов: ORM и JSON, собранный в Postgres.
+
+Для каждого размера страницы замеряются два способа получить тело ответа:
+- `orm` - `get_all_orders` (строки Core-запросов, словари)
+  и `encode_json`, как при BACKEND_ORDERS_JSON_AGG=False;
+- `json_agg` - `get_orders_page_json`: документы заказов собирает Postgres,
+  приложение только склеивает строки.
+
+Размер страницы не ограничен ORDERS_PAGE_SIZE_MAX: методы вызываются
+напрямую. Нужна история заказов (`pdm gen-load`) не меньше страницы.
+
+Запуск: pdm bench-order-pages --page-sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+import json
+
+from back.benchmarks.utils import measure, summarize
+from modules.cache import encode_json
+from modules.database.connect import async_session, engine
+from modules.database.methods.orders import get_all_orders, get_orders_page_json
+
+
+async def orm_page(limit: int) -> bytes:
+    async with async_session() as session:
+        orders, _ = await get_all_orders(session=session, limit=limit)
+    return encode_json(orders)
+
+
+async def json_agg_page(limit: int) -> bytes:
+    async with async_session() as session:
+        items, _ = await get_orders_page_json(session=session, limit=limit)
+    return items
+
+
+def normalized(body: bytes) -> list[dict]:
+    # Postgres не дописывает нули в дробной части секунд.
+    # Позиции сравниваются без учёта порядка.
+    orders = json.loads(body)
+    for order in orders:
+        order["created_at"] = datetime.fromisoformat(order["created_at"])
+        order["items"].sort(key=lambda item: item["menu_item_id"])
+    return orders
+
+
+async def main(page_sizes: list[int], repeat: int) -> None:
+    print(
+        f"{'страница':>8} | {'orm p50, мс':>11} | {'orm p95':>8} "
+        f"| {'json_agg p50':>12} | {'json_agg p95':>12} | {'ускорение':>9}"
+    )
+    try:
+        for page_size in page_sizes:
+            orm_body = await orm_page(page_size)
+            json_body = await json_agg_page(page_size)
+            # Порядок и содержимое документов должны совпадать.
+            if normalized(orm_body) != normalized(json_body):
+                print(f"Страница {page_size}: документы ORM и json_agg различаются")
+
+            orm = summarize(await measure(lambda: orm_page(page_size), repeat))
+            json_agg = summarize(
+                await measure(lambda: json_agg_page(page_size), repeat)
+            )
+            print(
+                f"{page_size:>8} | {orm['p50_ms']:>11.2f} | {orm['p95_ms']:>8.2f} "
+                f"| {json_agg['p50_ms']:>12.2f} | {json_agg['p95_ms']:>12.2f} "
+                f"| {orm['p50_ms'] / json_agg['p50_ms']:>8.1f}x"
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=[100, 1_000, 10_000]
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.page_sizes, args.repeat))
@@ -0,0 +1,147 @@
+"""
+Бенчмарк моделей чтения: ORM-объекты и slotted-строки Core-запросов.
+
+Для списков пользователей и позиций меню и для страницы заказов
+сравниваются прежнее чтение ORM-объектами (`select(Model)`) и текущее
+(`get_all_users`, `get_all_menu_items`, `get_all_orders`). Для заказов
+оба способа возвращают одинаковые словари заказов с позициями.
+Для каждого способа выводятся время, строки в секунду и память
+(tracemalloc): пиковая при чтении и удерживаемая результатом,
+в пересчёте на строку. Нужны данные `pdm gen-load`.
+
+Запуск: pdm bench-read-models --orders 10000
+"""
+
+import argparse
+import asyncio
+import gc
+from time import perf_counter
+import tracemalloc
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from modules.database.connect import async_session, engine
+from modules.database.methods.menu_items import get_all_menu_items
+from modules.database.methods.orders import _load_order_lines, get_all_orders
+from modules.database.methods.users import get_all_users
+from modules.database.models import MenuItem, Order, User
+
+
+async def orm_users(session, args):
+    result = await session.execute(select(User).order_by(User.id))
+    return result.scalars().all()
+
+
+async def dto_users(session, args):
+    return await get_all_users(session)
+
+
+async def orm_menu_items(session, args):
+    result = await session.execute(select(MenuItem))
+    return result.scalars().all()
+
+
+async def dto_menu_items(session, args):
+    return await get_all_menu_items(None, None, session)
+
+
+async def orm_orders(session, args):
+    result = await session.execute(
+        select(Order)
+        .options(
+            joinedload(Order.delivery_method, innerjoin=True),
+            joinedload(Order.status, innerjoin=True),
+        )
+        # Как в get_all_orders: от новых заказов к старым.
+        .order_by(Order.created_at.desc(), Order.id.desc())
+        .limit(args.orders)
+    )
+    orders = result.scalars().all()
+    # Тот же результат, что у get_all_orders: словари заказов с позициями.
+    lines = await _load_order_lines([order.id for order in orders], session)
+    return [
+        {
+            "id": order.id,
+            "user_id": order.user_id,
+            "delivery_method_id": order.delivery_method_id,
+            "delivery_method_name": order.delivery_method.name,
+            "status_id": order.status_id,
+            "status_name": order.status.name,
+            "total_price": order.total_price,
+            "created_at": order.created_at,
+            "items": lines[order.id],
+        }
+        for order in orders
+    ]
+
+
+async def dto_orders(session, args):
+    orders, _ = await get_all_orders(session=session, limit=args.orders)
+    return orders
+
+
+CASES = (
+    ("users", orm_users, dto_users),
+    ("menu_items", orm_menu_items, dto_menu_items),
+    ("orders", orm_orders, dto_orders),
+)
+
+
+async def run_case(read, args) -> dict:
+    """
+    Замеряет чтение в новой сессии: время по лучшему из `--repeat` прогонов,
+    память - по отдельному прогону под tracemalloc.
+    """
+    timings = []
+    for _ in range(args.repeat):
+        async with async_session() as session:
+            started = perf_counter()
+            rows = await read(session, args)
+            timings.append(perf_counter() - started)
+
+    del rows
+    gc.collect()
+    tracemalloc.start()
+    async with async_session() as session:
+        rows = await read(session, args)
+    # Память, которую удерживает результат после закрытия сессии.
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = max(len(rows), 1)
+    return {
+        "rows": len(rows),
+        "ms": min(timings) * 1000,
+        "rows_per_s": len(rows) / min(timings),
+        "peak_per_row": peak / count,
+        "retained_per_row": retained / count,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"{'список':>10} | {'способ':>4} | {'строк':>7} | {'мс':>8} | {'строк/с':>9} "
+        f"| {'пик, Б/стр.':>11} | {'результат, Б/стр.':>17}"
+    )
+    try:
+        for name, orm_read, dto_read in CASES:
+            for method, read in (("orm", orm_read), ("dto", dto_read)):
+                stats = await run_case(read, args)
+                print(
+                    f"{name:>10} | {method:>4} | {stats['rows']:>7} "
+                    f"| {stats['ms']:>8.1f} | {stats['rows_per_s']:>9.0f} "
+                    f"| {stats['peak_per_row']:>11.0f} "
+                    f"| {stats['retained_per_row']:>17.0f}"
+                )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+
+    asyncio.run(main(parser.parse_args()))
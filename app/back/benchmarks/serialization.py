@@ -0,0 +1,115 @@
+"""
+Бенчмарк сериализации страницы заказов `GET /orders/`.
+
+Сравниваются два способа отдать одну и ту же страницу:
+- `validated` - прежний: проверка по `OrderPage` (response_model),
+  `jsonable_encoder` и `json.dumps`, как делает FastAPI;
+- `fast` - `trusted_json_response`: сразу `encode_json` (orjson, если установлен).
+
+Сначала замеряется только сериализация уже загруженной страницы,
+затем весь запрос через приложение (`httpx.ASGITransport`)
+с переключением BACKEND_FAST_JSON. Также выводится размер ответа
+без сжатия и со сжатием gzip.
+
+Запуск: pdm bench-serialization --page-sizes 20 50 100
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+from time import perf_counter
+
+from fastapi.encoders import jsonable_encoder
+import httpx
+
+from back.benchmarks.utils import summarize
+from back.main import app
+from back.schemas import OrderPage
+from modules.cache import HAS_ORJSON, encode_json
+from modules.database.connect import async_session, engine
+from modules.database.methods.orders import get_all_orders
+from modules.envs import settings
+
+
+def validated_body(page: dict) -> bytes:
+    content = jsonable_encoder(OrderPage.model_validate(page))
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def time_calls(fn, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+    return timings
+
+
+async def time_requests(
+    client: httpx.AsyncClient, page_size: int, repeat: int
+) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        response = await client.get("/orders/", params={"limit": page_size})
+        response.raise_for_status()
+        timings.append(perf_counter() - started)
+    return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"orjson: {'установлен' if HAS_ORJSON else 'не установлен'}")
+    print(
+        f"{'страница':>8} | {'способ':>9} | {'сериал., мс':>11} | {'запрос p50':>10} "
+        f"| {'запрос p95':>10} | {'байт':>8} | {'gzip':>7}"
+    )
+    transport = httpx.ASGITransport(app=app)
+    fast_json = settings.backend.fast_json
+    try:
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+        ):
+            for page_size in args.page_sizes:
+                async with async_session() as session:
+                    orders, next_cursor = await get_all_orders(
+                        session=session, limit=page_size
+                    )
+                page = {"items": orders, "next_cursor": next_cursor}
+                if len(orders) < page_size:
+                    print(f"В базе меньше {page_size} заказов: pdm gen-load")
+
+                for name, encode in (
+                    ("validated", validated_body),
+                    ("fast", encode_json),
+                ):
+                    body = encode(page)
+                    serialization = summarize(
+                        time_calls(lambda: encode(page), args.repeat)
+                    )
+                    settings.backend.fast_json = name == "fast"
+                    await time_requests(client, page_size, 5)
+                    requests = summarize(
+                        await time_requests(client, page_size, args.repeat)
+                    )
+                    print(
+                        f"{page_size:>8} | {name:>9} "
+                        f"| {serialization['p50_ms']:>11.3f} "
+                        f"| {requests['p50_ms']:>10.2f} "
+                        f"| {requests['p95_ms']:>10.2f} "
+                        f"| {len(body):>8} | {len(gzip.compress(body)):>7}"
+                    )
+    finally:
+        settings.backend.fast_json = fast_json
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 50, 100])
+    parser.add_argument("--repeat", type=int, default=200)
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,55 @@
+from statistics import mean
+from time import perf_counter
+from typing import Awaitable, Callable
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Возвращает q-й перцентиль (0..100) методом ближайшего ранга.
+
+    :param values: Замеры.
+    :param q: Перцентиль.
+    :return: Значение перцентиля.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    """
+    Сводка по замерам в миллисекундах.
+
+    :param timings: Замеры в секундах.
+    :return: Среднее и перцентили p50/p95/p99 в миллисекундах.
+    """
+    return {
+        "mean_ms": mean(timings) * 1000 if timings else 0.0,
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p95_ms": percentile(timings, 95) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+    }
+
+
+async def measure(
+    fn: Callable[[], Awaitable], repeat: int, warmup: int = 3
+) -> list[float]:
+    """
+    Замеряет время выполнения асинхронной функции.
+
+    :param fn: Функция без аргументов.
+    :param repeat: Количество замеров.
+    :param warmup: Количество прогревочных вызовов без замера.
+    :return: Замеры в секундах.
+    """
+    for _ in range(warmup):
+        await fn()
+
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        await fn()
+        timings.append(perf_counter() - started)
+    return timings
@@ -0,0 +1,160 @@
+"""
+Бенчмарк масштабирования бэкенда по числу воркеров.
+
+Для каждого значения `--workers` запускается `python -m back.serve`
+с WEB_CONCURRENCY=N на отдельном порту, и после готовности на него подаётся
+смешанная нагрузка из читающих маршрутов сценария `back.benchmarks.harness`.
+Нагрузку создают `--clients` процессов, чтобы клиент не стал узким местом
+раньше сервера. Для каждого числа воркеров выводятся запросы в секунду,
+p50/p95 и эффективность масштабирования относительно первого замера.
+
+Запуск: pdm bench-workers --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import subprocess
+import sys
+from time import monotonic, perf_counter
+
+import httpx
+
+from back.benchmarks.harness import MIX_WEIGHTS, Dataset, build_request, load_dataset
+from back.benchmarks.utils import summarize
+from modules.database.connect import engine
+
+# Запись заказов исключена: иначе замер зависел бы от роста таблиц.
+READ_ROUTES = [route for route in MIX_WEIGHTS if route != "create_order"]
+
+
+async def wait_ready(base_url: str, timeout: float) -> None:
+    deadline = monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while monotonic() < deadline:
+            try:
+                response = await client.get("/health/ready")
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit(f"Бэкенд {base_url} не запустился за {timeout} с")
+
+
+async def client_load(
+    base_url: str, dataset: Dataset, requests: int, concurrency: int, seed: int
+) -> tuple[list[float], int]:
+    rng = random.Random(seed)
+    weights = [MIX_WEIGHTS[route] for route in READ_ROUTES]
+    plan = iter(
+        build_request(route, rng, dataset)
+        for route in rng.choices(READ_ROUTES, weights=weights, k=requests)
+    )
+    timings = []
+    errors = 0
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        for method, url, kwargs in plan:
+            started = perf_counter()
+            response = await client.request(method, url, **kwargs)
+            timings.append(perf_counter() - started)
+            errors += response.status_code >= 400
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return timings, errors
+
+
+def run_client(*args) -> tuple[list[float], int]:
+    return asyncio.run(client_load(*args))
+
+
+def run_clients(
+    executor: ProcessPoolExecutor,
+    base_url: str,
+    dataset: Dataset,
+    requests: int,
+    concurrency: int,
+    clients: int,
+) -> list[tuple[list[float], int]]:
+    """
+    Запускает нагрузку из `clients` процессов и ждёт их завершения.
+
+    :return: Замеры и число ошибок каждого процесса.
+    """
+    futures = [
+        executor.submit(run_client, base_url, dataset, requests, concurrency, seed)
+        for seed in range(clients)
+    ]
+    return [future.result() for future in futures]
+
+
+def bench_workers(workers: int, dataset: Dataset, args: argparse.Namespace) -> dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "back.serve", "--port", str(args.port)], env=env
+    )
+    try:
+        asyncio.run(wait_ready(base_url, args.startup_timeout))
+        per_client = args.requests // args.clients
+        with ProcessPoolExecutor(args.clients) as executor:
+            # Прогрев соединений и кэшей всех воркеров.
+            run_clients(executor, base_url, dataset, 50, 4, args.clients)
+            started = perf_counter()
+            results = run_clients(
+                executor, base_url, dataset, per_client, args.concurrency, args.clients
+            )
+            elapsed = perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    timings = [timing for client_timings, _ in results for timing in client_timings]
+    return {
+        "workers": workers,
+        "rps": len(timings) / elapsed,
+        "errors": sum(errors for _, errors in results),
+        **summarize(timings),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    dataset = asyncio.run(load_dataset())
+    asyncio.run(engine.dispose())
+    if not dataset.user_ids or not dataset.available_item_ids:
+        raise SystemExit(
+            "В базе нет пользователей или позиций меню: pdm apply-seeds && pdm gen-load"
+        )
+
+    print(
+        f"{'воркеров':>8} | {'rps':>8} | {'p50, мс':>8} | {'p95, мс':>8} "
+        f"| {'эффект.':>7} | {'ошибок':>6}"
+    )
+    baseline = None
+    for workers in args.workers:
+        stats = bench_workers(workers, dataset, args)
+        if baseline is None:
+            baseline = stats["rps"] / workers
+        efficiency = stats["rps"] / (baseline * workers)
+        print(
+            f"{workers:>8} | {stats['rps']:>8.1f} | {stats['p50_ms']:>8.2f} "
+            f"| {stats['p95_ms']:>8.2f} | {efficiency:>7.0%} | {stats['errors']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+
+    main(parser.parse_args())
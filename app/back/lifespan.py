@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+import logging
+from time import perf_counter
+
+from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+
+from modules.cache.reference import warm_reference_caches
+from modules.database.connect import engine
+from modules.database.pool import check_pool_capacity, warm_pool
+from modules.envs import settings
+
+logger = logging.getLogger(__name__)
+
+# Пауза между попытками прогрева, если база недоступна при запуске, секунды.
+WARMUP_RETRY_DELAY = 5.0
+# Ошибки недоступной базы: asyncpg отдаёт ConnectionRefusedError
+# и socket.gaierror (OSError) без обёртки SQLAlchemy.
+WARMUP_ERRORS = (SQLAlchemyError, OSError)
+
+
+async def warm_up() -> None:
+    """
+    Открывает соединения пула и загружает справочники
+    (роли, статусы, способы доставки, меню) в кэш.
+    """
+    started = perf_counter()
+    await check_pool_capacity(engine, settings.backend.workers)
+    connections = await warm_pool(engine, settings.database.pool_warmup)
+    await warm_reference_caches()
+    logger.info(
+        "Бэкенд прогрет за %.0f мс, открыто соединений: %s",
+        (perf_counter() - started) * 1000,
+        connections,
+    )
+
+
+async def retry_warm_up(app: FastAPI) -> None:
+    while True:
+        await asyncio.sleep(WARMUP_RETRY_DELAY)
+        try:
+            await warm_up()
+        except WARMUP_ERRORS as e:
+            logger.warning("Прогрев бэкенда не выполнен: %s", e)
+        else:
+            app.state.ready = True
+            return
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Запуск и остановка бэкенда.
+    uvicorn начинает принимать запросы воркера только после запуска,
+    поэтому первые запросы не ждут соединения с базой и загрузки справочников.
+    /health/ready отвечает 200 только после прогрева.
+    """
+    app.state.ready = False
+    retry = None
+    try:
+        await warm_up()
+    except WARMUP_ERRORS as e:
+        # Недоступная при запуске база не должна мешать старту: прогрев
+        # повторяется в фоне, а до его завершения воркер не готов.
+        logger.warning("Прогрев бэкенда не выполнен: %s", e)
+        retry = asyncio.create_task(retry_warm_up(app))
+    else:
+        app.state.ready = True
+
+    yield
+
+    app.state.ready = False
+    if retry is not None:
+        retry.cancel()
+        with suppress(asyncio.CancelledError):
+            await retry
+    await engine.dispose()
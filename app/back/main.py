@@ -1,7 +1,47 @@
-from fastapi import FastAPI
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from routers import global_router
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from back.lifespan import lifespan
+from back.middlewares import MetricsMiddleware, SQLTimingMiddleware
+from modules.database.connect import engine
+from modules.database.instrumentation import instrument_engine
+from modules.database.pool import pool_status
+from modules.envs import settings
+
+logger = logging.getLogger(__name__)
+
+instrument_engine(engine)
+
+app = FastAPI(lifespan=lifespan)
+if settings.backend.gzip_min_size:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.backend.gzip_min_size)
+app.add_middleware(SQLTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """
+    Пул соединений исчерпан дольше DB_POOL_TIMEOUT: вместо 500 отвечаем 503,
+    а в лог пишем состояние пула.
+    """
+    logger.error(
+        "Нет свободного соединения с базой для %s %s: %s",
+        request.method,
+        request.url.path,
+        pool_status(engine),
+    )
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "База данных перегружена, повторите запрос позже."},
+        headers={"Retry-After": "1"},
+    )
 
-app = FastAPI()
 
 app.include_router(global_router)
 if __name__ == "__main__":
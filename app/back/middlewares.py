@@ -0,0 +1,99 @@
+import logging
+import random
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from modules.database.instrumentation import RequestStats, current_request, sql_stats
+from modules.envs import settings
+from modules.metrics import (
+    http_request_duration,
+    http_requests,
+    http_requests_in_flight,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SQLTimingMiddleware:
+    """
+    Считает SQL-запросы каждого HTTP-запроса, добавляет заголовок
+    `Server-Timing` и предупреждает о повторяющихся запросах (N+1).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(
+            sampled=random.random() < settings.database.stats_sample_rate
+        )
+        token = current_request.set(stats)
+        started = perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = (perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={stats.db_time * 1000:.2f};desc="{stats.statements} SQL", '
+                    f"app;dur={total_ms:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            for fp, count in stats.repeated(settings.database.n_plus_one_threshold):
+                sql_stats.flag_n_plus_one(fp)
+                logger.warning(
+                    "Возможный N+1: %s %s выполнил %d раз: %s",
+                    scope["method"],
+                    scope["path"],
+                    count,
+                    fp,
+                )
+
+
+class MetricsMiddleware:
+    """
+    Собирает метрики HTTP-запросов: количество по статусам, гистограмму
+    времени обработки по шаблону маршрута и число запросов в обработке.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # Шаблон маршрута (/orders/{order_id}), а не путь: иначе число
+            # рядов метрики росло бы с каждым новым ID.
+            route = scope.get("route")
+            template = route.path if route is not None else "<unmatched>"
+            http_request_duration.observe(
+                perf_counter() - started, scope["method"], template
+            )
+            http_requests.inc(scope["method"], template, str(status))
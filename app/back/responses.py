@@ -0,0 +1,85 @@
+from typing import Any
+
+from fastapi import Request, Response
+
+from modules.cache import encode_json
+from modules.envs import settings
+
+
+class FastJSONResponse(Response):
+    """
+    JSON-ответ, сериализуемый `encode_json` (orjson, если установлен)
+    без `jsonable_encoder`.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Проверяет заголовок If-None-Match на совпадение с ETag.
+    Для If-None-Match используется слабое сравнение (RFC 9110, 13.1.2).
+
+    :param if_none_match: Значение заголовка If-None-Match.
+    :param etag: Текущий ETag ресурса.
+    :return: True, если у клиента актуальная версия.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cached_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Отдаёт готовый JSON со слабым ETag или пустой ответ 304,
+    если у клиента уже есть эта версия.
+
+    :param request: Входящий запрос.
+    :param body: JSON в байтах.
+    :param etag: ETag тела ответа.
+    :return: Ответ 200 с телом или 304 без тела.
+    """
+    # ETag слабый: GZipMiddleware отдаёт тот же ресурс и в сжатом виде,
+    # а строгий ETag должен отличаться у разных представлений
+    # (RFC 9110, 8.8.3). Vary при сжатии добавляет сама GZipMiddleware.
+    # no-cache: клиент может хранить ответ, но обязан перепроверять его.
+    headers = {"ETag": f"W/{etag}", "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def trusted_json_response(content: Any) -> Any:
+    """
+    Ответ с данными, которые методы БД уже собрали в формате схемы ответа.
+    С BACKEND_FAST_JSON они сериализуются сразу: FastAPI не проверяет
+    готовый Response по `response_model` и не обходит его `jsonable_encoder`.
+    Иначе данные возвращаются FastAPI для обычной обработки.
+
+    :param content: Данные ответа.
+    :return: Ответ или сами данные.
+    """
+    if settings.backend.fast_json:
+        return FastJSONResponse(content)
+    return content
+
+
+def json_page_response(items: bytes, next_cursor: str | None) -> Response:
+    """
+    Ответ со страницей `{"items": [...], "next_cursor": ...}`
+    из уже сериализованного JSON-массива элементов.
+
+    :param items: JSON-массив элементов страницы.
+    :param next_cursor: Курсор следующей страницы.
+    :return: Ответ.
+    """
+    body = b'{"items":' + items + b',"next_cursor":' + encode_json(next_cursor) + b"}"
+    return Response(body, media_type="application/json")
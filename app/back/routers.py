@@ -1,6 +1,10 @@
+from api.debug import router as debug_r
 from api.delivery_methods import router as deliv_r
+from api.health import router as health_r
 from api.menu_categories import router as mc_r
 from api.menu_items import router as mi_r
+from api.metrics import router as metrics_r
+from api.order_statuses import router as os_r
 from api.orders import router as order_r
 from api.roles import router as roles_r
 from api.users import router as users_r
@@ -11,5 +15,9 @@ global_router.include_router(roles_r)
 global_router.include_router(users_r)
 global_router.include_router(deliv_r)
 global_router.include_router(order_r)
+global_router.include_router(os_r)
 global_router.include_router(mi_r)
 global_router.include_router(mc_r)
+global_router.include_router(debug_r)
+global_router.include_router(metrics_r)
+global_router.include_router(health_r)
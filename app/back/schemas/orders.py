@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .out import ORMSchema
 
@@ -18,6 +18,11 @@ class OrderCreate(BaseModel):
     items: List[MenuItemInOrder]
 
 
+class OrderItemOut(MenuItemInOrder):
+    name: str
+    price: float
+
+
 class UserForOrder(BaseModel):
     user_id: int
 
@@ -31,13 +36,35 @@ class OrderOut(ORMSchema):
     status_id: int
     status_name: str
     created_at: datetime
-    items: Optional[List[MenuItemInOrder]]
+    items: Optional[List[OrderItemOut]]
+
+
+class OrderPage(BaseModel):
+    items: List[OrderOut]
+    next_cursor: Optional[str]
 
 
 class OrderUpdateStatus(BaseModel):
     status_id: int
 
 
+class OrdersUpdateStatus(BaseModel):
+    order_ids: List[int] = Field(..., min_length=1, max_length=100)
+    status_id: int
+
+
+class OrderStatusChanged(BaseModel):
+    order_id: int
+    user_id: int
+
+
+class OrdersStatusUpdated(BaseModel):
+    status_id: int
+    status_name: str
+    orders: List[OrderStatusChanged]
+    not_found: List[int]
+
+
 class OrderUpdatePrice(BaseModel):
     total_price: float
 
@@ -2,7 +2,6 @@ from typing import Union
 
 from aiogram.filters import BaseFilter
 from aiogram.types import Message
-import httpx
 
 from modules.dataclasses.roles import Role
 from modules.envs.settings import settings
@@ -28,20 +27,12 @@ class BaristaFilter(BaseFilter):
     Фильтр для проверки, является ли пользователь бариста.
     """
 
-    async def __call__(self, message: Message) -> bool:
+    async def __call__(self, message: Message, role_id: int | None = None) -> bool:
         """
         Проверяет, является ли пользователь бариста.
+        Роль определяется заранее в `RoleMiddleware`.
         """
-        tg_id = message.from_user.id
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{settings.bot.backend_url}/users/{tg_id}")
-
-            if response.status_code == 404:
-                return False
-
-            if response.status_code == 200:
-                user = response.json()
-                return user["role_id"] == Role.BARISTA_ID
+        return role_id == Role.BARISTA_ID
 
 
 class ChatTypeFilter(BaseFilter):
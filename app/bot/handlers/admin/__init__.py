@@ -6,6 +6,7 @@ from .delivery_methods import router as delivery_methods_router
 from .orders import router as orders_router
 from .assign_barista import router as assign_barista_router
 from .menu import router as menu_router
+from .backend_stats import router as backend_stats_router
 
 __all__ = [
     "admin_panel_router",
@@ -16,4 +17,5 @@ __all__ = [
     "orders_router",
     "assign_barista_router",
     "menu_router",
+    "backend_stats_router",
 ]
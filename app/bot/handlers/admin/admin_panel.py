@@ -14,7 +14,7 @@ async def admin_panel(message: types.Message):
         "Добро пожаловать в административную панель!\n"
         "Доступные команды:\n"
         "/orders - Просмотр заказов\n"
-        "/set_status <order_id> <new_status> - Обновить статус заказа\n"
+        "/set_status <order_id> [<order_id> ...] <new_status> - Обновить статус заказов\n"
         "/menu - Просмотр меню\n"
         "/product <product_id> - Просмотр информации о продукте\n"
         "/add_product <name> <price> <in_stock> - Добавить продукт\n"
@@ -22,5 +22,6 @@ async def admin_panel(message: types.Message):
         "/assign_barista <tg_id> - Назначить роль Бариста\n"
         "/delivery_methods - Список способов доставки\n"
         "/add_delivery <name> - Добавить новый способ доставки\n"
-        "/statuses - Список статусов заказов"
+        "/statuses - Список статусов заказов\n"
+        "/backend_stats - Статистика соединений с бэкендом"
     )
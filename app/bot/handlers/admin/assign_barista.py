@@ -3,13 +3,13 @@ from aiogram.filters import Command
 import httpx
 
 from bot.handlers.routers import admin_router
-from modules.envs.settings import settings
+from bot.utils.backend import backend
+from bot.utils.roles import role_cache
+from modules.dataclasses.roles import Role
 
 router = Router()
 admin_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
-
 
 @router.message(Command("assign_barista"))
 async def assign_barista_role(message: types.Message):
@@ -18,21 +18,11 @@ async def assign_barista_role(message: types.Message):
     """
     try:
         _, tg_id = message.text.split()
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{BACKEND_URL}/users/change-role/{tg_id}",
-                json={"new_role_id": 2},  # ID роли "Бариста"
-            )
-            response.raise_for_status()
-
-            if response.status_code == 200:
-                await message.reply(
-                    f"Роль 'Бариста' успешно назначена пользователю с ID {tg_id}."
-                )
-            else:
-                await message.reply(
-                    f"Ошибка: {response.json().get('detail', 'Неизвестная ошибка')}"
-                )
+        await backend.change_user_role(int(tg_id), Role.BARISTA_ID)
+        role_cache.invalidate(int(tg_id))
+        await message.reply(
+            f"Роль 'Бариста' успешно назначена пользователю с ID {tg_id}."
+        )
     except ValueError:
         await message.reply(
             "Некорректный формат команды. Используйте: /assign_barista <tg_id>"
@@ -0,0 +1,25 @@
+from aiogram import Router, types
+from aiogram.filters import Command
+
+from bot.handlers.routers import admin_router
+from bot.utils.backend import backend
+
+router = Router()
+admin_router.include_router(router)
+
+
+@router.message(Command("backend_stats"))
+async def backend_stats(message: types.Message):
+    """
+    Показывает статистику соединений клиента бэкенда.
+    """
+    stats = backend.stats
+    await message.reply(
+        "Клиент бэкенда:\n"
+        f"Запросов: {stats.requests}\n"
+        f"Открыто соединений: {stats.connections_opened}\n"
+        f"Повторное использование соединений: {stats.reuse_ratio:.1%}\n"
+        f"Ответов 304 (справочники не изменились): {stats.not_modified}\n"
+        f"Повторов: {stats.retries}\n"
+        f"Ошибок: {stats.failures}"
+    )
@@ -3,13 +3,10 @@ from aiogram.filters import Command
 
 from bot.handlers.routers import admin_router
 from bot.keyboards import barista_and_admin_main_menu_kb
-from modules.envs.settings import settings
 
 router = Router()
 admin_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
-
 
 @router.message(Command("menu"))
 async def admin_menu_commands(message: types.Message):
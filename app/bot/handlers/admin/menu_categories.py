@@ -3,37 +3,32 @@ from aiogram.filters import Command
 import httpx
 
 from bot.handlers.routers import admin_router
-from modules.envs.settings import settings
+from bot.utils.backend import backend
 
 router = Router()
 admin_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
-
 
 @router.message(Command("menu_categories"))
 async def list_menu_categories(message: types.Message):
     """
     Получает список всех категорий меню.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BACKEND_URL}/menu-categories/")
-            response.raise_for_status()
-            categories = response.json()
+    try:
+        categories = await backend.get_menu_categories()
 
-            if not categories:
-                await message.reply("Категории меню отсутствуют.")
-                return
+        if not categories:
+            await message.reply("Категории меню отсутствуют.")
+            return
 
-            categories_list = "\n".join(
-                f"ID: {cat['id']}, Название: {cat['name']}" for cat in categories
-            )
-            await message.reply(f"Список категорий меню:\n{categories_list}")
-        except httpx.RequestError as e:
-            await message.reply(f"Ошибка при запросе категорий меню: {str(e)}")
-        except httpx.HTTPStatusError as e:
-            await message.reply(f"Ошибка на сервере: {e.response.text}")
+        categories_list = "\n".join(
+            f"ID: {cat['id']}, Название: {cat['name']}" for cat in categories
+        )
+        await message.reply(f"Список категорий меню:\n{categories_list}")
+    except httpx.RequestError as e:
+        await message.reply(f"Ошибка при запросе категорий меню: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        await message.reply(f"Ошибка на сервере: {e.response.text}")
 
 
 @router.message(Command("add_category"))
@@ -44,19 +39,8 @@ async def add_menu_category(message: types.Message):
     """
     try:
         _, name = message.text.split(maxsplit=1)
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{BACKEND_URL}/menu-categories/",
-                json={"name": name},
-            )
-            response.raise_for_status()
-
-            if response.status_code == 201:
-                await message.reply(f"Категория '{name}' успешно добавлена.")
-            else:
-                await message.reply(
-                    f"Ошибка: {response.json().get('detail', 'Неизвестная ошибка')}"
-                )
+        await backend.create_menu_category(name)
+        await message.reply(f"Категория '{name}' успешно добавлена.")
     except ValueError:
         await message.reply(
             "Некорректный формат команды. Используйте: /add_category <name>"
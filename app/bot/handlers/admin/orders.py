@@ -1,37 +1,66 @@
-from aiogram import Router, types
+from aiogram import F, Router, types
 from aiogram.filters import Command
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery
 import httpx
 
 from bot.handlers.routers import admin_router
-from modules.envs.settings import settings
+from bot.keyboards.callback import generate_next_page_keyboard
+from bot.utils.backend import backend
 
 router = Router()
 admin_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
+NEXT_PAGE_CALLBACK = "admin_orders_next"
+CURSOR_KEY = "admin_orders_cursor"
 
 
-@router.message(Command("orders"))
-async def list_orders(message: types.Message):
-    """Получает список заказов с бэкенда."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BACKEND_URL}/orders/")
-            response.raise_for_status()
-            orders = response.json()
-
-            if not orders:
-                await message.reply("Нет активных заказов.")
-                return
-
-            order_list = "\n".join(
-                f"ID: {order['id']}, Пользователь: {order['user_id']}, "
-                f"Статус: {order['status']}, Сумма: {order['total_price']}"
-                f"Дата создания: {order['created_at']}"
-                for order in orders
+async def send_orders_page(
+    message: types.Message, state: FSMContext, cursor: str | None = None
+):
+    """Отправляет страницу заказов, от новых к старым."""
+    try:
+        page = await backend.get_orders(cursor=cursor)
+        orders = page["items"]
+
+        if not orders:
+            await message.reply("Нет активных заказов.")
+            return
+
+        order_list = "\n".join(
+            f"ID: {order['id']}, Пользователь: {order['user_id']}, "
+            f"Статус: {order['status_name']}, Сумма: {order['total_price']}"
+            f"Дата создания: {order['created_at']}"
+            for order in orders
+        )
+
+        await state.update_data({CURSOR_KEY: page["next_cursor"]})
+        if page["next_cursor"]:
+            await message.reply(
+                f"Список заказов:\n{order_list}\n\nЕсть более ранние заказы.",
+                reply_markup=generate_next_page_keyboard(NEXT_PAGE_CALLBACK),
             )
+        else:
             await message.reply(f"Список заказов:\n{order_list}")
-        except httpx.RequestError as e:
-            await message.reply(f"Ошибка при запросе заказов: {str(e)}")
-        except httpx.HTTPStatusError as e:
-            await message.reply(f"Ошибка на сервере: {e.response.text}")
+    except httpx.RequestError as e:
+        await message.reply(f"Ошибка при запросе заказов: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        await message.reply(f"Ошибка на сервере: {e.response.text}")
+
+
+@router.message(Command("orders"))
+async def list_orders(message: types.Message, state: FSMContext):
+    """Получает список заказов с бэкенда."""
+    await send_orders_page(message, state)
+
+
+@router.callback_query(F.data == NEXT_PAGE_CALLBACK)
+async def next_orders_page(callback_query: CallbackQuery, state: FSMContext):
+    """Следующая страница заказов."""
+    cursor = (await state.get_data()).get(CURSOR_KEY)
+    await callback_query.message.edit_reply_markup(reply_markup=None)
+    if not cursor:
+        await callback_query.answer("Больше заказов нет.")
+        return
+    await send_orders_page(callback_query.message, state, cursor)
+    await callback_query.answer()
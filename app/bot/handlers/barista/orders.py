@@ -1,55 +1,80 @@
-from aiogram import Router, types
+from aiogram import F, Router, types
 from aiogram.filters import Command
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery
 import httpx
 
 from bot.handlers.routers import barista_router
-from modules.envs.settings import settings
+from bot.keyboards.callback import generate_next_page_keyboard
+from bot.utils.backend import backend
 
 router = Router()
 barista_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
+NEXT_PAGE_CALLBACK = "barista_orders_next"
+CURSOR_KEY = "barista_orders_cursor"
+
+
+async def send_orders_page(
+    message: types.Message, state: FSMContext, cursor: str | None = None
+):
+    """
+    Отправляет страницу очереди заказов: от старых к новым,
+    чтобы первыми были самые давние незавершённые заказы.
+    """
+    try:
+        page = await backend.get_orders(active=True, oldest_first=True, cursor=cursor)
+        orders = page["items"]
+
+        if not orders:
+            await message.reply("Нет активных заказов.")
+            return
+
+        res_text = ""
+        for order in orders:
+            order_id = order["id"]
+            user_id = order["user_id"]
+            delivery_method_name = order["delivery_method_name"]
+            status_name = order["status_name"]
+            total_price = order["total_price"]
+            created_at = order["created_at"]
+            menu_items = order["items"]
+
+            res_text += f"Заказ №{order_id}\nID заказчика: {user_id}\nпособ доставки: {delivery_method_name}\nСтатус: {status_name}\nСумма: {total_price}\nДата: {created_at}\n"
+            res_text += "Позиции:\n"
+
+            for item in menu_items:
+                res_text += f"{item['name']} - {item['quantity']} шт.\n"
+
+            res_text += "\n"
+
+        await state.update_data({CURSOR_KEY: page["next_cursor"]})
+        if page["next_cursor"]:
+            await message.reply(
+                f"Список заказов:\n{res_text}Есть ещё заказы.",
+                reply_markup=generate_next_page_keyboard(NEXT_PAGE_CALLBACK),
+            )
+        else:
+            await message.reply(f"Список заказов:\n{res_text}")
+    except httpx.RequestError as e:
+        await message.reply(f"Ошибка при запросе заказов: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        await message.reply(f"Ошибка на сервере: {e.response.text}")
 
 
 @router.message(Command("orders"))
-async def list_orders(message: types.Message):
+async def list_orders(message: types.Message, state: FSMContext):
     """Получает список заказов с бэкенда."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BACKEND_URL}/orders/")
-            response.raise_for_status()
-            orders = response.json()
-
-            if not orders:
-                await message.reply("Нет активных заказов.")
-                return
-
-            res_text = ""
-            for order in orders:
-                order_id = order["id"]
-                user_id = order["user_id"]
-                delivery_method_name = order["delivery_method_name"]
-                status_name = order["status_name"]
-                total_price = order["total_price"]
-                created_at = order["created_at"]
-                menu_items = order["items"]
-
-                res_text += f"Заказ №{order_id}\nID заказчика: {user_id}\nпособ доставки: {delivery_method_name}\nСтатус: {status_name}\nСумма: {total_price}\nДата: {created_at}\n"
-                res_text += "Позиции:\n"
-
-                for item in menu_items:
-                    item_id = item["menu_item_id"]
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(
-                            f"{BACKEND_URL}/menu-items/{item_id}"
-                        )
-                        item_data = response.json()
-                        item_name = item_data["name"]
-                    res_text += f"{item_name} - {item['quantity']} шт.\n"
-
-                res_text += "\n"
-            await message.reply(f"Список заказов:\n{res_text}")
-        except httpx.RequestError as e:
-            await message.reply(f"Ошибка при запросе заказов: {str(e)}")
-        except httpx.HTTPStatusError as e:
-            await message.reply(f"Ошибка на сервере: {e.response.text}")
+    await send_orders_page(message, state)
+
+
+@router.callback_query(F.data == NEXT_PAGE_CALLBACK)
+async def next_orders_page(callback_query: CallbackQuery, state: FSMContext):
+    """Следующая страница очереди заказов."""
+    cursor = (await state.get_data()).get(CURSOR_KEY)
+    await callback_query.message.edit_reply_markup(reply_markup=None)
+    if not cursor:
+        await callback_query.answer("Больше заказов нет.")
+        return
+    await send_orders_page(callback_query.message, state, cursor)
+    await callback_query.answer()
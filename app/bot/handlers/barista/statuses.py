@@ -1,14 +1,14 @@
 from aiogram import Bot, Router, types
+from aiogram.exceptions import TelegramAPIError
 from aiogram.filters import Command
 import httpx
 
 from bot.handlers.routers import barista_router
+from bot.utils.backend import backend
 from modules.dataclasses.order_status import OrderStatus
-from modules.envs import settings
 
 router = Router()
 barista_router.include_router(router)
-BACKEND_URL = settings.bot.backend_url
 
 
 @router.message(Command("statuses"))
@@ -32,41 +32,41 @@ async def list_order_statuses(message: types.Message):
 @router.message(Command("set_status"))
 async def set_order_status(message: types.Message, bot: Bot):
     """
-    Устанавливает статус заказа.
+    Устанавливает статус одного или нескольких заказов.
     """
     try:
-        order_id, new_status_id = map(int, message.text.split()[1:])
+        *order_ids, new_status_id = map(int, message.text.split()[1:])
     except ValueError:
+        order_ids = None
+    if not order_ids:
         await message.reply(
-            "Неверный формат команды. Пример: /set_status <order_id> <new_status>"
+            "Неверный формат команды. Пример: "
+            "/set_status <order_id> [<order_id> ...] <new_status>"
         )
         return
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.put(
-                f"{BACKEND_URL}/orders/{order_id}/status",
-                json={"status_id": new_status_id},
-            )
-            response.raise_for_status()
-            await message.reply("Статус заказа обновлен.")
-        except httpx.RequestError as e:
-            await message.reply(f"Ошибка при обновлении статуса заказа: {str(e)}")
-        except httpx.HTTPStatusError as e:
-            await message.reply(f"Ошибка на сервере: {e.response.text}")
+    try:
+        result = await backend.update_orders_status(order_ids, new_status_id)
+    except httpx.RequestError as e:
+        await message.reply(f"Ошибка при обновлении статуса заказа: {str(e)}")
+        return
+    except httpx.HTTPStatusError as e:
+        await message.reply(f"Ошибка на сервере: {e.response.text}")
+        return
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/orders/{order_id}/user")
-        user_id = response.json()["user_id"]
-    status = ""
-    match new_status_id:
-        case OrderStatus.PENDING_ID:
-            status = OrderStatus.PENDING_NAME
-        case OrderStatus.PROCESSING_ID:
-            status = OrderStatus.PROCESSING_NAME
-        case OrderStatus.COMPLETED_ID:
-            status = OrderStatus.COMPLETED_NAME
+    text = f"Статус обновлён у заказов: {len(result['orders'])}."
+    if result["not_found"]:
+        not_found = ", ".join(map(str, result["not_found"]))
+        text += f"\nНе найдены заказы: {not_found}."
+    await message.reply(text)
 
-    await bot.send_message(
-        user_id, f"Статус вашего заказа №{order_id} был обновлен на '{status}'."
-    )
+    for order in result["orders"]:
+        try:
+            await bot.send_message(
+                order["user_id"],
+                f"Статус вашего заказа №{order['order_id']} был обновлен "
+                f"на '{result['status_name']}'.",
+            )
+        except TelegramAPIError:
+            # Пользователь мог заблокировать бота - остальных всё равно уведомляем.
+            continue
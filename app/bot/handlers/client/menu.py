@@ -1,20 +1,17 @@
 from aiogram import F, Router, types
 from aiogram.filters import or_f
 from aiogram.fsm.context import FSMContext
-import httpx
 
 from bot.handlers.routers import client_router
 from bot.keyboards import client_main_menu_kb
 from bot.states import ClientStates
+from bot.utils.backend import backend
 from modules.dataclasses import Buttons
 from modules.dataclasses.roles import Role
-from modules.envs import settings
 
 router = Router()
 client_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
-
 
 def get_name_by_id(data, target_id, cache={}):
     if target_id not in cache:
@@ -25,18 +22,13 @@ def get_name_by_id(data, target_id, cache={}):
 @router.message(F.text == Buttons.MENU, ClientStates.main_menu)
 async def view_menu(message: types.Message, state: FSMContext):
     """Просмотр меню."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/menu-items/?is_available=true")
-
-        if response.status_code == 404:
-            await message.reply("Меню пусто.")
-            return
+    menu = await backend.get_menu_items(is_available=True)
 
-        menu = response.json()
+    if not menu:
+        await message.reply("Меню пусто.")
+        return
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/menu-categories/")
-        menu_categories = response.json()
+    menu_categories = await backend.get_menu_categories()
 
     menu_list = "\n".join(
         f"Название: {item['name']}, "
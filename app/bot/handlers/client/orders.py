@@ -2,7 +2,6 @@ from aiogram import F, Router, types
 from aiogram.filters import or_f
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
-import httpx
 
 from bot.handlers.routers import client_router
 from bot.keyboards.callback import (
@@ -10,17 +9,19 @@ from bot.keyboards.callback import (
     generate_categories_keyboard,
     generate_delivery_methods_keyboard,
     generate_menu_keyboard,
+    generate_next_page_keyboard,
     generate_quantity_keyboard,
 )
 from bot.states import ClientStates
+from bot.utils.backend import backend
 from modules.dataclasses import Buttons, OrderStatus
 from modules.dataclasses.roles import Role
-from modules.envs import settings
 
 router = Router()
 client_router.include_router(router)
 
-BACKEND_URL = settings.bot.backend_url
+ORDERS_NEXT_PAGE_CALLBACK = "client_orders_next"
+ORDERS_CURSOR_KEY = "client_orders_cursor"
 
 
 def get_name_by_id(data, target_id, key="menu_item_id", cache={}):
@@ -29,16 +30,15 @@ def get_name_by_id(data, target_id, key="menu_item_id", cache={}):
     return cache.get(target_id)
 
 
-@router.message(F.text == Buttons.ORDERS, ClientStates.main_menu)
-async def view_orders(message: types.Message, state: FSMContext):
-    """Просмотр заказов."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/orders/user/{message.from_user.id}")
-
-        orders = response.json()
-        if not orders:
-            await message.reply("Нет заказов.")
-            return
+async def send_orders_page(
+    message: types.Message, state: FSMContext, user_id: int, cursor: str | None = None
+):
+    """Отправляет страницу заказов пользователя, от новых к старым."""
+    page = await backend.get_user_orders(user_id, cursor=cursor)
+    orders = page["items"]
+    if not orders:
+        await message.reply("Нет заказов.")
+        return
 
     res_text = ""
     for order in orders:
@@ -53,24 +53,45 @@ async def view_orders(message: types.Message, state: FSMContext):
         res_text += "Позиции:\n"
 
         for item in menu_items:
-            item_id = item["menu_item_id"]
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{BACKEND_URL}/menu-items/{item_id}")
-                item_data = response.json()
-                item_name = item_data["name"]
-            res_text += f"{item_name} - {item['quantity']} шт.\n"
+            res_text += f"{item['name']} - {item['quantity']} шт.\n"
 
         res_text += "\n"
-    await message.reply(f"Список заказов:\n{res_text}")
+
+    await state.update_data({ORDERS_CURSOR_KEY: page["next_cursor"]})
+    if page["next_cursor"]:
+        await message.reply(
+            f"Список заказов:\n{res_text}Есть более ранние заказы.",
+            reply_markup=generate_next_page_keyboard(ORDERS_NEXT_PAGE_CALLBACK),
+        )
+    else:
+        await message.reply(f"Список заказов:\n{res_text}")
+
+
+@router.message(F.text == Buttons.ORDERS, ClientStates.main_menu)
+async def view_orders(message: types.Message, state: FSMContext):
+    """Просмотр заказов."""
+    await send_orders_page(message, state, message.from_user.id)
+
+
+@router.callback_query(F.data == ORDERS_NEXT_PAGE_CALLBACK)
+async def next_orders_page(callback_query: CallbackQuery, state: FSMContext):
+    """Следующая страница заказов."""
+    cursor = (await state.get_data()).get(ORDERS_CURSOR_KEY)
+    await callback_query.message.edit_reply_markup(reply_markup=None)
+    if not cursor:
+        await callback_query.answer("Больше заказов нет.")
+        return
+    await send_orders_page(
+        callback_query.message, state, callback_query.from_user.id, cursor
+    )
+    await callback_query.answer()
 
 
 @router.message(F.text == Buttons.MAKE_ORDER, ClientStates.main_menu)
 async def make_order(message: types.Message, state: FSMContext):
     """Создание заказа."""
     await state.set_state(ClientStates.make_order)
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/menu-categories/")
-        categories = response.json()
+    categories = await backend.get_menu_categories()
 
     res_text = "Выберите категорию:\n"
     await message.reply(res_text, reply_markup=generate_categories_keyboard(categories))
@@ -81,11 +102,9 @@ async def make_order(message: types.Message, state: FSMContext):
 async def select_category(callback_query: CallbackQuery, state: FSMContext):
     """Выбор категории."""
     category_id = int(callback_query.data.split(":")[1])
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BACKEND_URL}/menu-items/?category_id={category_id}&is_available=true"
-        )
-        menu_items = response.json()
+    menu_items = await backend.get_menu_items(
+        category_id=category_id, is_available=True
+    )
     if not menu_items:
         await callback_query.answer("В данной категории нет доступных позиций.")
         return
@@ -145,9 +164,7 @@ async def confirm_quantity(callback_query: CallbackQuery, state: FSMContext):
     await state.update_data(order_items=order_items, quantity=1)
 
     # Получаем обновленный список категорий
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/menu-categories/")
-        categories = response.json()
+    categories = await backend.get_menu_categories()
 
     await callback_query.message.edit_text(
         "Позиция добавлена. Выберите следующую категорию или подтвердите заказ.",
@@ -166,9 +183,7 @@ async def confirm_order(callback_query: CallbackQuery, state: FSMContext):
         await callback_query.message.answer("Ваш заказ пуст.")
         return
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/delivery-methods/")
-        delivery_methods = response.json()
+    delivery_methods = await backend.get_delivery_methods()
 
     res_text = "Выберите способ доставки:\n"
     await callback_query.message.reply(
@@ -185,17 +200,12 @@ async def select_delivery_method(callback_query: CallbackQuery, state: FSMContex
     order_items = data.get("order_items", [])
     user_id = callback_query.from_user.id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BACKEND_URL}/orders/",
-            json={
-                "user_id": user_id,
-                "delivery_method_id": delivery_method_id,
-                "status_id": OrderStatus.PENDING_ID,
-                "items": order_items,
-            },
-        )
-        response.raise_for_status()
+    await backend.create_order(
+        user_id=user_id,
+        delivery_method_id=delivery_method_id,
+        status_id=OrderStatus.PENDING_ID,
+        items=order_items,
+    )
 
     await state.clear()
 
@@ -203,9 +213,7 @@ async def select_delivery_method(callback_query: CallbackQuery, state: FSMContex
     await callback_query.message.reply("Ваш заказ успешно оформлен!")
     await callback_query.answer()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BACKEND_URL}/roles/users/{Role.BARISTA_ID}")
-        baristas_ids = response.json()["user_ids"]
+    baristas_ids = await backend.get_role_user_ids(Role.BARISTA_ID)
 
     for barista in baristas_ids:
         await callback_query.message.bot.send_message(
@@ -98,3 +98,15 @@ confirm_order_kb = InlineKeyboardMarkup(
         ]
     ]
 )
+
+
+def generate_next_page_keyboard(callback_data: str) -> InlineKeyboardMarkup:
+    """
+    Кнопка следующей страницы списка. Курсор страницы хранится
+    в данных FSM: в callback_data помещается не больше 64 байт.
+    """
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text=Buttons.NEXT, callback_data=callback_data)]
+        ]
+    )
@@ -2,6 +2,7 @@ from asyncio import run
 
 from aiogram import Bot, Dispatcher
 
+from bot.utils.backend import backend
 from bot.utils.registry import registry
 from modules.envs.settings import settings
 
@@ -16,7 +17,9 @@ async def start(bot: Bot, dp: Dispatcher):
         async def startup_wrapper(dispatcher: Dispatcher):
             await startup(dispatcher, bot)
 
+        dp.startup.register(backend.start)
         dp.startup.register(startup_wrapper)
+        dp.shutdown.register(backend.close)
 
         await dp.start_polling(bot)
     finally:
@@ -0,0 +1 @@
+from .roles import RoleMiddleware
@@ -0,0 +1,25 @@
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from bot.utils.roles import role_cache
+
+
+class RoleMiddleware(BaseMiddleware):
+    """
+    Определяет роль пользователя один раз на апдейт.
+
+    Роль берётся из `role_cache` и передаётся фильтрам и обработчикам
+    в параметре `role_id`.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        user = data.get("event_from_user")
+        data["role_id"] = await role_cache.resolve(user.id) if user else None
+        return await handler(event, data)
@@ -0,0 +1,302 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import random
+from typing import Any
+
+import httpx
+
+from modules.envs import settings
+
+# Повтор безопасен: повторный запрос не меняет результат.
+# DELETE не входит: если первая попытка удалила запись, а ответ не дошёл,
+# повтор получит 404 и удаление будет выглядеть неудачным.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT"})
+# Для остальных методов повторяем только ошибки установки соединения:
+# в этом случае запрос гарантированно не дошёл до сервера.
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+# Сколько последних ответов справочников хранить для условных запросов.
+CONDITIONAL_CACHE_SIZE = 256
+
+
+@dataclass
+class BackendStats:
+    """Статистика использования соединений клиента бэкенда."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    retries: int = 0
+    failures: int = 0
+    not_modified: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Доля запросов, выполненных по уже открытому соединению."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "reuse_ratio": self.reuse_ratio}
+
+
+class BackendClient:
+    """
+    Долгоживущий клиент API бэкенда с общим пулом соединений.
+
+    Создаётся один раз на процесс бота: `start` вызывается при запуске
+    диспетчера, `close` - при остановке. Запросы используют keep-alive
+    соединения пула, идемпотентные запросы повторяются с экспоненциальной
+    задержкой и случайным разбросом. Справочники (меню, способы доставки)
+    запрашиваются условно: клиент хранит последний ответ и его ETag и
+    получает от бэкенда 304 без тела, если данные не изменились.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        max_connections: int,
+        keepalive_expiry: float,
+        retries: int,
+        backoff: float = 0.2,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.retries = retries
+        self.backoff = backoff
+        self.stats = BackendStats()
+        self._client: httpx.AsyncClient | None = None
+        self._conditional: OrderedDict[tuple, tuple[str, Any]] = OrderedDict()
+
+    async def start(self) -> None:
+        """
+        Открывает пул соединений.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+
+    async def close(self) -> None:
+        """
+        Закрывает все соединения пула.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._conditional.clear()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("Клиент бэкенда не запущен.")
+        return self._client
+
+    async def _trace(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.connections_opened += 1
+
+    async def request(
+        self, method: str, url: str, *, timeout: float | None = None, **kwargs
+    ) -> httpx.Response:
+        """
+        Выполняет запрос к бэкенду с повторами.
+
+        :param method: HTTP-метод.
+        :param url: Путь относительно адреса бэкенда.
+        :param timeout: Таймаут этого запроса, по умолчанию - общий таймаут клиента.
+        :return: Ответ бэкенда.
+        """
+        method = method.upper()
+        idempotent = method in IDEMPOTENT_METHODS
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        attempt = 0
+        while True:
+            self.stats.requests += 1
+            try:
+                response = await self.client.request(
+                    method, url, extensions={"trace": self._trace}, **kwargs
+                )
+            except httpx.TransportError as e:
+                retryable = idempotent or isinstance(e, CONNECT_ERRORS)
+                if not retryable or attempt >= self.retries:
+                    self.stats.failures += 1
+                    raise
+            else:
+                if (
+                    not idempotent
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self.retries
+                ):
+                    return response
+
+            self.stats.retries += 1
+            await asyncio.sleep(random.uniform(0, self.backoff * 2**attempt))
+            attempt += 1
+
+    async def _json(self, method: str, url: str, **kwargs) -> Any:
+        response = await self.request(method, url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def _conditional_json(self, url: str, params: dict | None = None) -> Any:
+        """
+        GET с If-None-Match: при ответе 304 возвращает сохранённое тело.
+
+        :param url: Путь относительно адреса бэкенда.
+        :param params: Параметры запроса.
+        :return: Тело ответа.
+        """
+        params = params or {}
+        key = (url, tuple(sorted(params.items())))
+        cached = self._conditional.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        response = await self.request("GET", url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            self.stats.not_modified += 1
+            self._conditional.move_to_end(key)
+            return cached[1]
+        response.raise_for_status()
+        data = response.json()
+
+        etag = response.headers.get("ETag")
+        if etag:
+            self._conditional[key] = (etag, data)
+            self._conditional.move_to_end(key)
+            if len(self._conditional) > CONDITIONAL_CACHE_SIZE:
+                self._conditional.popitem(last=False)
+        return data
+
+    async def get_user(self, tg_id: int) -> dict | None:
+        response = await self.request("GET", f"/users/{tg_id}")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    async def create_user(self, tg_id: int, username: str | None, role_id: int) -> dict:
+        return await self._json(
+            "POST",
+            "/users/",
+            json={"tg_id": tg_id, "username": username, "role_id": role_id},
+        )
+
+    async def change_user_role(self, tg_id: int, new_role_id: int) -> dict:
+        return await self._json(
+            "PUT", f"/users/change-role/{tg_id}", json={"new_role_id": new_role_id}
+        )
+
+    async def get_role_user_ids(self, role_id: int) -> list[int]:
+        return (await self._json("GET", f"/roles/users/{role_id}"))["user_ids"]
+
+    async def get_menu_categories(self) -> list[dict]:
+        return await self._conditional_json("/menu-categories/")
+
+    async def create_menu_category(self, name: str) -> dict:
+        return await self._json("POST", "/menu-categories/", json={"name": name})
+
+    async def get_menu_items(
+        self,
+        category_id: int | None = None,
+        is_available: bool | None = None,
+    ) -> list[dict]:
+        params = {}
+        if category_id is not None:
+            params["category_id"] = category_id
+        if is_available is not None:
+            params["is_available"] = "true" if is_available else "false"
+        return await self._conditional_json("/menu-items/", params)
+
+    async def create_menu_item(
+        self,
+        name: str,
+        category_id: int,
+        weight: float,
+        price: float,
+        is_available: bool,
+    ) -> dict:
+        return await self._json(
+            "POST",
+            "/menu-items/",
+            json={
+                "name": name,
+                "category_id": category_id,
+                "weight": weight,
+                "price": price,
+                "is_available": is_available,
+            },
+        )
+
+    async def set_menu_item_availability(
+        self, item_id: int, is_available: bool
+    ) -> dict:
+        return await self._json(
+            "PUT",
+            f"/menu-items/{item_id}/availability",
+            params={"is_available": "true" if is_available else "false"},
+        )
+
+    async def delete_menu_item(self, item_id: int) -> None:
+        response = await self.request("DELETE", f"/menu-items/{item_id}")
+        response.raise_for_status()
+
+    async def get_delivery_methods(self) -> list[dict]:
+        return await self._conditional_json("/delivery-methods/")
+
+    async def create_delivery_method(self, name: str) -> dict:
+        return await self._json("POST", "/delivery-methods/", json={"name": name})
+
+    async def get_orders(self, **filters) -> dict:
+        params = {key: value for key, value in filters.items() if value is not None}
+        return await self._json("GET", "/orders/", params=params)
+
+    async def get_user_orders(self, user_id: int, cursor: str | None = None) -> dict:
+        params = {"cursor": cursor} if cursor else {}
+        return await self._json("GET", f"/orders/user/{user_id}", params=params)
+
+    async def create_order(
+        self,
+        user_id: int,
+        delivery_method_id: int,
+        status_id: int,
+        items: list[dict],
+    ) -> dict:
+        return await self._json(
+            "POST",
+            "/orders/",
+            json={
+                "user_id": user_id,
+                "delivery_method_id": delivery_method_id,
+                "status_id": status_id,
+                "items": items,
+            },
+        )
+
+    async def update_orders_status(self, order_ids: list[int], status_id: int) -> dict:
+        return await self._json(
+            "PUT",
+            "/orders/status",
+            json={"order_ids": order_ids, "status_id": status_id},
+        )
+
+
+backend = BackendClient(
+    base_url=settings.bot.backend_url,
+    timeout=settings.bot.backend_timeout,
+    max_connections=settings.bot.backend_max_connections,
+    keepalive_expiry=settings.bot.backend_keepalive_expiry,
+    retries=settings.bot.backend_retries,
+)
@@ -1,10 +1,11 @@
 from aiogram import Dispatcher
 
 from bot.handlers.routers import admin_router, barista_router, client_router
+from bot.middlewares import RoleMiddleware
 
 
 def registry_middlewares(dp: Dispatcher):
-    pass
+    dp.update.outer_middleware(RoleMiddleware())
 
 
 def registry_handlers(dp: Dispatcher):
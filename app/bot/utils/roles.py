@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from time import monotonic
+
+from bot.utils.backend import backend
+from modules.envs import settings
+
+
+class RoleCache:
+    """
+    TTL/LRU-кэш ролей пользователей бота.
+
+    Хранит ID роли (или None для незарегистрированного пользователя)
+    не дольше `ttl` секунд и не более `maxsize` записей.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, int | None]] = OrderedDict()
+
+    def set(self, tg_id: int, role_id: int | None) -> None:
+        self._entries[tg_id] = (monotonic() + self.ttl, role_id)
+        self._entries.move_to_end(tg_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, tg_id: int) -> None:
+        self._entries.pop(tg_id, None)
+
+    async def resolve(self, tg_id: int) -> int | None:
+        """
+        Возвращает ID роли пользователя, обращаясь к бэкенду только при промахе.
+
+        :param tg_id: Telegram ID пользователя.
+        :return: ID роли или None, если пользователь не зарегистрирован.
+        """
+        entry = self._entries.get(tg_id)
+        if entry is not None and entry[0] > monotonic():
+            self._entries.move_to_end(tg_id)
+            return entry[1]
+
+        user = await backend.get_user(tg_id)
+        role_id = user["role_id"] if user else None
+        self.set(tg_id, role_id)
+        return role_id
+
+
+role_cache = RoleCache(
+    maxsize=settings.bot.role_cache_size, ttl=settings.bot.role_cache_ttl
+)
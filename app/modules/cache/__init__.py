@@ -0,0 +1,8 @@
+from .versions import table_versions
+from .snapshot import (
+    HAS_ORJSON,
+    Snapshot,
+    SnapshotCache,
+    encode_json,
+    make_etag,
+)
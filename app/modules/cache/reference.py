@@ -0,0 +1,76 @@
+from modules.database.connect import async_session
+from modules.database.methods.delivery_methods import get_all_delivery_methods
+from modules.database.methods.menu_items import get_menu_snapshot
+from modules.database.methods.order_statuses import get_all_order_statuses
+from modules.database.methods.roles import get_all_roles
+from modules.database.models import (
+    DeliveryMethod,
+    MenuCategory,
+    MenuItem,
+    OrderStatus,
+    Role,
+)
+from modules.envs import settings
+
+from .snapshot import SnapshotCache
+
+menu_cache = SnapshotCache(
+    "menu",
+    tables=(MenuCategory.__tablename__, MenuItem.__tablename__),
+    ttl=settings.backend.cache_ttl,
+)
+delivery_methods_cache = SnapshotCache(
+    "delivery_methods",
+    tables=(DeliveryMethod.__tablename__,),
+    ttl=settings.backend.cache_ttl,
+)
+order_statuses_cache = SnapshotCache(
+    "order_statuses",
+    tables=(OrderStatus.__tablename__,),
+    ttl=settings.backend.cache_ttl,
+)
+roles_cache = SnapshotCache(
+    "roles",
+    tables=(Role.__tablename__,),
+    ttl=settings.backend.cache_ttl,
+)
+
+reference_caches = (
+    menu_cache,
+    delivery_methods_cache,
+    order_statuses_cache,
+    roles_cache,
+)
+
+
+async def load_menu() -> dict[str, list[dict]]:
+    async with async_session() as session:
+        return await get_menu_snapshot(session)
+
+
+async def load_delivery_methods() -> list[dict]:
+    async with async_session() as session:
+        methods = await get_all_delivery_methods(session)
+    return [{"id": method.id, "name": method.name} for method in methods]
+
+
+async def load_order_statuses() -> list[dict]:
+    async with async_session() as session:
+        statuses = await get_all_order_statuses(session)
+    return [{"id": status.id, "name": status.name} for status in statuses]
+
+
+async def load_roles() -> list[dict]:
+    async with async_session() as session:
+        roles = await get_all_roles(session)
+    return [{"id": role.id, "name": role.name} for role in roles]
+
+
+async def warm_reference_caches() -> None:
+    """
+    Загружает снимки всех кэшей справочников.
+    """
+    await menu_cache.get(load_menu)
+    await delivery_methods_cache.get(load_delivery_methods)
+    await order_statuses_cache.get(load_order_statuses)
+    await roles_cache.get(load_roles)
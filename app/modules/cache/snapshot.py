@@ -0,0 +1,137 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+import hashlib
+import json
+from time import monotonic
+from typing import Any, Awaitable, Callable, Hashable
+
+from .versions import table_versions
+
+try:
+    import orjson
+except ImportError:  # orjson есть в группе back; без него (бот) используется json
+    orjson = None
+
+# Сериализует ли encode_json через orjson.
+HAS_ORJSON = orjson is not None
+
+
+def make_etag(body: bytes) -> str:
+    """
+    ETag по содержимому ответа (значение в кавычках, без префикса W/).
+    Совпадает у всех воркеров, построивших одинаковое тело ответа.
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Тип {type(value).__name__} не сериализуется в JSON")
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Сериализует данные в компактный JSON, как `JSONResponse` FastAPI;
+    даты - в ISO 8601, как pydantic. Если установлен orjson,
+    сериализует им: он в несколько раз быстрее json.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_json_default,
+    ).encode("utf-8")
+
+
+@dataclass
+class Snapshot:
+    """
+    Снимок данных вместе с уже сериализованными представлениями.
+    """
+
+    version: tuple[int, ...]
+    expires_at: float
+    data: Any
+    _encoded: dict[Hashable, tuple[bytes, str]] = field(default_factory=dict)
+
+    def encode(self, key: Hashable, build: Callable[[], Any]) -> tuple[bytes, str]:
+        """
+        Возвращает JSON и его ETag для набора фильтров `key`,
+        сериализуя данные один раз на версию снимка.
+
+        :param key: Ключ набора фильтров.
+        :param build: Функция, строящая данные для сериализации.
+        :return: JSON в байтах и ETag.
+        """
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            body = encode_json(build())
+            encoded = self._encoded[key] = (body, make_etag(body))
+        return encoded
+
+
+class SnapshotCache:
+    """
+    Версионированный кэш снимка справочных таблиц в памяти процесса.
+
+    Снимок считается актуальным, пока не изменилась версия ни одной из таблиц
+    `tables` (см. `table_versions`) и не истёк `ttl`. TTL ограничивает
+    устаревание данных, изменённых в обход методов БД этого процесса
+    (другие воркеры, сиды, ручные правки).
+    """
+
+    def __init__(self, name: str, tables: tuple[str, ...], ttl: float):
+        self.name = name
+        self.tables = tables
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._snapshot: Snapshot | None = None
+        self._lock = asyncio.Lock()
+
+    def _current(self) -> Snapshot | None:
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and snapshot.expires_at > monotonic()
+            and snapshot.version == table_versions.get(*self.tables)
+        ):
+            return snapshot
+        return None
+
+    async def get(self, loader: Callable[[], Awaitable[Any]]) -> Snapshot:
+        """
+        Возвращает актуальный снимок, загружая его при необходимости.
+
+        :param loader: Функция загрузки данных из БД.
+        :return: Снимок.
+        """
+        snapshot = self._current()
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+
+        async with self._lock:
+            snapshot = self._current()
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+
+            self.misses += 1
+            version = table_versions.get(*self.tables)
+            snapshot = Snapshot(
+                version=version, expires_at=monotonic() + self.ttl, data=await loader()
+            )
+            # Если во время загрузки была запись, снимок может быть неполным:
+            # отдаём его этому запросу, но не сохраняем.
+            if table_versions.get(*self.tables) == version:
+                self._snapshot = snapshot
+            return snapshot
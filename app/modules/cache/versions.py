@@ -0,0 +1,20 @@
+class TableVersions:
+    """
+    Счётчики версий таблиц в памяти процесса.
+
+    Методы БД увеличивают версию таблицы после каждой успешной записи,
+    кэши сравнивают версию, с которой был построен снимок, с текущей.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+
+    def get(self, *tables: str) -> tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def bump(self, *tables: str) -> None:
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+
+table_versions = TableVersions()
@@ -0,0 +1,68 @@
+"""query indexes
+
+Revision ID: 3b7d2c9e41a6
+Revises: fc800a2d5006
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3b7d2c9e41a6"
+down_revision = "fc800a2d5006"
+branch_labels = None
+depends_on = None
+
+# (имя, таблица, колонки, условие частичного индекса)
+INDEXES = (
+    ("orders_created_at_id_idx", "orders", ["created_at", "id"], None),
+    (
+        "orders_user_id_created_at_id_idx",
+        "orders",
+        ["user_id", "created_at", "id"],
+        None,
+    ),
+    (
+        "orders_status_id_created_at_id_idx",
+        "orders",
+        ["status_id", "created_at", "id"],
+        None,
+    ),
+    # Очередь баристы: незавершённые заказы (3 - OrderStatus.COMPLETED_ID).
+    (
+        "orders_active_created_at_id_idx",
+        "orders",
+        ["created_at", "id"],
+        "status_id <> 3",
+    ),
+    (
+        "menu_items_category_id_is_available_idx",
+        "menu_items",
+        ["category_id", "is_available"],
+        None,
+    ),
+    ("order_menu_items_menu_item_id_idx", "order_menu_items", ["menu_item_id"], None),
+    ("users_role_id_idx", "users", ["role_id"], None),
+)
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY не блокирует запись в таблицы,
+    # но не может выполняться внутри транзакции.
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
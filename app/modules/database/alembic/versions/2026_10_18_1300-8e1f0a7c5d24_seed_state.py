@@ -0,0 +1,30 @@
+"""seed state
+
+Revision ID: 8e1f0a7c5d24
+Revises: 3b7d2c9e41a6
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "8e1f0a7c5d24"
+down_revision = "3b7d2c9e41a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "seed_state",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("checksum", sa.String(length=64), nullable=False),
+        sa.Column("applied_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name", name=op.f("seed_state_pkey")),
+    )
+
+
+def downgrade():
+    op.drop_table("seed_state")
@@ -1,21 +1,69 @@
-from sqlalchemy import MetaData, create_engine
+from functools import cache
+
+from sqlalchemy import Engine, MetaData, create_engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
 from modules.envs import settings
 
-engine = create_async_engine(
-    settings.database.link, pool_size=100, max_overflow=0, echo=settings.database.echo
-)
+from .pool import InstrumentedAsyncPool
+
+
+def create_engine_from_settings(link: str | None = None) -> AsyncEngine:
+    """
+    Асинхронный движок с параметрами пула из настроек.
+
+    :param link: URL базы данных вместо settings.database.link.
+    :return: Асинхронный движок.
+    """
+    sdb = settings.database
+    return create_async_engine(
+        link or sdb.link,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=sdb.pool_size,
+        max_overflow=sdb.max_overflow,
+        pool_timeout=sdb.pool_timeout,
+        pool_recycle=sdb.pool_recycle,
+        pool_pre_ping=sdb.pool_pre_ping,
+        echo=sdb.echo,
+    )
+
+
+engine = create_engine_from_settings()
 
 async_session = async_sessionmaker(
     engine,
     expire_on_commit=False,
 )
 
-sync_engine = create_engine(settings.database.link, echo=settings.database.echo)
-sync_session = sessionmaker(bind=sync_engine, expire_on_commit=False)
+
+@cache
+def get_sync_engine() -> Engine:
+    """
+    Синхронный движок, создаётся при первом обращении: API он не нужен.
+    Используется psycopg, поддерживающий и синхронный режим,
+    даже если DB_ENGINE - asyncpg.
+
+    :return: Синхронный движок.
+    """
+    return create_engine(
+        settings.database.make_link("psycopg"), echo=settings.database.echo
+    )
+
+
+@cache
+def get_sync_session() -> sessionmaker:
+    """
+    Фабрика синхронных сессий.
+
+    :return: Фабрика сессий над get_sync_engine().
+    """
+    return sessionmaker(bind=get_sync_engine(), expire_on_commit=False)
 
 
 async def drop_all_async():
@@ -37,6 +85,7 @@ def drop_all_sync():
     Синхронное удаление всех таблиц из базы данных.
     """
     try:
+        sync_engine = get_sync_engine()
         with sync_engine.connect() as conn:
             metadata = MetaData()
             metadata.reflect(bind=sync_engine)
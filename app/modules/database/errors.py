@@ -0,0 +1,52 @@
+from contextlib import asynccontextmanager
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Сообщения об ошибках по имени нарушенного ограничения.
+CONSTRAINT_MESSAGES = {
+    "roles_name_key": "Роль с таким именем уже существует.",
+    "users_pkey": "Пользователь уже существует.",
+    "users_username_key": "Имя пользователя уже занято.",
+    "users_role_id_fkey": "Роль не найдена.",
+    "delivery_methods_name_key": "Способ доставки с таким названием уже существует.",
+    "order_statuses_name_key": "Статус заказа с таким именем уже существует.",
+    "menu_categories_name_key": "Категория с таким названием уже существует.",
+    "menu_items_category_id_fkey": "Категория не найдена.",
+}
+
+
+def constraint_name(error: IntegrityError) -> str | None:
+    """
+    Имя нарушенного ограничения из ошибки драйвера.
+
+    :param error: Ошибка SQLAlchemy.
+    :return: Имя ограничения, если драйвер его сообщил.
+    """
+    # psycopg передаёт диагностику сервера в diag,
+    # asyncpg - в атрибутах исходного исключения.
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+    return getattr(error.orig.__cause__, "constraint_name", None)
+
+
+@asynccontextmanager
+async def integrity_errors(session: AsyncSession, **messages: str):
+    """
+    Превращает нарушение ограничения в ValueError с понятным сообщением.
+    Уникальность и ссылки проверяет сама база при записи,
+    без отдельного SELECT перед ней.
+
+    :param session: Сессия базы данных, откатывается при ошибке.
+    :param messages: Сообщения для ограничений вместо CONSTRAINT_MESSAGES.
+    """
+    try:
+        yield
+    except IntegrityError as e:
+        await session.rollback()
+        name = constraint_name(e)
+        message = messages.get(name, CONSTRAINT_MESSAGES.get(name))
+        if message is None:
+            raise
+        raise ValueError(message) from e
@@ -0,0 +1,167 @@
+"""
+Учёт SQL-запросов по событиям движка.
+
+Каждый запрос к базе учитывается в статистике текущего HTTP-запроса
+(`current_request`): число запросов, время в базе и количество выполнений
+каждого отпечатка SQL. Отпечаток - текст запроса без значений параметров
+и литералов. Запросы части HTTP-запросов (`DB_STATS_SAMPLE_RATE`)
+попадают в сводную статистику по отпечаткам `sql_stats`.
+"""
+
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+import random
+import re
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from modules.envs import settings
+
+_SPACES = re.compile(r"\s+")
+# Строки, числа и плейсхолдеры параметров asyncpg ($1) и psycopg (%(name)s, %s).
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|\$\d+|%\(\w+\)s|%s")
+# Списки значений IN (...) и VALUES разной длины дают один отпечаток.
+_LISTS = re.compile(r"\(\?(?:::\w+)?(?:, \?(?:::\w+)?)+\)")
+_ROWS = re.compile(r"\(\?, \.\.\.\)(?:, \(\?, \.\.\.\))+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Отпечаток SQL: текст без значений, одинаковый для запросов одной формы.
+
+    :param statement: SQL-запрос.
+    :return: Нормализованный текст запроса.
+    """
+    normalized = _LITERALS.sub("?", _SPACES.sub(" ", statement).strip())
+    normalized = _LISTS.sub("(?, ...)", normalized)
+    return _ROWS.sub("(?, ...), ...", normalized)
+
+
+@dataclass
+class RequestStats:
+    """SQL-статистика одного HTTP-запроса."""
+
+    sampled: bool = False
+    statements: int = 0
+    db_time: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Отпечатки, выполненные больше `threshold` раз - признак N+1.
+
+        :param threshold: Допустимое число повторов.
+        :return: Отпечатки и число их выполнений.
+        """
+        return [(fp, n) for fp, n in self.fingerprints.items() if n > threshold]
+
+
+@dataclass
+class FingerprintStats:
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    # Сколько HTTP-запросов выполнили этот отпечаток больше порога N+1.
+    n_plus_one: int = 0
+
+
+class SQLStats:
+    """
+    Сводная статистика по отпечаткам SQL.
+    Число отпечатков ограничено, чтобы память не росла неограниченно.
+    """
+
+    def __init__(self, max_fingerprints: int = 1000):
+        self.max_fingerprints = max_fingerprints
+        self._stats: dict[str, FingerprintStats] = {}
+
+    def _get(self, fp: str) -> FingerprintStats | None:
+        stats = self._stats.get(fp)
+        if stats is None and len(self._stats) < self.max_fingerprints:
+            stats = self._stats[fp] = FingerprintStats()
+        return stats
+
+    def add(self, fp: str, elapsed: float) -> None:
+        stats = self._get(fp)
+        if stats is not None:
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+
+    def flag_n_plus_one(self, fp: str) -> None:
+        stats = self._get(fp)
+        if stats is not None:
+            stats.n_plus_one += 1
+
+    def top(self, limit: int) -> list[dict]:
+        """
+        Отпечатки с наибольшим суммарным временем.
+
+        :param limit: Количество отпечатков.
+        :return: Статистика отпечатков, времена в миллисекундах.
+        """
+        ordered = sorted(
+            self._stats.items(), key=lambda item: item[1].total_time, reverse=True
+        )
+        return [
+            {
+                "fingerprint": fp,
+                "calls": stats.calls,
+                "total_ms": stats.total_time * 1000,
+                "mean_ms": stats.total_time / stats.calls * 1000 if stats.calls else 0,
+                "max_ms": stats.max_time * 1000,
+                "n_plus_one": stats.n_plus_one,
+            }
+            for fp, stats in ordered[:limit]
+        ]
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+current_request: ContextVar[RequestStats | None] = ContextVar(
+    "current_request", default=None
+)
+sql_stats = SQLStats()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._started_at = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started_at = getattr(context, "_started_at", None)
+    elapsed = perf_counter() - started_at if started_at is not None else 0.0
+    fp = fingerprint(statement)
+
+    stats = current_request.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_time += elapsed
+        stats.fingerprints[fp] += 1
+        sampled = stats.sampled
+    else:
+        # Запросы вне HTTP-запроса (прогрев кэшей, фоновые задачи).
+        sampled = random.random() < settings.database.stats_sample_rate
+    if sampled:
+        sql_stats.add(fp, elapsed)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подключает учёт SQL-запросов к движку.
+    Контекст запроса доступен в обработчиках событий: SQLAlchemy выполняет
+    их в greenlet с контекстом вызывающей задачи asyncio.
+
+    :param engine: Асинхронный движок.
+    """
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
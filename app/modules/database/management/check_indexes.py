@@ -0,0 +1,145 @@
+"""
+Проверяет по EXPLAIN, что горячие запросы из `methods/*.py` используют индексы.
+
+Методы вызываются как есть, их SQL перехватывается событием
+`before_cursor_execute` и передаётся в `EXPLAIN (FORMAT JSON)` с теми же
+параметрами. Последовательное сканирование отключается (`enable_seqscan`),
+чтобы проверка была осмысленной и на почти пустой базе разработки.
+Всё выполняется в транзакции, которая откатывается.
+
+Запуск: `pdm check-indexes`.
+"""
+
+import asyncio
+from datetime import datetime
+import json
+import sys
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.dataclasses import OrderStatus, Role
+
+from ..connect import engine
+from ..methods.menu_items import get_all_menu_items
+from ..methods.orders import (
+    encode_orders_cursor,
+    get_all_orders,
+    get_orders_by_user,
+    get_orders_page_json,
+)
+from ..methods.roles import get_users_by_role_id
+
+# (описание, вызов метода, ожидаемый индекс)
+CHECKS = (
+    (
+        "Все заказы, первая страница",
+        lambda session: get_all_orders(session),
+        "orders_created_at_id_idx",
+    ),
+    (
+        "Все заказы, следующая страница",
+        lambda session: get_all_orders(
+            session, cursor=encode_orders_cursor(datetime(2000, 1, 1), 0)
+        ),
+        "orders_created_at_id_idx",
+    ),
+    (
+        "Заказы пользователя",
+        lambda session: get_orders_by_user(1, session),
+        "orders_user_id_created_at_id_idx",
+    ),
+    (
+        "Заказы пользователя, JSON из Postgres",
+        lambda session: get_orders_page_json(session, user_id=1),
+        "orders_user_id_created_at_id_idx",
+    ),
+    (
+        "Заказы по статусу",
+        lambda session: get_all_orders(session, status_id=OrderStatus.PENDING_ID),
+        "orders_status_id_created_at_id_idx",
+    ),
+    (
+        "Очередь баристы",
+        lambda session: get_all_orders(session, active=True, oldest_first=True),
+        "orders_active_created_at_id_idx",
+    ),
+    (
+        "Меню по категории",
+        lambda session: get_all_menu_items(1, True, session),
+        "menu_items_category_id_is_available_idx",
+    ),
+    (
+        "Пользователи роли",
+        lambda session: get_users_by_role_id(Role.BARISTA_ID, session),
+        "users_role_id_idx",
+    ),
+)
+
+
+def collect_index_names(plan: dict) -> set[str]:
+    """
+    Собирает имена индексов из узлов плана запроса.
+
+    :param plan: Узел плана EXPLAIN (FORMAT JSON).
+    :return: Имена использованных индексов.
+    """
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= collect_index_names(child)
+    return names
+
+
+async def explain_indexes(connection, call) -> set[str]:
+    """
+    Выполняет метод и возвращает индексы из планов всех его запросов.
+
+    :param connection: Соединение с открытой транзакцией.
+    :param call: Вызов метода с сессией.
+    :return: Имена использованных индексов.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        await call(AsyncSession(bind=connection))
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+    names = set()
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar()
+        # asyncpg возвращает план строкой, psycopg - уже разобранным.
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        names |= collect_index_names(plan[0]["Plan"])
+    return names
+
+
+async def main() -> int:
+    failed = 0
+    async with engine.connect() as connection:
+        await connection.begin()
+        await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        for description, call, expected in CHECKS:
+            names = await explain_indexes(connection, call)
+            ok = expected in names
+            failed += not ok
+            used = ", ".join(sorted(names)) or "нет"
+            print(
+                f"[{'OK' if ok else 'FAIL'}] {description}: "
+                f"ожидался {expected}, использованы: {used}"
+            )
+        await connection.rollback()
+    await engine.dispose()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
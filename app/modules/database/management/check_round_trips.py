@@ -0,0 +1,232 @@
+"""
+Проверяет, что изменяющие методы из `methods/*.py` укладываются в один
+запрос к базе: INSERT/UPDATE/DELETE ... RETURNING без SELECT до и после.
+
+Запросы считаются событием `before_cursor_execute`. Методы вызываются
+в сессии поверх внешней транзакции (`join_transaction_mode=
+"create_savepoint"`): их commit и rollback работают с точками сохранения,
+а внешняя транзакция в конце откатывается. SAVEPOINT, RELEASE и
+ROLLBACK TO не учитываются - это служебные запросы проверки.
+
+Запуск: `pdm check-round-trips`.
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.dataclasses import Role
+
+from ..connect import engine
+from ..methods.delivery_methods import add_delivery_method, delete_delivery_method
+from ..methods.menu_categories import create_category, delete_category
+from ..methods.menu_items import (
+    create_menu_item,
+    delete_menu_item,
+    update_menu_item,
+    update_menu_item_availability,
+)
+from ..methods.order_statuses import (
+    add_order_status,
+    delete_order_status,
+    update_order_status_name,
+)
+from ..methods.orders import delete_order, update_order_status
+from ..methods.roles import add_role, delete_role, update_role_name
+from ..methods.users import add_user, change_user_role, update_username
+
+CHECK_NAME = "round-trip-check"
+CHECK_USER_ID = -100
+MISSING_ID = -1
+# Запросы проверки, которые не относятся к методам.
+SERVICE_STATEMENTS = ("SAVEPOINT", "RELEASE", "ROLLBACK TO")
+
+# (ключ результата, описание, вызов метода, ожидаемое число запросов).
+# Результаты сохраняются в state по ключу и нужны следующим проверкам.
+CHECKS = (
+    ("role", "Добавление роли", lambda s, st: add_role(CHECK_NAME, s), 1),
+    (
+        None,
+        "Добавление роли с занятым именем",
+        lambda s, st: add_role(CHECK_NAME, s),
+        1,
+    ),
+    (
+        None,
+        "Переименование роли",
+        lambda s, st: update_role_name(st["role"].id, f"{CHECK_NAME}-2", s),
+        1,
+    ),
+    (
+        None,
+        "Добавление пользователя",
+        lambda s, st: add_user(CHECK_USER_ID, st["role"].id, CHECK_NAME, s),
+        1,
+    ),
+    (
+        None,
+        "Смена имени пользователя",
+        lambda s, st: update_username(CHECK_USER_ID, f"{CHECK_NAME}-2", s),
+        1,
+    ),
+    (
+        None,
+        "Удаление роли, назначенной пользователю",
+        lambda s, st: delete_role(st["role"].id, s),
+        1,
+    ),
+    (
+        None,
+        "Смена роли пользователя",
+        lambda s, st: change_user_role(CHECK_USER_ID, Role.ADMIN_ID, s),
+        1,
+    ),
+    (None, "Удаление роли", lambda s, st: delete_role(st["role"].id, s), 1),
+    (
+        "delivery_method",
+        "Добавление способа доставки",
+        lambda s, st: add_delivery_method(CHECK_NAME, s),
+        1,
+    ),
+    (
+        None,
+        "Удаление способа доставки",
+        lambda s, st: delete_delivery_method(st["delivery_method"].id, s),
+        1,
+    ),
+    (
+        "status",
+        "Добавление статуса заказа",
+        lambda s, st: add_order_status(CHECK_NAME, s),
+        1,
+    ),
+    (
+        None,
+        "Переименование статуса заказа",
+        lambda s, st: update_order_status_name(st["status"].id, f"{CHECK_NAME}-2", s),
+        1,
+    ),
+    (
+        None,
+        "Удаление статуса заказа",
+        lambda s, st: delete_order_status(st["status"].id, s),
+        1,
+    ),
+    (
+        "category",
+        "Добавление категории",
+        lambda s, st: create_category(CHECK_NAME, s),
+        1,
+    ),
+    (
+        "item",
+        "Добавление позиции меню",
+        lambda s, st: create_menu_item(
+            CHECK_NAME, st["category"].id, 100, 100, True, s
+        ),
+        1,
+    ),
+    (
+        None,
+        "Добавление позиции в несуществующую категорию",
+        lambda s, st: create_menu_item(CHECK_NAME, MISSING_ID, 100, 100, True, s),
+        1,
+    ),
+    (
+        None,
+        "Изменение позиции меню",
+        lambda s, st: update_menu_item(
+            st["item"].id, f"{CHECK_NAME}-2", None, None, 150, None, s
+        ),
+        1,
+    ),
+    (
+        None,
+        "Изменение доступности позиции меню",
+        lambda s, st: update_menu_item_availability(st["item"].id, False, s),
+        1,
+    ),
+    (
+        None,
+        "Удаление позиции меню",
+        lambda s, st: delete_menu_item(st["item"].id, s),
+        1,
+    ),
+    (
+        None,
+        "Удаление категории",
+        lambda s, st: delete_category(st["category"].id, s),
+        1,
+    ),
+    (
+        None,
+        "Смена статуса несуществующего заказа",
+        lambda s, st: update_order_status(MISSING_ID, 1, s),
+        1,
+    ),
+    (
+        None,
+        "Удаление несуществующего заказа",
+        lambda s, st: delete_order(MISSING_ID, s),
+        1,
+    ),
+)
+
+
+async def count_statements(connection, call) -> tuple[int, object]:
+    """
+    Выполняет метод и считает его запросы к базе.
+
+    :param connection: Соединение с открытой транзакцией.
+    :param call: Вызов метода с сессией.
+    :return: Число запросов и результат метода (или ValueError метода).
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(SERVICE_STATEMENTS):
+            statements.append(statement)
+
+    session = AsyncSession(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        result = await call(session)
+    except ValueError as e:
+        result = e
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+        await session.close()
+    return len(statements), result
+
+
+async def main() -> int:
+    failed = 0
+    state = {}
+    async with engine.connect() as connection:
+        await connection.begin()
+        for key, description, call, expected in CHECKS:
+            count, result = await count_statements(
+                connection, lambda session: call(session, state)
+            )
+            if key is not None:
+                state[key] = result
+            ok = count == expected
+            failed += not ok
+            outcome = f" ({result})" if isinstance(result, ValueError) else ""
+            print(
+                f"[{'OK' if ok else 'FAIL'}] {description}: "
+                f"ожидалось запросов {expected}, выполнено {count}{outcome}"
+            )
+        await connection.rollback()
+    await engine.dispose()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,30 +1,47 @@
+import argparse
 import asyncio
 
-from sqlalchemy import delete, text
+from sqlalchemy import text
 
-from ..connect import async_session
+from ..connect import engine
 from ..core import Base
-from ..seeders.all_seeds import all_seeds
+from ..models import Order, OrderMenuItem
 
+# Таблицы, которые наполняет работа приложения, а не сиды.
+TRANSACTIONAL_TABLES = (Order.__table__, OrderMenuItem.__table__)
 
-async def remove_data_by_model_table(model):
-    async with async_session() as session:
-        # remove data.
-        await session.execute(delete(model))
 
-        # setup sequence value to start.
-        if type(model) == type(Base):
-            await session.execute(
-                text(
-                    "select setval('{}_id_seq', 1, false);".format(model.__tablename__)
-                )
-            )
-        await session.commit()
+async def truncate_tables(tables) -> None:
+    """
+    Очищает таблицы одним TRUNCATE ... RESTART IDENTITY CASCADE:
+    без построчного удаления и с возвратом последовательностей к началу.
+
+    :param tables: Таблицы для очистки.
+    """
+    quote = engine.dialect.identifier_preparer.quote
+    names = ", ".join(quote(table.name) for table in tables)
+    async with engine.begin() as connection:
+        await connection.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
 
 
 async def main():
-    for model, _, _ in all_seeds:
-        await remove_data_by_model_table(model)
+    parser = argparse.ArgumentParser(description="Очистка базы данных.")
+    parser.add_argument(
+        "--transactional-only",
+        action="store_true",
+        help="Очистить только заказы, сохранив справочники и пользователей.",
+    )
+    args = parser.parse_args()
+
+    # Вместе со всеми таблицами очищается и seed_state,
+    # поэтому следующий apply-seeds применит сиды заново.
+    if args.transactional_only:
+        tables = TRANSACTIONAL_TABLES
+    else:
+        tables = tuple(Base.metadata.tables.values())
+    await truncate_tables(tables)
+    await engine.dispose()
+    print(f"Очищены таблицы: {', '.join(table.name for table in tables)}.")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,10 @@
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from modules.cache import table_versions
+
+from ..errors import integrity_errors
 from ..models import DeliveryMethod
 
 
@@ -12,16 +16,13 @@ async def add_delivery_method(name: str, session: AsyncSession) -> DeliveryMetho
     :param session: Сессия базы данных.
     :return: Объект способа доставки.
     """
-    existing_method = await session.execute(
-        select(DeliveryMethod).where(DeliveryMethod.name == name)
-    )
-    if existing_method.scalars().first():
-        raise ValueError("Способ доставки с таким названием уже существует.")
-
-    new_method = DeliveryMethod(name=name)
-    session.add(new_method)
-    await session.commit()
-    await session.refresh(new_method)
+    async with integrity_errors(session):
+        result = await session.scalars(
+            insert(DeliveryMethod).values(name=name).returning(DeliveryMethod)
+        )
+        new_method = result.one()
+        await session.commit()
+    table_versions.bump(DeliveryMethod.__tablename__)
     return new_method
 
 
@@ -48,7 +49,7 @@ async def get_all_delivery_methods(session: AsyncSession) -> list[DeliveryMethod
     :param session: Сессия базы данных.
     :return: Список всех способов доставки.
     """
-    result = await session.execute(select(DeliveryMethod))
+    result = await session.execute(select(DeliveryMethod).order_by(DeliveryMethod.id))
     return result.scalars().all()
 
 
@@ -62,14 +63,18 @@ async def delete_delivery_method(
     :param session: Сессия базы данных.
     :return: True, если удалён, иначе False.
     """
-    result = await session.execute(
-        select(DeliveryMethod).where(DeliveryMethod.id == delivery_method_id)
-    )
-    delivery_method = result.scalars().first()
-
-    if not delivery_method:
-        return False
-
-    await session.delete(delivery_method)
-    await session.commit()
-    return True
+    async with integrity_errors(
+        session,
+        orders_delivery_method_id_fkey="Способ доставки используется в заказах.",
+    ):
+        result = await session.execute(
+            delete(DeliveryMethod)
+            .where(DeliveryMethod.id == delivery_method_id)
+            .returning(DeliveryMethod.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        await session.commit()
+    if deleted:
+        table_versions.bump(DeliveryMethod.__tablename__)
+    return deleted
@@ -1,7 +1,11 @@
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from ..models import MenuCategory
+from modules.cache import table_versions
+
+from ..errors import integrity_errors
+from ..models import MenuCategory, MenuItem
 
 
 async def get_all_categories(session: AsyncSession) -> list[MenuCategory]:
@@ -23,15 +27,13 @@ async def create_category(name: str, session: AsyncSession) -> MenuCategory:
     :param session: Сессия базы данных.
     :return: Объект новой категории.
     """
-    existing = await session.execute(
-        select(MenuCategory).where(MenuCategory.name == name)
-    )
-    if existing.scalars().first():
-        raise ValueError("Категория с таким названием уже существует.")
-    category = MenuCategory(name=name)
-    session.add(category)
-    await session.commit()
-    await session.refresh(category)
+    async with integrity_errors(session):
+        result = await session.scalars(
+            insert(MenuCategory).values(name=name).returning(MenuCategory)
+        )
+        category = result.one()
+        await session.commit()
+    table_versions.bump(MenuCategory.__tablename__)
     return category
 
 
@@ -43,8 +45,15 @@ async def delete_category(category_id: int, session: AsyncSession) -> None:
     :param session: Сессия базы данных.
     :return: None
     """
-    category = await session.get(MenuCategory, category_id)
-    if not category:
+    result = await session.execute(
+        delete(MenuCategory)
+        .where(MenuCategory.id == category_id)
+        .returning(MenuCategory.id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.scalar_one_or_none() is None:
+        await session.rollback()
         raise ValueError("Категория не найдена.")
-    await session.delete(category)
     await session.commit()
+    # Позиции категории удаляет каскадом сама база (ON DELETE CASCADE).
+    table_versions.bump(MenuCategory.__tablename__, MenuItem.__tablename__)
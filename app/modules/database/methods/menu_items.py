@@ -1,26 +1,69 @@
+from sqlalchemy import delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from ..models import MenuItem
+from modules.cache import table_versions
+
+from ..errors import integrity_errors
+from ..models import MenuCategory, MenuItem
+from ..read_models import MenuItemRow
 
 
 async def get_all_menu_items(
-    category_id: int, is_available: bool, session: AsyncSession
-) -> list[MenuItem]:
+    category_id: int,
+    is_available: bool,
+    session: AsyncSession,
+    ids: list[int] | None = None,
+) -> list[MenuItemRow]:
     """
-    Возвращает список всех позиций меню.
+    Возвращает список всех позиций меню без загрузки ORM-объектов.
+    Если передан `ids`, возвращает только позиции с этими ID.
     """
     query_conditions = []
     if category_id:
         query_conditions.append(MenuItem.category_id == category_id)
     if is_available is not None:
         query_conditions.append(MenuItem.is_available == is_available)
+    if ids:
+        query_conditions.append(MenuItem.id.in_(ids))
+
+    result = await session.execute(
+        select(
+            MenuItem.id,
+            MenuItem.name,
+            MenuItem.category_id,
+            MenuItem.weight,
+            MenuItem.price,
+            MenuItem.is_available,
+        ).where(*query_conditions)
+    )
+    return [MenuItemRow(*row) for row in result]
+
 
-    if query_conditions:
-        result = await session.execute(select(MenuItem).where(*query_conditions))
-    else:
-        result = await session.execute(select(MenuItem))
-    return result.scalars().all()
+async def get_menu_snapshot(session: AsyncSession) -> dict[str, list[dict]]:
+    """
+    Загружает все категории и позиции меню для кэша меню.
+
+    :param session: Сессия базы данных.
+    :return: Категории и позиции меню в виде словарей.
+    """
+    categories = await session.execute(
+        select(MenuCategory.id, MenuCategory.name).order_by(MenuCategory.id)
+    )
+    items = await session.execute(
+        select(
+            MenuItem.id,
+            MenuItem.name,
+            MenuItem.category_id,
+            MenuItem.weight,
+            MenuItem.price,
+            MenuItem.is_available,
+        ).order_by(MenuItem.id)
+    )
+    return {
+        "categories": [dict(row._mapping) for row in categories],
+        "items": [dict(row._mapping) for row in items],
+    }
 
 
 async def get_menu_item_by_id(item_id: int, session: AsyncSession) -> MenuItem | None:
@@ -41,16 +84,21 @@ async def create_menu_item(
     """
     Создаёт новую позицию в меню.
     """
-    item = MenuItem(
-        name=name,
-        category_id=category_id,
-        weight=weight,
-        price=price,
-        is_available=is_available,
-    )
-    session.add(item)
-    await session.commit()
-    await session.refresh(item)
+    async with integrity_errors(session):
+        result = await session.scalars(
+            insert(MenuItem)
+            .values(
+                name=name,
+                category_id=category_id,
+                weight=weight,
+                price=price,
+                is_available=is_available,
+            )
+            .returning(MenuItem)
+        )
+        item = result.one()
+        await session.commit()
+    table_versions.bump(MenuItem.__tablename__)
     return item
 
 
@@ -66,24 +114,17 @@ async def update_menu_item(
     """
     Обновляет данные позиции меню.
     """
-    item = await session.get(MenuItem, item_id)
-    if not item:
-        return None
-
-    if name is not None:
-        item.name = name
-    if category_id is not None:
-        item.category_id = category_id
-    if weight is not None:
-        item.weight = weight
-    if price is not None:
-        item.price = price
-    if is_available is not None:
-        item.is_available = is_available
-
-    await session.commit()
-    await session.refresh(item)
-    return item
+    values = {
+        "name": name,
+        "category_id": category_id,
+        "weight": weight,
+        "price": price,
+        "is_available": is_available,
+    }
+    values = {key: value for key, value in values.items() if value is not None}
+    if not values:
+        return await get_menu_item_by_id(item_id, session)
+    return await _update_menu_item(item_id, session, **values)
 
 
 async def update_menu_item_availability(
@@ -92,13 +133,27 @@ async def update_menu_item_availability(
     """
     Обновляет доступность позиции меню.
     """
-    item = await session.get(MenuItem, item_id)
-    if not item:
-        return None
+    return await _update_menu_item(item_id, session, is_available=is_available)
 
-    item.is_available = is_available
-    await session.commit()
-    await session.refresh(item)
+
+async def _update_menu_item(
+    item_id: int, session: AsyncSession, **values
+) -> MenuItem | None:
+    """
+    Обновляет поля позиции меню одним UPDATE ... RETURNING.
+    """
+    async with integrity_errors(session):
+        result = await session.scalars(
+            update(MenuItem)
+            .where(MenuItem.id == item_id)
+            .values(**values)
+            .returning(MenuItem)
+            .execution_options(synchronize_session=False)
+        )
+        item = result.one_or_none()
+        await session.commit()
+    if item:
+        table_versions.bump(MenuItem.__tablename__)
     return item
 
 
@@ -106,8 +161,14 @@ async def delete_menu_item(item_id: int, session: AsyncSession):
     """
     Удаляет позицию меню по её ID.
     """
-    item = await session.get(MenuItem, item_id)
-    if not item:
+    result = await session.execute(
+        delete(MenuItem)
+        .where(MenuItem.id == item_id)
+        .returning(MenuItem.id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.scalar_one_or_none() is None:
+        await session.rollback()
         raise ValueError("Позиция меню не найдена.")
-    await session.delete(item)
     await session.commit()
+    table_versions.bump(MenuItem.__tablename__)
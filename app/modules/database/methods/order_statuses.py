@@ -1,6 +1,10 @@
+from sqlalchemy import delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from modules.cache import table_versions
+
+from ..errors import integrity_errors
 from ..models import OrderStatus
 
 
@@ -12,15 +16,13 @@ async def add_order_status(name: str, session: AsyncSession) -> OrderStatus:
     :param session: Сессия базы данных.
     :return: Объект нового статуса заказа.
     """
-    existing_status = await session.execute(
-        select(OrderStatus).where(OrderStatus.name == name)
-    )
-    if existing_status.scalars().first():
-        raise ValueError("Статус заказа с таким именем уже существует.")
-    new_status = OrderStatus(name=name)
-    session.add(new_status)
-    await session.commit()
-    await session.refresh(new_status)
+    async with integrity_errors(session):
+        result = await session.scalars(
+            insert(OrderStatus).values(name=name).returning(OrderStatus)
+        )
+        new_status = result.one()
+        await session.commit()
+    table_versions.bump(OrderStatus.__tablename__)
     return new_status
 
 
@@ -47,7 +49,7 @@ async def get_all_order_statuses(session: AsyncSession) -> list[OrderStatus]:
     :param session: Сессия базы данных.
     :return: Список всех статусов заказов.
     """
-    result = await session.execute(select(OrderStatus))
+    result = await session.execute(select(OrderStatus).order_by(OrderStatus.id))
     return result.scalars().all()
 
 
@@ -62,19 +64,18 @@ async def update_order_status_name(
     :param session: Сессия базы данных.
     :return: Объект статуса заказа с обновленным именем, если найден, иначе None.
     """
-    result = await session.execute(
-        select(OrderStatus).where(OrderStatus.id == status_id)
-    )
-    status = result.scalars().first()
-    if status:
-        existing_status = await session.execute(
-            select(OrderStatus).where(OrderStatus.name == new_name)
+    async with integrity_errors(session):
+        result = await session.scalars(
+            update(OrderStatus)
+            .where(OrderStatus.id == status_id)
+            .values(name=new_name)
+            .returning(OrderStatus)
+            .execution_options(synchronize_session=False)
         )
-        if existing_status.scalars().first():
-            raise ValueError("Статус заказа с таким именем уже существует.")
-        status.name = new_name
+        status = result.one_or_none()
         await session.commit()
-        await session.refresh(status)
+    if status:
+        table_versions.bump(OrderStatus.__tablename__)
     return status
 
 
@@ -86,9 +87,17 @@ async def delete_order_status(status_id: int, session: AsyncSession) -> bool:
     :param session: Сессия базы данных.
     :return: True, если статус заказа удален, иначе False.
     """
-    status = await session.get(OrderStatus, status_id)
-    if not status:
-        return False
-    await session.delete(status)
-    await session.commit()
-    return True
+    async with integrity_errors(
+        session, orders_status_id_fkey="Статус заказа используется в заказах."
+    ):
+        result = await session.execute(
+            delete(OrderStatus)
+            .where(OrderStatus.id == status_id)
+            .returning(OrderStatus.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        await session.commit()
+    if deleted:
+        table_versions.bump(OrderStatus.__tablename__)
+    return deleted
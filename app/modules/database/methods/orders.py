@@ -1,14 +1,135 @@
-from typing import Literal
-
-from sqlalchemy import insert
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import AsyncIterator, Literal
+
+from sqlalchemy import (
+    Integer,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from back.schemas.orders import MenuItemInOrder
+from modules.dataclasses import OrderStatus as OrderStatusData
 
 from ..models import DeliveryMethod, MenuItem, Order, OrderMenuItem, OrderStatus
 
+ORDERS_PAGE_SIZE = 20
+ORDERS_PAGE_SIZE_MAX = 100
+# Сколько строк выгрузки заказов за раз забирать из серверного курсора.
+ORDERS_EXPORT_BATCH = 1000
+
+
+def encode_orders_cursor(created_at: datetime, order_id: int) -> str:
+    """
+    Кодирует позицию последнего заказа страницы в курсор.
+
+    :param created_at: Дата создания последнего заказа страницы.
+    :param order_id: ID последнего заказа страницы.
+    :return: Непрозрачная строка курсора.
+    """
+    raw = f"{created_at.isoformat()}|{order_id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_orders_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Декодирует курсор, полученный из `encode_orders_cursor`.
+
+    :param cursor: Строка курсора.
+    :return: Дата создания и ID заказа, после которых начинается страница.
+    """
+    try:
+        created_at, order_id = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(order_id)
+    except ValueError:
+        raise ValueError("Некорректный курсор.")
+
+
+def _select_orders():
+    """
+    Запрос заказов с названиями способа доставки и статуса.
+    Строки Core-запроса вместо ORM-объектов: заказы только читаются.
+    """
+    return (
+        select(
+            Order.id,
+            Order.user_id,
+            Order.delivery_method_id,
+            DeliveryMethod.name.label("delivery_method_name"),
+            Order.status_id,
+            OrderStatus.name.label("status_name"),
+            Order.total_price,
+            Order.created_at,
+        )
+        .join(DeliveryMethod, DeliveryMethod.id == Order.delivery_method_id)
+        .join(OrderStatus, OrderStatus.id == Order.status_id)
+    )
+
+
+def _order_to_dict(order, items: list[dict]) -> dict:
+    return {
+        "id": order.id,
+        "user_id": order.user_id,
+        "delivery_method_id": order.delivery_method_id,
+        "delivery_method_name": order.delivery_method_name,
+        "status_id": order.status_id,
+        "status_name": order.status_name,
+        "total_price": order.total_price,
+        "created_at": order.created_at,
+        "items": items,
+    }
+
+
+async def _load_order_lines(
+    order_ids: list[int], session: AsyncSession
+) -> dict[int, list[dict]]:
+    """
+    Загружает позиции заказов одним запросом к order_menu_items и menu_items.
+
+    :param order_ids: ID заказов.
+    :param session: Сессия базы данных.
+    :return: Позиции каждого заказа по его ID.
+    """
+    lines = {order_id: [] for order_id in order_ids}
+    if not order_ids:
+        return lines
+
+    result = await session.execute(
+        select(
+            OrderMenuItem.order_id,
+            OrderMenuItem.menu_item_id,
+            OrderMenuItem.quantity,
+            MenuItem.name,
+            MenuItem.price,
+        )
+        .join(MenuItem, MenuItem.id == OrderMenuItem.menu_item_id)
+        .where(OrderMenuItem.order_id.in_(order_ids))
+        # Тот же порядок позиций, что и в get_orders_page_json.
+        .order_by(OrderMenuItem.order_id, OrderMenuItem.menu_item_id)
+    )
+    for row in result:
+        lines[row.order_id].append(
+            {
+                "menu_item_id": row.menu_item_id,
+                "name": row.name,
+                "price": row.price,
+                "quantity": row.quantity,
+            }
+        )
+    return lines
+
 
 async def create_order_with_items(
     user_id: int,
@@ -39,53 +160,91 @@ async def create_order_with_items(
     :param session: Сессия базы данных.
     :return: Информация о созданном заказе.
     """
-    delivery_method = await session.get(DeliveryMethod, delivery_method_id)
-    if not delivery_method:
-        raise ValueError("Способ доставки не найден.")
+    # Повторяющиеся позиции объединяем: (order_id, menu_item_id) - первичный ключ.
+    quantities: dict[int, int] = {}
+    for item in items:
+        quantities[item.menu_item_id] = (
+            quantities.get(item.menu_item_id, 0) + item.quantity
+        )
+    if not quantities:
+        raise ValueError("Заказ не содержит позиций.")
 
-    status = await session.get(OrderStatus, status_id)
-    if not status:
+    result = await session.execute(
+        select(
+            select(DeliveryMethod.name)
+            .where(DeliveryMethod.id == delivery_method_id)
+            .scalar_subquery(),
+            select(OrderStatus.name)
+            .where(OrderStatus.id == status_id)
+            .scalar_subquery(),
+        )
+    )
+    delivery_method_name, status_name = result.one()
+    if delivery_method_name is None:
+        raise ValueError("Способ доставки не найден.")
+    if status_name is None:
         raise ValueError("Статус заказа не найден.")
 
+    result = await session.execute(
+        select(MenuItem.id, MenuItem.name, MenuItem.price, MenuItem.is_available).where(
+            MenuItem.id.in_(quantities)
+        )
+    )
+    menu_items = {row.id: row for row in result}
+
     total_price = 0
     order_items = []
-    for item in items:
-        menu_item = await session.get(MenuItem, item.menu_item_id)
+    for menu_item_id, quantity in quantities.items():
+        menu_item = menu_items.get(menu_item_id)
         if not menu_item:
-            raise ValueError(f"Позиция меню с ID {item.menu_item_id} не найдена.")
-        total_price += menu_item.price * item.quantity
-        order_items.append({"menu_item_id": menu_item.id, "quantity": item.quantity})
+            raise ValueError(f"Позиция меню с ID {menu_item_id} не найдена.")
+        if not menu_item.is_available:
+            raise ValueError(f"Позиция меню с ID {menu_item_id} недоступна.")
+        total_price += menu_item.price * quantity
+        order_items.append(
+            {
+                "menu_item_id": menu_item_id,
+                "name": menu_item.name,
+                "price": menu_item.price,
+                "quantity": quantity,
+            }
+        )
 
-    new_order = Order(
-        user_id=user_id,
-        delivery_method_id=delivery_method_id,
-        total_price=total_price,
-        status_id=status_id,
+    result = await session.execute(
+        insert(Order)
+        .values(
+            user_id=user_id,
+            delivery_method_id=delivery_method_id,
+            total_price=total_price,
+            status_id=status_id,
+        )
+        .returning(Order.id, Order.created_at)
     )
-    session.add(new_order)
-    await session.commit()
+    order_id, created_at = result.one()
 
-    for order_item in order_items:
-        await session.execute(
-            insert(OrderMenuItem).values(
-                order_id=new_order.id,
-                menu_item_id=order_item["menu_item_id"],
-                quantity=order_item["quantity"],
-            )
+    await session.execute(
+        insert(OrderMenuItem).values(
+            [
+                {
+                    "order_id": order_id,
+                    "menu_item_id": order_item["menu_item_id"],
+                    "quantity": order_item["quantity"],
+                }
+                for order_item in order_items
+            ]
         )
-
+    )
     await session.commit()
-    await session.refresh(new_order)
 
     return {
-        "id": new_order.id,
-        "user_id": new_order.user_id,
-        "delivery_method_id": new_order.delivery_method_id,
-        "delivery_method_name": new_order.delivery_method.name,
-        "status_id": new_order.status_id,
-        "status_name": new_order.status.name,
-        "total_price": new_order.total_price,
-        "created_at": new_order.created_at,
+        "id": order_id,
+        "user_id": user_id,
+        "delivery_method_id": delivery_method_id,
+        "delivery_method_name": delivery_method_name,
+        "status_id": status_id,
+        "status_name": status_name,
+        "total_price": total_price,
+        "created_at": created_at,
         "items": order_items,
     }
 
@@ -114,143 +273,311 @@ async def get_order_by_id(order_id: int, session: AsyncSession) -> (
     :param session: Сессия базы данных.
     :return: Информация о заказе, если найден, иначе None.
     """
-    result = await session.execute(
-        select(Order)
-        .options(
-            selectinload(Order.delivery_method),
-            selectinload(Order.status),
-            selectinload(Order.menu_items).selectinload(MenuItem.order_menu_items),
-        )
-        .where(Order.id == order_id)
-    )
-    order = result.scalars().first()
+    result = await session.execute(_select_orders().where(Order.id == order_id))
+    order = result.first()
 
     if not order:
         return None
 
-    return {
-        "id": order.id,
-        "user_id": order.user_id,
-        "delivery_method_id": order.delivery_method_id,
-        "delivery_method_name": order.delivery_method.name,
-        "status_id": order.status_id,
-        "status_name": order.status.name,
-        "total_price": order.total_price,
-        "created_at": order.created_at,
-        "items": [
-            {
-                "menu_item_id": item.id,
-                "name": item.name,
-                "price": item.price,
-                "quantity": next(
-                    (
-                        omi.quantity
-                        for omi in item.order_menu_items
-                        if omi.order_id == order.id
-                    ),
-                    1,
-                ),
-            }
-            for item in order.menu_items
-        ],
-    }
+    lines = await _load_order_lines([order.id], session)
+    return _order_to_dict(order, lines[order.id])
 
 
-async def get_all_orders(session: AsyncSession) -> list[dict]:
+def _orders_conditions(
+    cursor: str | None = None,
+    status_id: int | None = None,
+    user_id: int | None = None,
+    delivery_method_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    active: bool = False,
+    oldest_first: bool = False,
+) -> list:
+    """
+    Условия выборки страницы заказов (см. `get_all_orders`).
+    """
+    query_conditions = []
+    if status_id is not None:
+        query_conditions.append(Order.status_id == status_id)
+    if active:
+        # Условие подставляется в SQL литералом, а не параметром:
+        # только так планировщик сопоставит его с частичным индексом
+        # orders_active_created_at_id_idx.
+        completed_id = literal(OrderStatusData.COMPLETED_ID, literal_execute=True)
+        query_conditions.append(Order.status_id != completed_id)
+    if user_id is not None:
+        query_conditions.append(Order.user_id == user_id)
+    if delivery_method_id is not None:
+        query_conditions.append(Order.delivery_method_id == delivery_method_id)
+    if created_from is not None:
+        query_conditions.append(Order.created_at >= created_from)
+    if created_to is not None:
+        query_conditions.append(Order.created_at < created_to)
+    if cursor:
+        position = tuple_(Order.created_at, Order.id)
+        last = tuple_(*decode_orders_cursor(cursor))
+        query_conditions.append(position > last if oldest_first else position < last)
+    return query_conditions
+
+
+def _orders_order_by(created_at, order_id, oldest_first: bool) -> tuple:
     """
-    Получает все заказы.
+    Порядок страниц заказов: по умолчанию от новых к старым,
+    с `oldest_first` - от старых к новым (очередь баристы).
+    """
+    if oldest_first:
+        return created_at, order_id
+    return created_at.desc(), order_id.desc()
+
+
+async def get_all_orders(
+    session: AsyncSession,
+    limit: int = ORDERS_PAGE_SIZE,
+    cursor: str | None = None,
+    status_id: int | None = None,
+    user_id: int | None = None,
+    delivery_method_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    active: bool = False,
+    oldest_first: bool = False,
+) -> tuple[list[dict], str | None]:
+    """
+    Получает страницу заказов, упорядоченных по (created_at, id):
+    по умолчанию от новых к старым.
 
     :param session: Сессия базы данных.
-    :return: Список всех заказов.
+    :param limit: Размер страницы.
+    :param cursor: Курсор предыдущей страницы, None для первой страницы.
+    :param status_id: Фильтр по ID статуса заказа.
+    :param user_id: Фильтр по ID пользователя.
+    :param delivery_method_id: Фильтр по ID способа доставки.
+    :param created_from: Нижняя граница даты создания (включительно).
+    :param created_to: Верхняя граница даты создания (не включительно).
+    :param active: Только незавершённые заказы.
+    :param oldest_first: Страницы от старых заказов к новым.
+    :return: Заказы страницы и курсор следующей страницы (None, если её нет).
     """
+    query_conditions = _orders_conditions(
+        cursor=cursor,
+        status_id=status_id,
+        user_id=user_id,
+        delivery_method_id=delivery_method_id,
+        created_from=created_from,
+        created_to=created_to,
+        active=active,
+        oldest_first=oldest_first,
+    )
+
     result = await session.execute(
-        select(Order).options(
-            selectinload(Order.delivery_method),
-            selectinload(Order.status),
-            selectinload(Order.menu_items).selectinload(MenuItem.order_menu_items),
-        )
+        _select_orders()
+        .where(*query_conditions)
+        .order_by(*_orders_order_by(Order.created_at, Order.id, oldest_first))
+        .limit(limit + 1)
     )
-    orders = result.scalars().all()
-
-    return [
-        {
-            "id": order.id,
-            "user_id": order.user_id,
-            "delivery_method_id": order.delivery_method_id,
-            "delivery_method_name": order.delivery_method.name,
-            "status_id": order.status_id,
-            "status_name": order.status.name,
-            "total_price": order.total_price,
-            "created_at": order.created_at,
-            "items": [
-                {
-                    "menu_item_id": item.id,
-                    "name": item.name,
-                    "price": item.price,
-                    "quantity": next(
-                        (
-                            omi.quantity
-                            for omi in item.order_menu_items
-                            if omi.order_id == order.id
-                        ),
-                        1,
-                    ),
-                }
-                for item in order.menu_items
-            ],
-        }
-        for order in orders
-    ]
+    orders = result.all()
+
+    next_cursor = None
+    if len(orders) > limit:
+        orders = orders[:limit]
+        next_cursor = encode_orders_cursor(orders[-1].created_at, orders[-1].id)
+
+    lines = await _load_order_lines([order.id for order in orders], session)
+    return [_order_to_dict(order, lines[order.id]) for order in orders], next_cursor
 
 
-async def get_orders_by_user(user_id: int, session: AsyncSession) -> list[dict]:
+async def get_orders_by_user(
+    user_id: int,
+    session: AsyncSession,
+    limit: int = ORDERS_PAGE_SIZE,
+    cursor: str | None = None,
+) -> tuple[list[dict], str | None]:
     """
-    Получает все заказы пользователя.
+    Получает страницу заказов пользователя.
 
     :param user_id: ID пользователя.
     :param session: Сессия базы данных.
-    :return: Список всех заказов пользователя.
+    :param limit: Размер страницы.
+    :param cursor: Курсор предыдущей страницы, None для первой страницы.
+    :return: Заказы страницы и курсор следующей страницы (None, если её нет).
     """
-    result = await session.execute(
+    return await get_all_orders(
+        session=session, limit=limit, cursor=cursor, user_id=user_id
+    )
+
+
+async def get_orders_page_json(
+    session: AsyncSession,
+    limit: int = ORDERS_PAGE_SIZE,
+    cursor: str | None = None,
+    status_id: int | None = None,
+    user_id: int | None = None,
+    delivery_method_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    active: bool = False,
+    oldest_first: bool = False,
+) -> tuple[bytes, str | None]:
+    """
+    Получает страницу заказов (как `get_all_orders`) уже сериализованной в JSON.
+    Документ каждого заказа с позициями собирает Postgres
+    (json_build_object/json_agg), и драйвер возвращает его текстом:
+    ORM-объекты и словари не создаются.
+
+    Документы совпадают с `get_all_orders` по содержимому, но не побайтно:
+    Postgres не дописывает нули в дробной части цены и секунд.
+
+    :param session: Сессия базы данных.
+    :param limit: Размер страницы.
+    :param cursor: Курсор предыдущей страницы, None для первой страницы.
+    :param status_id: Фильтр по ID статуса заказа.
+    :param user_id: Фильтр по ID пользователя.
+    :param delivery_method_id: Фильтр по ID способа доставки.
+    :param created_from: Нижняя граница даты создания (включительно).
+    :param created_to: Верхняя граница даты создания (не включительно).
+    :param active: Только незавершённые заказы.
+    :param oldest_first: Страницы от старых заказов к новым.
+    :return: JSON-массив заказов страницы и курсор следующей страницы.
+    """
+    query_conditions = _orders_conditions(
+        cursor=cursor,
+        status_id=status_id,
+        user_id=user_id,
+        delivery_method_id=delivery_method_id,
+        created_from=created_from,
+        created_to=created_to,
+        active=active,
+        oldest_first=oldest_first,
+    )
+    page = (
         select(Order)
-        .options(
-            selectinload(Order.delivery_method),
-            selectinload(Order.status),
-            selectinload(Order.menu_items).selectinload(MenuItem.order_menu_items),
+        .where(*query_conditions)
+        .order_by(*_orders_order_by(Order.created_at, Order.id, oldest_first))
+        .limit(limit + 1)
+        .subquery("page")
+    )
+    line = func.json_build_object(
+        "menu_item_id",
+        OrderMenuItem.menu_item_id,
+        "name",
+        MenuItem.name,
+        "price",
+        MenuItem.price,
+        "quantity",
+        OrderMenuItem.quantity,
+    )
+    items = (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(line, OrderMenuItem.menu_item_id)),
+                literal_column("'[]'::json"),
+            )
+        )
+        .join(MenuItem, MenuItem.id == OrderMenuItem.menu_item_id)
+        .where(OrderMenuItem.order_id == page.c.id)
+        .scalar_subquery()
+    )
+    document = func.json_build_object(
+        "id",
+        page.c.id,
+        "user_id",
+        page.c.user_id,
+        "delivery_method_id",
+        page.c.delivery_method_id,
+        "delivery_method_name",
+        DeliveryMethod.name,
+        "status_id",
+        page.c.status_id,
+        "status_name",
+        OrderStatus.name,
+        "total_price",
+        page.c.total_price,
+        "created_at",
+        page.c.created_at,
+        "items",
+        items,
+    )
+    result = await session.execute(
+        select(page.c.created_at, page.c.id, cast(document, Text))
+        .join(DeliveryMethod, DeliveryMethod.id == page.c.delivery_method_id)
+        .join(OrderStatus, OrderStatus.id == page.c.status_id)
+        .order_by(*_orders_order_by(page.c.created_at, page.c.id, oldest_first))
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_orders_cursor(rows[-1][0], rows[-1][1])
+    return b"[" + ",".join(row[2] for row in rows).encode() + b"]", next_cursor
+
+
+async def stream_orders(
+    session: AsyncSession,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    batch_size: int = ORDERS_EXPORT_BATCH,
+) -> AsyncIterator[dict]:
+    """
+    Построчно отдаёт заказы с позициями через серверный курсор.
+    В памяти одновременно находится не больше `batch_size` строк,
+    независимо от размера выгрузки.
+
+    :param session: Сессия базы данных.
+    :param created_from: Нижняя граница даты создания (включительно).
+    :param created_to: Верхняя граница даты создания (не включительно).
+    :param batch_size: Размер пачки строк, забираемой из курсора.
+    :return: Асинхронный итератор заказов в порядке (created_at, id).
+    """
+    query_conditions = []
+    if created_from is not None:
+        query_conditions.append(Order.created_at >= created_from)
+    if created_to is not None:
+        query_conditions.append(Order.created_at < created_to)
+
+    # Одна строка на позицию заказа; строки одного заказа идут подряд.
+    result = await session.stream(
+        _select_orders()
+        .add_columns(
+            OrderMenuItem.menu_item_id,
+            OrderMenuItem.quantity,
+            MenuItem.name.label("menu_item_name"),
+            MenuItem.price,
         )
-        .where(Order.user_id == user_id)
+        .outerjoin(OrderMenuItem, OrderMenuItem.order_id == Order.id)
+        .outerjoin(MenuItem, MenuItem.id == OrderMenuItem.menu_item_id)
+        .where(*query_conditions)
+        .order_by(Order.created_at, Order.id, OrderMenuItem.menu_item_id)
+        .execution_options(yield_per=batch_size)
     )
-    orders = result.scalars().all()
-
-    return [
-        {
-            "id": order.id,
-            "user_id": order.user_id,
-            "delivery_method_id": order.delivery_method_id,
-            "delivery_method_name": order.delivery_method.name,
-            "status_id": order.status_id,
-            "status_name": order.status.name,
-            "total_price": order.total_price,
-            "created_at": order.created_at,
-            "items": [
+
+    order = None
+    async for row in result:
+        if order is None or order["id"] != row.id:
+            if order is not None:
+                yield order
+            order = {
+                "id": row.id,
+                "user_id": row.user_id,
+                "delivery_method_id": row.delivery_method_id,
+                "delivery_method_name": row.delivery_method_name,
+                "status_id": row.status_id,
+                "status_name": row.status_name,
+                "total_price": row.total_price,
+                "created_at": row.created_at,
+                "items": [],
+            }
+        if row.menu_item_id is not None:
+            order["items"].append(
                 {
-                    "menu_item_id": item.id,
-                    "name": item.name,
-                    "price": item.price,
-                    "quantity": next(
-                        (
-                            omi.quantity
-                            for omi in item.order_menu_items
-                            if omi.order_id == order.id
-                        ),
-                        1,
-                    ),
+                    "menu_item_id": row.menu_item_id,
+                    "name": row.menu_item_name,
+                    "price": row.price,
+                    "quantity": row.quantity,
                 }
-                for item in order.menu_items
-            ],
-        }
-        for order in orders
-    ]
+            )
+    if order is not None:
+        yield order
 
 
 async def get_user_id_by_order_id(order_id: int, session: AsyncSession) -> int:
@@ -262,24 +589,64 @@ async def get_user_id_by_order_id(order_id: int, session: AsyncSession) -> int:
 async def update_order_status(
     order_id: int, status_id: int, session: AsyncSession
 ) -> bool:
-    order = await session.get(Order, order_id)
-    if not order:
-        return False
+    # Как и в update_orders_status: UPDATE ... FROM order_statuses
+    # не обновит заказ, если статуса нет, - без отдельных SELECT.
+    result = await session.execute(
+        update(Order)
+        .where(Order.id == order_id, OrderStatus.id == status_id)
+        .values(status_id=OrderStatus.id)
+        .returning(Order.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated = result.scalar_one_or_none() is not None
+    await session.commit()
+    return updated
+
 
-    status = await session.get(OrderStatus, status_id)
-    if not status:
-        return False
-    order.status_id = status_id
+async def update_orders_status(
+    order_ids: list[int], status_id: int, session: AsyncSession
+) -> tuple[str, list[dict]]:
+    """
+    Меняет статус сразу нескольких заказов одним UPDATE ... RETURNING.
+
+    :param order_ids: ID заказов.
+    :param status_id: ID нового статуса.
+    :param session: Сессия базы данных.
+    :return: Название статуса и обновлённые заказы (order_id, user_id).
+    """
+    # UPDATE orders SET status_id = order_statuses.id FROM order_statuses
+    # WHERE orders.id = ANY(:order_ids) AND order_statuses.id = :status_id
+    # RETURNING ...: несуществующий статус просто не даёт строк.
+    result = await session.execute(
+        update(Order)
+        .where(
+            Order.id == any_(bindparam("order_ids", order_ids, type_=ARRAY(Integer))),
+            OrderStatus.id == status_id,
+        )
+        .values(status_id=OrderStatus.id)
+        .returning(Order.id, Order.user_id, OrderStatus.name)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
     await session.commit()
-    await session.refresh(order)
-    return True
 
+    if not rows:
+        # Лишний запрос только на пути ошибки: отличаем неизвестный статус
+        # от отсутствующих заказов.
+        if await session.get(OrderStatus, status_id) is None:
+            raise ValueError("Статус заказа не найден.")
+        return "", []
+    return rows[0].name, [{"order_id": row.id, "user_id": row.user_id} for row in rows]
 
-async def delete_order(order_id: int, session: AsyncSession) -> bool:
-    order = await session.get(Order, order_id)
-    if not order:
-        return False
 
-    await session.delete(order)
+async def delete_order(order_id: int, session: AsyncSession) -> bool:
+    # Строки заказа удаляет каскадом сама база (ON DELETE CASCADE).
+    result = await session.execute(
+        delete(Order)
+        .where(Order.id == order_id)
+        .returning(Order.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await session.commit()
-    return True
+    return deleted
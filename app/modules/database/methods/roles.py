@@ -1,8 +1,12 @@
+from sqlalchemy import delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import joinedload
 
+from modules.cache import table_versions
+
+from ..errors import integrity_errors
 from ..models import Role, User
+from ..read_models import RoleRow
 
 
 async def add_role(name: str, session: AsyncSession) -> Role:
@@ -13,13 +17,11 @@ async def add_role(name: str, session: AsyncSession) -> Role:
     :param session: Сессия базы данных.
     :return: Объект новой роли.
     """
-    existing_role = await session.execute(select(Role).where(Role.name == name))
-    if existing_role.scalars().first():
-        raise ValueError("Роль с таким именем уже существует.")
-    new_role = Role(name=name)
-    session.add(new_role)
-    await session.commit()
-    await session.refresh(new_role)
+    async with integrity_errors(session):
+        result = await session.scalars(insert(Role).values(name=name).returning(Role))
+        new_role = result.one()
+        await session.commit()
+    table_versions.bump(Role.__tablename__)
     return new_role
 
 
@@ -46,15 +48,18 @@ async def update_role_name(
     :param session: Сессия базы данных.
     :return: Объект роли с обновленным именем, если найден, иначе None.
     """
-    result = await session.execute(select(Role).where(Role.id == role_id))
-    role = result.scalars().first()
-    if role:
-        existing_role = await session.execute(select(Role).where(Role.name == new_name))
-        if existing_role.scalars().first():
-            raise ValueError("Роль с таким именем уже существует.")
-        role.name = new_name
+    async with integrity_errors(session):
+        result = await session.scalars(
+            update(Role)
+            .where(Role.id == role_id)
+            .values(name=new_name)
+            .returning(Role)
+            .execution_options(synchronize_session=False)
+        )
+        role = result.one_or_none()
         await session.commit()
-        await session.refresh(role)
+    if role:
+        table_versions.bump(Role.__tablename__)
     return role
 
 
@@ -70,29 +75,27 @@ async def get_role_by_id(role_id: int, session: AsyncSession) -> Role | None:
     return result.scalars().first()
 
 
-async def get_all_roles(session: AsyncSession) -> list[Role]:
+async def get_all_roles(session: AsyncSession) -> list[RoleRow]:
     """
-    Получает все роли.
+    Получает все роли без загрузки ORM-объектов.
 
     :param session: Сессия базы данных.
     :return: Список всех ролей.
     """
-    result = await session.execute(select(Role))
-    return result.scalars().all()
+    result = await session.execute(select(Role.id, Role.name).order_by(Role.id))
+    return [RoleRow(*row) for row in result]
 
 
-async def get_users_by_role_id(role_id: int, session: AsyncSession) -> list[User]:
+async def get_users_by_role_id(role_id: int, session: AsyncSession) -> list[int]:
     """
-    Получает всех пользователей с данной ролью.
+    Получает ID всех пользователей с данной ролью.
 
     :param role_id: ID роли.
     :param session: Сессия базы данных.
-    :return: Список пользователей с данной ролью.
+    :return: Список ID пользователей с данной ролью.
     """
-    result = await session.execute(
-        select(User).options(joinedload(User.role)).where(User.role_id == role_id)
-    )
-    return [user.id for user in result.scalars().all()]
+    result = await session.execute(select(User.id).where(User.role_id == role_id))
+    return result.scalars().all()
 
 
 async def delete_role(role_id: int, session: AsyncSession) -> bool:
@@ -103,12 +106,17 @@ async def delete_role(role_id: int, session: AsyncSession) -> bool:
     :param session: Сессия базы данных.
     :return: True, если удалена, иначе False.
     """
-    result = await session.execute(select(Role).where(Role.id == role_id))
-    role = result.scalars().first()
-
-    if not role:
-        return False
-
-    await session.delete(role)
-    await session.commit()
-    return True
+    async with integrity_errors(
+        session, users_role_id_fkey="Роль назначена пользователям."
+    ):
+        result = await session.execute(
+            delete(Role)
+            .where(Role.id == role_id)
+            .returning(Role.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        await session.commit()
+    if deleted:
+        table_versions.bump(Role.__tablename__)
+    return deleted
@@ -1,8 +1,11 @@
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 
+from ..errors import integrity_errors
 from ..models import User
+from ..read_models import UserRow
 
 
 async def add_user(
@@ -20,17 +23,14 @@ async def add_user(
     :param session: Сессия базы данных.
     :return: Объект нового пользователя.
     """
-    if username:
-        existing_user = await session.execute(
-            select(User).where(User.username == username)
+    async with integrity_errors(session):
+        result = await session.scalars(
+            insert(User)
+            .values(id=tg_id, role_id=role_id, username=username)
+            .returning(User)
         )
-        if existing_user.scalars().first():
-            raise ValueError("Имя пользователя уже занято.")
-
-    new_user = User(id=tg_id, role_id=role_id, username=username)
-    session.add(new_user)
-    await session.commit()
-    await session.refresh(new_user)
+        new_user = result.one()
+        await session.commit()
     return new_user
 
 
@@ -57,22 +57,7 @@ async def update_username(
     :param session: Сессия базы данных.
     :return: Объект пользователя с обновленным именем, если найден, иначе None.
     """
-    result = await session.execute(select(User).where(User.id == tg_id))
-    user = result.scalars().first()
-
-    if not user:
-        return None
-
-    existing_user = await session.execute(
-        select(User).where(User.username == new_username)
-    )
-    if existing_user.scalars().first():
-        raise ValueError("Имя пользователя уже занято.")
-
-    user.username = new_username
-    await session.commit()
-    await session.refresh(user)
-    return user
+    return await _update_user(tg_id, session, username=new_username)
 
 
 async def change_user_role(
@@ -86,15 +71,28 @@ async def change_user_role(
     :param session: Сессия базы данных.
     :return: Объект пользователя с обновленной ролью, если найден, иначе None.
     """
-    result = await session.execute(select(User).where(User.id == tg_id))
-    user = result.scalars().first()
+    return await _update_user(tg_id, session, role_id=new_role_id)
 
-    if not user:
-        return None
 
-    user.role_id = new_role_id
-    await session.commit()
-    await session.refresh(user)
+async def _update_user(tg_id: int, session: AsyncSession, **values) -> User | None:
+    """
+    Обновляет поля пользователя одним UPDATE ... RETURNING.
+
+    :param tg_id: Telegram ID пользователя.
+    :param session: Сессия базы данных.
+    :param values: Новые значения полей.
+    :return: Обновлённый пользователь, если найден, иначе None.
+    """
+    async with integrity_errors(session):
+        result = await session.scalars(
+            update(User)
+            .where(User.id == tg_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(synchronize_session=False)
+        )
+        user = result.one_or_none()
+        await session.commit()
     return user
 
 
@@ -112,12 +110,14 @@ async def get_user_by_tg_id(tg_id: int, session: AsyncSession) -> User | None:
     return result.scalars().first()
 
 
-async def get_all_users(session: AsyncSession) -> list[User]:
+async def get_all_users(session: AsyncSession) -> list[UserRow]:
     """
-    Получает всех пользователей.
+    Получает всех пользователей без загрузки ORM-объектов.
 
     :param session: Сессия базы данных.
     :return: Список всех пользователей.
     """
-    result = await session.execute(select(User))
-    return result.scalars().all()
+    result = await session.execute(
+        select(User.id, User.username, User.role_id).order_by(User.id)
+    )
+    return [UserRow(*row) for row in result]
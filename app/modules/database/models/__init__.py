@@ -3,3 +3,4 @@ from .users import User
 from .order_statuses import OrderStatus
 from .delivery_methods import DeliveryMethod
 from .orders import OrderMenuItem, Order, MenuCategory, MenuItem
+from .seed_state import SeedState
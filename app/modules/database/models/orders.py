@@ -7,8 +7,10 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -26,6 +28,9 @@ class OrderMenuItem(Base):
     )
     quantity = Column(Integer, nullable=False)
 
+    # order_id покрыт первичным ключом (order_id, menu_item_id).
+    __table_args__ = (Index("order_menu_items_menu_item_id_idx", "menu_item_id"),)
+
     # Указываем `overlaps` для предотвращения конфликтов
     order = relationship(
         "Order", back_populates="order_menu_items", overlaps="menu_items"
@@ -50,6 +55,21 @@ class Order(Base):
     delivery_method = relationship("DeliveryMethod")
     status = relationship("OrderStatus")
 
+    # Индексы повторяют порядок выдачи страниц заказов (created_at, id);
+    # страницы от новых к старым читаются обратным обходом индекса.
+    __table_args__ = (
+        Index("orders_created_at_id_idx", "created_at", "id"),
+        Index("orders_user_id_created_at_id_idx", "user_id", "created_at", "id"),
+        Index("orders_status_id_created_at_id_idx", "status_id", "created_at", "id"),
+        # Очередь баристы: незавершённые заказы (3 - OrderStatus.COMPLETED_ID).
+        Index(
+            "orders_active_created_at_id_idx",
+            "created_at",
+            "id",
+            postgresql_where=text("status_id <> 3"),
+        ),
+    )
+
     # Указываем `overlaps` для предотвращения конфликтов
     menu_items = relationship(
         "MenuItem",
@@ -87,6 +107,10 @@ class MenuItem(Base):
     price = Column(Float, nullable=False)
     is_available = Column(Boolean, default=True, nullable=False)
 
+    __table_args__ = (
+        Index("menu_items_category_id_is_available_idx", "category_id", "is_available"),
+    )
+
     category = relationship("MenuCategory", back_populates="menu_items")
     orders = relationship(
         "Order",
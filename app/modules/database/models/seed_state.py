@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, String
+
+from modules.database.core import Base
+
+
+class SeedState(Base):
+    """Контрольная сумма применённых сидов: при совпадении сиды не применяются."""
+
+    __tablename__ = "seed_state"
+
+    name = Column(String(50), primary_key=True)
+    checksum = Column(String(64), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -6,6 +6,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     func,
 )
@@ -23,3 +24,5 @@ class User(Base):
     username = Column(VARCHAR(33), unique=True, nullable=True)
 
     role = relationship("Role")
+
+    __table_args__ = (Index("users_role_id_idx", "role_id"),)
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from modules.envs import settings
+from modules.metrics import db_pool_checkout_wait
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, измеряющий время получения соединения.
+    Ожидание свободного соединения при исчерпанном пуле видно
+    в гистограмме db_pool_checkout_wait_seconds.
+    """
+
+    def _do_get(self):
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait.observe(perf_counter() - started)
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, int | float]:
+    """
+    Состояние пула соединений движка.
+
+    :param engine: Асинхронный движок.
+    :return: Размер пула, занятые и свободные соединения, переполнение.
+    """
+    # engine.dispose() заменяет пул, поэтому он берётся при каждом вызове.
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        # Тот же лимит, что create_engine_from_settings передал пулу:
+        # у QueuePool нет публичного метода для него.
+        "max_overflow": settings.database.max_overflow,
+        "timeout": pool.timeout(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+async def check_pool_capacity(engine: AsyncEngine, workers: int) -> dict[str, int]:
+    """
+    Сравнивает наибольшее число соединений всех воркеров
+    (workers * (pool_size + max_overflow)) с лимитом сервера
+    (max_connections без резерва суперпользователя) и предупреждает
+    о превышении: иначе исчерпание лимита проявится таймаутами пула.
+
+    :param engine: Асинхронный движок.
+    :param workers: Количество процессов бэкенда.
+    :return: Требуемое и доступное число соединений.
+    """
+    pool = engine.sync_engine.pool
+    max_overflow = max(settings.database.max_overflow, 0)
+    required = workers * (pool.size() + max_overflow)
+    async with engine.connect() as connection:
+        result = await connection.exec_driver_sql(
+            "SELECT current_setting('max_connections')::int, "
+            "current_setting('superuser_reserved_connections')::int"
+        )
+        max_connections, reserved = result.one()
+    available = max_connections - reserved
+    if required > available:
+        logger.warning(
+            "Пулы %s воркеров могут открыть до %s соединений, а сервер "
+            "принимает не больше %s (max_connections=%s). Уменьшите "
+            "DB_POOL_SIZE/DB_MAX_OVERFLOW или увеличьте max_connections.",
+            workers,
+            required,
+            available,
+            max_connections,
+        )
+    return {"required": required, "available": available}
+
+
+async def warm_pool(engine: AsyncEngine, count: int) -> int:
+    """
+    Открывает `count` соединений пула одновременно и возвращает их в пул,
+    чтобы первые запросы не ждали установки соединения.
+
+    :param engine: Асинхронный движок.
+    :param count: Количество соединений, не больше размера пула.
+    :return: Количество открытых соединений.
+    """
+    count = min(count, engine.sync_engine.pool.size())
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(count)), return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    connections = [result for result in results if result not in errors]
+    try:
+        for connection in connections:
+            await connection.exec_driver_sql("SELECT 1")
+    finally:
+        await asyncio.gather(*(connection.close() for connection in connections))
+    if errors:
+        raise errors[0]
+    return len(connections)
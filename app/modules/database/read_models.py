@@ -0,0 +1,32 @@
+"""
+Модели чтения для списков: строки Core-запросов без ORM-объектов.
+
+В отличие от моделей `models`, у них нет состояния сессии, инструментации
+атрибутов и связей, а `__slots__` убирает словарь атрибутов экземпляра.
+Подходят только для чтения: изменения через них не сохраняются.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RoleRow:
+    id: int
+    name: str
+
+
+@dataclass(slots=True, frozen=True)
+class UserRow:
+    id: int
+    username: str | None
+    role_id: int
+
+
+@dataclass(slots=True, frozen=True)
+class MenuItemRow:
+    id: int
+    name: str
+    category_id: int
+    weight: float
+    price: float
+    is_available: bool
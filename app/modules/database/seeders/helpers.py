@@ -1,18 +1,93 @@
-from sqlalchemy import delete, insert, select, update
+from datetime import datetime
+import hashlib
+import json
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..models import SeedState
+
+SEED_STATE_NAME = "seeds"
+
+
+def seeds_checksum(seeds) -> str:
+    """
+    Считает контрольную сумму набора сидов.
+
+    :param seeds: Список (модель, поля, данные).
+    :return: SHA-256 в шестнадцатеричном виде.
+    """
+    payload = [(table.__tablename__, fields, values) for table, fields, values in seeds]
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def get_seeds_checksum(session: AsyncSession) -> str | None:
+    """
+    Возвращает контрольную сумму последних применённых сидов.
+
+    :param session: Сессия базы данных.
+    :return: Контрольная сумма или None, если сиды ещё не применялись.
+    """
+    result = await session.execute(
+        select(SeedState.checksum).where(SeedState.name == SEED_STATE_NAME)
+    )
+    return result.scalar()
+
+
+async def set_seeds_checksum(session: AsyncSession, checksum: str) -> None:
+    """
+    Запоминает контрольную сумму применённых сидов.
+
+    :param session: Сессия базы данных.
+    :param checksum: Контрольная сумма.
+    """
+    values = {"checksum": checksum, "applied_at": datetime.utcnow()}
+    await session.execute(
+        insert(SeedState)
+        .values(name=SEED_STATE_NAME, **values)
+        .on_conflict_do_update(index_elements=[SeedState.name], set_=values)
+    )
+
+
+async def sync_id_sequence(connection, tablename: str) -> None:
+    """
+    Сдвигает последовательность ID таблицы на текущий максимум.
+    Нужно после вставки строк с явными ID, иначе следующая обычная
+    вставка получит уже занятый ID. Для таблиц без последовательности
+    pg_get_serial_sequence вернёт NULL, и запрос ничего не сделает.
+
+    :param connection: Сессия или соединение с базой данных.
+    :param tablename: Имя таблицы.
+    """
+    await connection.execute(
+        text(
+            f"SELECT setval(pg_get_serial_sequence('{tablename}', 'id'), "
+            f"(SELECT max(id) FROM {tablename}))"
+        )
+    )
+
 
-async def fill_seed(session: AsyncSession, table, fields, values):
-    # Преобразуем значения в список словарей
-    data = [{col: row[i] for i, col in enumerate(fields)} for row in values]
+async def fill_seed(session: AsyncSession, table, fields, values) -> int:
+    """
+    Вставляет отсутствующие строки сида одним INSERT ... ON CONFLICT DO NOTHING.
 
-    for row_data in data:
-        result = await session.execute(select(table).where(table.id == row_data["id"]))
-        existing_record = result.scalars().first()
+    :param session: Сессия базы данных.
+    :param table: Модель таблицы.
+    :param fields: Названия колонок.
+    :param values: Строки сида.
+    :return: Количество вставленных строк.
+    """
+    if not values:
+        return 0
 
-        if not existing_record:
-            # Если записи нет, вставляем новую
-            await session.execute(insert(table).values(row_data))
+    data = [dict(zip(fields, row)) for row in values]
+    result = await session.execute(
+        insert(table).values(data).on_conflict_do_nothing().returning(table.id)
+    )
+    inserted = len(result.all())
 
-    # Фиксируем изменения
-    await session.commit()
+    if inserted:
+        await sync_id_sequence(session, table.__tablename__)
+    return inserted
@@ -0,0 +1,342 @@
+"""
+Генератор нагрузочных данных: пользователи, категории, позиции меню,
+заказы и их позиции в объёме, близком к боевому.
+
+Данные детерминированы зерном `--seed`: на пустой базе два запуска с
+одинаковыми параметрами дают одинаковый набор. ID продолжают текущий
+максимум таблиц, поэтому генератор можно запускать поверх сидов
+(`pdm apply-seeds` нужен заранее: заказы ссылаются на способы доставки
+и статусы из сидов). Загрузка идёт через `COPY` по соединению общего
+асинхронного движка - и для asyncpg, и для psycopg.
+
+Снимок и восстановление набора - через базу-шаблон
+(`CREATE DATABASE ... TEMPLATE ...`), это копирование файлов без
+повторной генерации. Обе операции закрывают чужие соединения с базой.
+
+Примеры:
+    pdm gen-load --users 200_000 --orders 5_000_000
+    pdm gen-load --snapshot bench_template
+    pdm gen-load --restore bench_template
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import random
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from modules.dataclasses import DeliveryMethod, OrderStatus, Role
+from modules.envs import settings
+
+from ..connect import engine
+from ..models import MenuCategory, MenuItem, Order, OrderMenuItem, User
+from .helpers import sync_id_sequence
+
+# ID пользователей Telegram меньше, сгенерированные с ними не пересекаются.
+LOAD_USER_ID_BASE = 10**12
+# Фиксированная граница вместо текущего времени: иначе набор зависел бы от даты.
+LOAD_UNTIL = datetime(2025, 1, 1)
+ITEM_NAMES = (
+    "Эспрессо",
+    "Американо",
+    "Капучино",
+    "Латте",
+    "Раф",
+    "Флэт уайт",
+    "Какао",
+    "Чай",
+    "Круассан",
+    "Чизкейк",
+    "Маффин",
+    "Сэндвич",
+)
+ITEM_WEIGHTS = (30.0, 50.0, 100.0, 150.0, 200.0, 250.0, 300.0, 400.0)
+DELIVERY_METHOD_IDS = (
+    DeliveryMethod.PICKUP_ID,
+    DeliveryMethod.COURIER_ID,
+    DeliveryMethod.IN_PLACE_ID,
+)
+
+
+async def _max_id(connection: AsyncConnection, column) -> int:
+    return (await connection.execute(select(func.max(column)))).scalar() or 0
+
+
+async def copy_rows(
+    connection: AsyncConnection, table: str, columns: list[str], rows: list[tuple]
+) -> None:
+    """
+    Загружает строки командой COPY через драйвер соединения.
+
+    :param connection: Соединение общего движка.
+    :param table: Имя таблицы.
+    :param columns: Колонки в порядке значений строк.
+    :param rows: Строки.
+    """
+    raw = await connection.get_raw_connection()
+    driver_connection = raw.driver_connection
+    if connection.dialect.driver == "asyncpg":
+        await driver_connection.copy_records_to_table(
+            table, records=rows, columns=columns
+        )
+        return
+
+    async with driver_connection.cursor() as cursor:
+        async with cursor.copy(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                await copy.write_row(row)
+
+
+async def load_orders(
+    connection: AsyncConnection,
+    rng: random.Random,
+    count: int,
+    user_ids: list[int],
+    item_prices: dict[int, float],
+    max_lines: int = 6,
+    days: int = 365,
+    batch: int = 50_000,
+) -> None:
+    """
+    Генерирует и загружает заказы с позициями пачками через COPY.
+    ID продолжают текущий максимум, последовательность сдвигается в конце.
+    Транзакцию фиксирует вызывающий код.
+
+    :param connection: Соединение общего движка.
+    :param rng: Генератор случайных чисел с заданным зерном.
+    :param count: Количество заказов.
+    :param user_ids: ID пользователей-заказчиков.
+    :param item_prices: Цены позиций меню по их ID.
+    :param max_lines: Максимум позиций в заказе.
+    :param days: Период дат создания заказов до LOAD_UNTIL.
+    :param batch: Заказов в одной пачке COPY.
+    """
+    started = time.perf_counter()
+    order_offset = await _max_id(connection, Order.id)
+    item_ids = list(item_prices)
+    max_lines = min(max_lines, len(item_ids))
+    period = timedelta(days=days).total_seconds()
+
+    for batch_start in range(0, count, batch):
+        orders, lines = [], []
+        for i in range(batch_start, min(batch_start + batch, count)):
+            order_id = order_offset + i + 1
+            # Квадрат равномерной величины: часть клиентов заказывает
+            # заметно чаще остальных.
+            user_id = user_ids[int(len(user_ids) * rng.random() ** 2)]
+            roll = rng.random()
+            if roll < 0.9:
+                status_id = OrderStatus.COMPLETED_ID
+            elif roll < 0.95:
+                status_id = OrderStatus.PROCESSING_ID
+            else:
+                status_id = OrderStatus.PENDING_ID
+
+            lines_count = min(max_lines, 1 + int(rng.expovariate(0.8)))
+            total_price = 0.0
+            for item_id in rng.sample(item_ids, lines_count):
+                roll = rng.random()
+                quantity = 1 + (roll < 0.3) + (roll < 0.1)
+                total_price += item_prices[item_id] * quantity
+                lines.append((order_id, item_id, quantity))
+
+            orders.append(
+                (
+                    order_id,
+                    user_id,
+                    rng.choice(DELIVERY_METHOD_IDS),
+                    total_price,
+                    status_id,
+                    LOAD_UNTIL - timedelta(seconds=rng.random() * period),
+                )
+            )
+
+        await copy_rows(
+            connection,
+            Order.__tablename__,
+            [
+                "id",
+                "user_id",
+                "delivery_method_id",
+                "total_price",
+                "status_id",
+                "created_at",
+            ],
+            orders,
+        )
+        await copy_rows(
+            connection,
+            OrderMenuItem.__tablename__,
+            ["order_id", "menu_item_id", "quantity"],
+            lines,
+        )
+        print(
+            f"Заказов: {batch_start + len(orders)}/{count}, "
+            f"{time.perf_counter() - started:.1f} с."
+        )
+
+    await sync_id_sequence(connection, Order.__tablename__)
+
+
+async def generate(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+
+    async with engine.connect() as connection:
+        user_offset = max(await _max_id(connection, User.id), LOAD_USER_ID_BASE)
+        category_offset = await _max_id(connection, MenuCategory.id)
+        item_offset = await _max_id(connection, MenuItem.id)
+
+        user_ids = [user_offset + i for i in range(1, args.users + 1)]
+        await copy_rows(
+            connection,
+            User.__tablename__,
+            ["id", "role_id", "username"],
+            [(user_id, Role.CLIENT_ID, f"load_{user_id}") for user_id in user_ids],
+        )
+
+        category_ids = [category_offset + i for i in range(1, args.categories + 1)]
+        await copy_rows(
+            connection,
+            MenuCategory.__tablename__,
+            ["id", "name"],
+            [(id_, f"Категория {id_}") for id_ in category_ids],
+        )
+
+        items = []
+        for i in range(1, args.items + 1):
+            item_id = item_offset + i
+            items.append(
+                (
+                    item_id,
+                    f"{rng.choice(ITEM_NAMES)} №{item_id}",
+                    rng.choice(category_ids),
+                    rng.choice(ITEM_WEIGHTS),
+                    float(rng.randrange(50, 600, 10)),
+                    rng.random() < 0.9,
+                )
+            )
+        await copy_rows(
+            connection,
+            MenuItem.__tablename__,
+            ["id", "name", "category_id", "weight", "price", "is_available"],
+            items,
+        )
+        item_prices = {item[0]: item[4] for item in items}
+        print(f"Справочники и пользователи: {time.perf_counter() - started:.1f} с.")
+
+        await load_orders(
+            connection,
+            rng,
+            args.orders,
+            user_ids,
+            item_prices,
+            max_lines=args.max_lines,
+            days=args.days,
+            batch=args.batch,
+        )
+
+        for model in (MenuCategory, MenuItem):
+            await sync_id_sequence(connection, model.__tablename__)
+        await connection.commit()
+
+        # Свежая статистика, чтобы планировщик сразу видел новый объём данных.
+        await connection.execute(text("ANALYZE"))
+        await connection.commit()
+    await engine.dispose()
+    print(f"Готово за {time.perf_counter() - started:.1f} с.")
+
+
+async def _terminate_connections(connection: AsyncConnection, database: str) -> None:
+    await connection.execute(
+        text(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE datname = :database AND pid <> pg_backend_pid()"
+        ),
+        {"database": database},
+    )
+
+
+async def copy_database(source: str, target: str) -> None:
+    """
+    Пересоздаёт базу `target` копией базы `source`.
+    Команды выполняются из служебной базы postgres вне транзакции.
+
+    :param source: База-образец.
+    :param target: Пересоздаваемая база.
+    """
+    await engine.dispose()
+    url = make_url(settings.database.link)
+    maintenance = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+    try:
+        async with maintenance.connect() as connection:
+            quote = connection.dialect.identifier_preparer.quote
+            # CREATE DATABASE ... TEMPLATE требует, чтобы к образцу
+            # никто не был подключён.
+            await _terminate_connections(connection, source)
+            await _terminate_connections(connection, target)
+            await connection.execute(text(f"DROP DATABASE IF EXISTS {quote(target)}"))
+            await connection.execute(
+                text(f"CREATE DATABASE {quote(target)} TEMPLATE {quote(source)}")
+            )
+    finally:
+        await maintenance.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Генератор нагрузочных данных.")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=10)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument(
+        "--max-lines", type=int, default=6, help="Максимум позиций в заказе."
+    )
+    parser.add_argument(
+        "--days", type=int, default=365, help="Период дат создания заказов."
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--batch", type=int, default=50_000, help="Заказов в одной пачке COPY."
+    )
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument(
+        "--snapshot",
+        metavar="TEMPLATE",
+        help="Сохранить текущую базу в базу-шаблон вместо генерации.",
+    )
+    action.add_argument(
+        "--restore",
+        metavar="TEMPLATE",
+        help="Восстановить текущую базу из базы-шаблона вместо генерации.",
+    )
+    args = parser.parse_args()
+    if min(args.users, args.items, args.categories, args.max_lines) < 1:
+        parser.error("--users, --items, --categories и --max-lines должны быть > 0.")
+    return args
+
+
+async def main() -> None:
+    args = parse_args()
+    database = make_url(settings.database.link).database
+    if args.snapshot:
+        await copy_database(database, args.snapshot)
+        print(f"Снимок {database} сохранён в {args.snapshot}.")
+    elif args.restore:
+        await copy_database(args.restore, database)
+        print(f"База {database} восстановлена из {args.restore}.")
+    else:
+        await generate(args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
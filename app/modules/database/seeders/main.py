@@ -2,13 +2,23 @@ import asyncio
 
 from ..connect import async_session
 from .all_seeds import all_seeds
-from .helpers import fill_seed
+from .helpers import fill_seed, get_seeds_checksum, seeds_checksum, set_seeds_checksum
 
 
 async def main():
-    for model, field, data in all_seeds:
-        async with async_session() as session:
-            await fill_seed(session, model, field, data)
+    checksum = seeds_checksum(all_seeds)
+    async with async_session() as session:
+        # Быстрый путь при перезапуске контейнера: сиды не менялись - один запрос.
+        if await get_seeds_checksum(session) == checksum:
+            print("Сиды уже применены.")
+            return
+
+        # Все таблицы - в одной транзакции, по одному INSERT на таблицу.
+        for model, fields, data in all_seeds:
+            inserted = await fill_seed(session, model, fields, data)
+            print(f"{model.__tablename__}: добавлено строк - {inserted}.")
+        await set_seeds_checksum(session, checksum)
+        await session.commit()
 
 
 if __name__ == "__main__":
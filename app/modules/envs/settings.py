@@ -1,15 +1,43 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-from aiogram import Bot as AioBot
 from environs import Env
 
+if TYPE_CHECKING:
+    from aiogram import Bot as AioBot
+
+# Короткие имена драйверов для DB_ENGINE.
+DB_DRIVERS = {
+    "asyncpg": "postgresql+asyncpg",
+    "psycopg": "postgresql+psycopg",
+}
+
 
 @dataclass
 class Bot:
-    bot: AioBot
+    token: str | None
     admin_id: int
     admin_username: str
     backend_url: str
+    backend_timeout: float
+    backend_max_connections: int
+    backend_keepalive_expiry: float
+    backend_retries: int
+    role_cache_ttl: float
+    role_cache_size: int
+
+    @cached_property
+    def bot(self) -> "AioBot":
+        """
+        Объект бота aiogram. Создаётся при первом обращении, поэтому
+        бэкенду и сидам не нужны ни aiogram, ни TOKEN.
+        """
+        from aiogram import Bot as AioBot
+
+        if not self.token:
+            raise RuntimeError("Не задан TOKEN бота.")
+        return AioBot(self.token)
 
 
 @dataclass
@@ -20,37 +48,115 @@ class Database:
     mame: str
     host: str
     echo: bool
+    stats_sample_rate: float
+    n_plus_one_threshold: int
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    pool_warmup: int
     link: str = None
 
+    def __post_init__(self):
+        if self.link is None:
+            self.link = self.make_link()
+
+    def make_link(self, engine: str | None = None) -> str:
+        """
+        Строка подключения к базе данных.
+
+        :param engine: Драйвер вместо DB_ENGINE: короткое имя или схема SQLAlchemy.
+        :return: URL базы данных.
+        """
+        engine = DB_DRIVERS.get(engine, engine) if engine else self.engine
+        return f"{engine}://{self.user}:{self.pswd}@{self.host}/{self.mame}"
+
 
 @dataclass
-class Config:
-    bot: Bot
-    database: Database
+class Backend:
+    cache_ttl: float
+    workers: int
+    max_requests: int
+    graceful_timeout: float
+    fast_json: bool
+    gzip_min_size: int
+    orders_json_agg: bool
 
 
-def get_settings():
-    env_var = Env()
-    env_var.read_env()
+class Config:
+    """
+    Настройки приложения. Каждый раздел читается из окружения при первом
+    обращении: бэкенду не нужны переменные бота, а боту - базы данных.
+    """
+
+    def __init__(self, env_var: Env):
+        self._env = env_var
 
-    return Config(
-        bot=Bot(
-            bot=AioBot(env_var.str("TOKEN")),
+    @cached_property
+    def bot(self) -> Bot:
+        env_var = self._env
+        return Bot(
+            token=env_var.str("TOKEN", None),
             admin_id=env_var.int("ADMIN_ID"),
             admin_username=env_var.str("ADMIN_USERNAME"),
             backend_url=env_var.str("BACKEND_URL"),
-        ),
-        database=Database(
-            engine=env_var.str("DB_ENGINE"),
+            backend_timeout=env_var.float("BACKEND_TIMEOUT", 10.0),
+            backend_max_connections=env_var.int("BACKEND_MAX_CONNECTIONS", 20),
+            # Должно быть меньше keep-alive таймаута uvicorn (5 секунд),
+            # иначе клиент может взять уже закрытое сервером соединение.
+            backend_keepalive_expiry=env_var.float("BACKEND_KEEPALIVE_EXPIRY", 4.0),
+            backend_retries=env_var.int("BACKEND_RETRIES", 3),
+            role_cache_ttl=env_var.float("ROLE_CACHE_TTL", 60.0),
+            role_cache_size=env_var.int("ROLE_CACHE_SIZE", 10_000),
+        )
+
+    @cached_property
+    def database(self) -> Database:
+        env_var = self._env
+        db_engine = env_var.str("DB_ENGINE")
+        return Database(
+            engine=DB_DRIVERS.get(db_engine, db_engine),
             user=env_var.str("DB_USER"),
             pswd=env_var.str("DB_PSWD"),
             mame=env_var.str("DB_DB"),
             host=env_var.str("DB_HOST"),
-            echo=env_var.bool("DB_ECHO"),
-        ),
-    )
+            echo=env_var.bool("DB_ECHO", False),
+            # Доля запросов, SQL которых попадает в сводную статистику.
+            stats_sample_rate=env_var.float("DB_STATS_SAMPLE_RATE", 0.01),
+            n_plus_one_threshold=env_var.int("DB_N_PLUS_ONE_THRESHOLD", 10),
+            # Размер пула - на один процесс: при нескольких воркерах
+            # к базе открывается до workers * (pool_size + max_overflow) соединений.
+            pool_size=env_var.int("DB_POOL_SIZE", 20),
+            max_overflow=env_var.int("DB_MAX_OVERFLOW", 10),
+            pool_timeout=env_var.float("DB_POOL_TIMEOUT", 30.0),
+            pool_recycle=env_var.int("DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=env_var.bool("DB_POOL_PRE_PING", False),
+            # Соединения, открываемые при запуске воркера.
+            pool_warmup=env_var.int("DB_POOL_WARMUP", 5),
+        )
+
+    @cached_property
+    def backend(self) -> Backend:
+        env_var = self._env
+        return Backend(
+            cache_ttl=env_var.float("CACHE_TTL", 30.0),
+            # Та же переменная, что читает uvicorn.
+            workers=env_var.int("WEB_CONCURRENCY", 1),
+            # Перезапуск воркера после стольких запросов, 0 - без перезапуска.
+            max_requests=env_var.int("BACKEND_MAX_REQUESTS", 0),
+            graceful_timeout=env_var.float("BACKEND_GRACEFUL_TIMEOUT", 30.0),
+            fast_json=env_var.bool("BACKEND_FAST_JSON", True),
+            # Ответы меньше этого размера не сжимаются, 0 - без сжатия.
+            gzip_min_size=env_var.int("BACKEND_GZIP_MIN_SIZE", 1024),
+            orders_json_agg=env_var.bool("BACKEND_ORDERS_JSON_AGG", False),
+        )
+
+
+def get_settings() -> Config:
+    env_var = Env()
+    env_var.read_env()
+    return Config(env_var)
 
 
 settings = get_settings()
-sdb = settings.database
-settings.database.link = f"{sdb.engine}://{sdb.user}:{sdb.pswd}@{sdb.host}/{sdb.mame}"
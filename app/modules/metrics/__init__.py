@@ -0,0 +1,39 @@
+from .registry import (
+    CallbackCounter,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    registry,
+)
+
+http_requests = registry.register(
+    Counter(
+        "http_requests",
+        "Обработанные HTTP-запросы.",
+        ("method", "route", "status"),
+    )
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Время обработки HTTP-запроса по шаблону маршрута.",
+        ("method", "route"),
+    )
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP-запросы в обработке.")
+)
+db_pool_checkout_wait = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Время получения соединения из пула, включая установку нового.",
+    )
+)
+orders_created = registry.register(
+    Counter(
+        "orders_created",
+        "Созданные заказы по способу доставки.",
+        ("delivery_method",),
+    )
+)
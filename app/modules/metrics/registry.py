@@ -0,0 +1,178 @@
+"""
+Минимальный реестр метрик в текстовом формате Prometheus (0.0.4).
+Без внешних зависимостей; рассчитан на один процесс с циклом asyncio.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+Labels = tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        """
+        Отсчёты метрики: (суффикс имени, метки, значение).
+        """
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield "_total", _format_labels(self.labelnames, labels), value
+
+
+class Gauge(Metric):
+    """
+    Текущее значение. Если передан `callback`, значения берутся из него
+    при каждом рендере: {значения меток: значение}.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        callback: Callable[[], dict[Labels, float]] | None = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def samples(self):
+        values = self.callback() if self.callback else self._values
+        for labels, value in values.items():
+            yield "", _format_labels(self.labelnames, labels), value
+
+
+class CallbackCounter(Gauge):
+    """Счётчик, значения которого ведёт другой объект (например, кэш)."""
+
+    type_name = "counter"
+
+    def samples(self):
+        for suffix, labels, value in super().samples():
+            yield "_total", labels, value
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Метки -> [счётчики корзин (не накопительные), сумма, количество].
+        self._values: dict[Labels, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def samples(self):
+        names = self.labelnames + ("le",)
+        for labels, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                yield "_bucket", _format_labels(names, labels + (le,)), cumulative
+            yield "_sum", _format_labels(self.labelnames, labels), total
+            yield "_count", _format_labels(self.labelnames, labels), count
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Метрика {metric.name} уже зарегистрирована.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Все метрики в текстовом формате Prometheus.
+        """
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = Registry()